@@ -1,18 +1,24 @@
+import json
 import os
 import sys
 import tempfile
+import time
 import streamlit as st
 from dotenv import load_dotenv
-import re
 
 # Load environment variables
 load_dotenv()
 
-# Add src to sys.path for importing crew
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "src")))
+# Add src to sys.path for importing crew; Streamlit re-runs this script on
+# every interaction, so only the first run of the process appends it
+SRC_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), "src"))
+if SRC_PATH not in sys.path:
+    sys.path.append(SRC_PATH)
 
 try:
-    from fact_checker.crew import FactChecker
+    from fact_checker import ingest, jobs, metrics, progress
+    from fact_checker.verification import VerificationRun
+    from fact_checker.transcript_store import extract_video_id, get_transcript_store
 except ImportError as e:
     st.error(f"Could not import FactChecker: {e}")
     st.stop()
@@ -575,6 +581,7 @@ st.markdown("<br>", unsafe_allow_html=True)
 
 user_input = ""
 claim, url, youtube_url, uploaded_file = "", "", "", None
+bypass_cache = False
 
 # Input forms based on selected mode
 if mode == "📝 Text Claim":
@@ -585,6 +592,10 @@ if mode == "📝 Text Claim":
         placeholder="Enter the statement or claim you want to fact-check...",
         key="claim_input"
     )
+    bypass_cache = st.checkbox(
+        "Force fresh verification (ignore previously verified results)",
+        key="bypass_cache"
+    )
     user_input = claim
 
 elif mode == "🌐 Website URL":
@@ -604,7 +615,10 @@ elif mode == "📺 YouTube Video":
         key="youtube_input"
     )
     if youtube_url:
-        if re.search(r'(?:youtube\.com/watch\?v=|youtu\.be/)([^&\n?#]+)', youtube_url):
+        video_id = extract_video_id(youtube_url)
+        if video_id and video_id in get_transcript_store():
+            st.success("✅ Valid YouTube URL detected - transcript already available")
+        elif video_id:
             st.success("✅ Valid YouTube URL detected")
         else:
             st.warning("⚠️ Please enter a valid YouTube URL")
@@ -631,7 +645,27 @@ with col2:
         key="analyze_btn"
     )
 
-# Analysis execution
+# Verdict banners keyed by the aggregate verdict of a run
+VERDICT_BANNERS = {
+    "TRUE": ("verdict-true", "✅ VERDICT: THE PROVIDED INFORMATION IS TRUE"),
+    "FALSE": ("verdict-false", "❌ VERDICT: THE PROVIDED INFORMATION IS FALSE"),
+    "MISLEADING": ("verdict-partial", "⚠️ VERDICT: THE PROVIDED INFORMATION IS PARTIALLY ACCURATE"),
+    "UNCERTAIN": ("verdict-inconclusive", "🔍 VERDICT: REQUIRES FURTHER INVESTIGATION"),
+    "UNVERIFIABLE": ("verdict-inconclusive", "🔍 VERDICT: COULD NOT BE VERIFIED"),
+}
+
+# Background workers: started once per server process and kept warm
+@st.cache_resource(show_spinner=False)
+def start_job_workers():
+    pool = jobs.WorkerPool()
+    pool.start()
+    return pool
+
+
+if os.getenv("FACT_CHECKER_EMBEDDED_WORKERS", "1") != "0":
+    start_job_workers().ensure_running()
+
+# Analysis submission: the run itself happens on a background worker
 if analyze_button:
     # Input validation
     has_input = bool(claim or url or youtube_url or uploaded_file)
@@ -639,58 +673,81 @@ if analyze_button:
     if not has_input:
         st.error("⚠️ **Input Required:** Please provide content to analyze before starting the verification process.")
         st.stop()
-    
-    # Processing indicator
-    with st.spinner("🔍 **VERIFACT Analysis in Progress** - Our AI agents are researching, analyzing, and verifying your content..."):
-        input_content = ""
-
-        # File processing
-        if uploaded_file:
-            from pathlib import Path
-            suffix = Path(uploaded_file.name).suffix.lower()
-            try:
-                if suffix == ".pdf":
-                    import PyPDF2
-                    reader = PyPDF2.PdfReader(uploaded_file)
-                    input_content = "".join([page.extract_text() for page in reader.pages])
-                elif suffix == ".docx":
-                    from docx import Document
-                    doc = Document(uploaded_file)
-                    input_content = "\n".join([p.text for p in doc.paragraphs])
-                elif suffix == ".txt":
-                    raw = uploaded_file.read()
-                    for enc in ["utf-8", "utf-16", "latin-1", "cp1252"]:
-                        try:
-                            input_content = raw.decode(enc)
-                            break
-                        except UnicodeDecodeError:
-                            continue
-                    else:
-                        st.error("❌ **File Processing Error:** Unable to decode text file. Please ensure UTF-8 encoding.")
-                        st.stop()
-                else:
-                    st.error("❌ **Unsupported Format:** Please upload a PDF, Word document, or text file.")
-                    st.stop()
-            except Exception as e:
-                st.error(f"❌ **File Processing Error:** {e}")
-                st.stop()
-        else:
-            input_content = claim or url or youtube_url
-
-        # Run analysis
-        try:
-            progress = st.progress(0, text="Initializing VERIFACT system...")
-            progress.progress(20, text="Loading AI agents...")
-            checker = FactChecker()
-            progress.progress(60, text="Executing multi-agent analysis...")
-            result = checker.crew().kickoff(inputs={"input_content": input_content})
-            progress.progress(100, text="Analysis complete!")
-        except Exception as e:
-            st.error(f"❌ **Analysis Error:** {e}")
+
+    request = {"input_content": claim or url or youtube_url,
+               "kind": "claim" if claim else "url" if url else "youtube"}
+    if uploaded_file:
+        from pathlib import Path
+        suffix = Path(uploaded_file.name).suffix.lower()
+        if suffix not in ingest.SUPPORTED_SUFFIXES:
+            st.error("❌ **Unsupported Format:** Please upload a PDF, Word document, or text file.")
             st.stop()
+        with metrics.span("ingest", "upload_save", bytes=uploaded_file.size):
+            document_path = jobs.save_upload(uploaded_file.name, uploaded_file.getvalue())
+        request = {
+            "input_content": f"Document: {uploaded_file.name}",
+            "kind": "document",
+            "document_path": document_path,
+            "suffix": suffix,
+        }
+    elif claim:
+        request.update(claim=claim, bypass_cache=bypass_cache)
 
-    # Success notification
-    st.balloons()
+    job_id = jobs.get_job_queue().submit(request)
+    st.session_state["job_id"] = job_id
+    st.query_params["job"] = job_id
+
+# Analysis status: survives reruns and page refreshes through the job ID
+job_id = st.session_state.get("job_id") or st.query_params.get("job")
+job = jobs.get_job_queue().get(job_id) if job_id else None
+
+if job is not None and job.pending:
+    if job.status == "queued":
+        st.info("⏳ **Analysis Queued** - Waiting for a free VERIFACT worker...")
+    else:
+        events = [event for _, event in jobs.get_job_queue().events(job.id)]
+        current = next((e for e in reversed(events) if e.kind in ("stage", "task_started", "tool_started")), None)
+        status_text = f"{current.stage}: {current.label}" if current else "Starting VERIFACT agents..."
+        st.progress(progress.fraction_done(events), text=status_text)
+
+        # Partial findings, shown as soon as each one is available
+        findings = [e for e in events if e.kind == "finding"]
+        if findings:
+            st.markdown("### 🧩 Findings So Far")
+            for event in findings:
+                with st.expander(f"**{event.stage}** - {event.label}"):
+                    st.markdown(event.detail)
+
+        activity = [e for e in events if e.kind not in ("finding", "stage")]
+        if activity:
+            with st.expander("🔍 **Live Agent Activity**"):
+                for event in activity[-20:]:
+                    verb = {
+                        "task_started": "started", "task_completed": "finished", "task_failed": "failed",
+                        "tool_started": "is using", "tool_finished": "finished using", "tool_error": "failed using",
+                    }[event.kind]
+                    st.markdown(f"- **{event.stage}** {verb} {event.label}")
+
+elif job is not None and job.status == "failed":
+    if job.error_type in ("IngestError", "ExtractionTimeout"):
+        st.error(f"❌ **File Processing Error:** {job.error}")
+    else:
+        st.error(f"❌ **Analysis Error:** {job.error}")
+        # Tasks that completed before the failure are checkpointed, so a retry resumes after them
+        if st.button("🔁 Retry Analysis", key="retry_btn"):
+            retry_id = jobs.get_job_queue().submit(dict(job.request, resume=True, attempts=1))
+            st.session_state["job_id"] = retry_id
+            st.query_params["job"] = retry_id
+            st.rerun()
+
+elif job is not None:
+    result = job.result
+    input_content = job.request["input_content"]
+
+    # Success notification, celebrated once per job
+    if st.session_state.get("celebrated_job") != job.id:
+        st.session_state["celebrated_job"] = job.id
+        st.balloons()
     st.success("🎉 **Analysis Complete** - Professional verification report generated successfully")
 
     # Results section
@@ -698,37 +755,41 @@ if analyze_button:
     <div class="results-section">
     """, unsafe_allow_html=True)
 
-    # Verdict analysis and display
-    result_text = str(result)
-    result_lower = result_text.lower()
+    # Verdict display, straight from the structured run
+    run = VerificationRun.from_dict(result["run"])
+    result_text = run.report
 
     st.markdown("### 📊 Verification Result")
-    
-    # Determine verdict
-    if "true" in result_lower and "false" not in result_lower:
-        st.markdown("""
-        <div class="verdict-container verdict-true">
-            ✅ VERDICT: THE PROVIDED INFORMATION IS TRUE
-        </div>
-        """, unsafe_allow_html=True)
-    elif "false" in result_lower:
-        st.markdown("""
-        <div class="verdict-container verdict-false">
-            ❌ VERDICT: THE PROVIDED INFORMATION IS FALSE
-        </div>
-        """, unsafe_allow_html=True)
-    elif "misleading" in result_lower or "partially" in result_lower:
-        st.markdown("""
-        <div class="verdict-container verdict-partial">
-            ⚠️ VERDICT: THE PROVIDED INFORMATION IS PARTIALLY ACCURATE
-        </div>
-        """, unsafe_allow_html=True)
-    elif "INCONCLUSIVE" in result_lower:
-        st.markdown("""
-        <div class="verdict-container verdict-inconclusive">
-            🔍 VERDICT: REQUIRES FURTHER INVESTIGATION
+    stored = result.get("stored")
+    if stored:
+        age_minutes = int((job.finished_at - stored["stored_at"]) // 60)
+        if stored["similarity"] < 1:
+            st.info(
+                f"♻️ A closely matching claim (\"{stored['claim']}\", {stored['similarity']:.0%} similar) "
+                f"was verified {age_minutes} minutes ago - showing the stored result."
+            )
+        else:
+            st.info(f"♻️ This claim was verified {age_minutes} minutes ago - showing the stored result.")
+    
+    overall = run.verdict
+    if overall is not None:
+        css_class, banner = VERDICT_BANNERS[overall.verdict]
+        st.markdown(f"""
+        <div class="verdict-container {css_class}">
+            {banner} ({overall.confidence:.0%} CONFIDENCE)
         </div>
         """, unsafe_allow_html=True)
+
+        # Per-claim verdicts
+        st.table([
+            {
+                "Claim": r.claim["text"],
+                "Verdict": r.verdict.verdict if r.verdict else "ERROR",
+                "Confidence": f"{r.verdict.confidence:.0%}" if r.verdict else "-",
+                "Sources": len(r.verdict.evidence) if r.verdict else 0,
+            }
+            for r in run.results
+        ])
     else:
         st.markdown("""
         <div class="verdict-container verdict-inconclusive">
@@ -741,11 +802,27 @@ if analyze_button:
     with st.expander("**Click to view detailed verification report**", expanded=True):
         st.markdown(result_text)
 
+    web_stats = result.get("web_cache")
+    if web_stats:
+        st.caption(
+            f"Web cache: {web_stats['hits']} hits, {web_stats['misses']} misses, "
+            f"{web_stats['revalidations']} revalidated, {web_stats['entries']} pages stored"
+        )
+
+    trace = result.get("trace")
+    if trace:
+        timings = ", ".join(f"{kind} {seconds:.1f}s" for kind, seconds in trace["seconds_by_kind"].items())
+        st.caption(
+            f"Run time {trace['wall_seconds']:.1f}s ({timings or 'no spans recorded'}); "
+            f"tokens {trace['tokens']['prompt']} in / {trace['tokens']['completion']} out; "
+            f"{trace['retries']} tool retries"
+        )
+
     st.markdown("</div>", unsafe_allow_html=True)
 
     # Download options
     st.markdown("### 📥 Export Options")
-    col1, col2 = st.columns(2)
+    col1, col2, col3 = st.columns(3)
 
     with col1:
         # Text report
@@ -788,6 +865,17 @@ if analyze_button:
             use_container_width=True
         )
 
+    with col3:
+        # Structured verdicts
+        st.download_button(
+            "🧾 Download as JSON",
+            json.dumps(dict(result["run"], input_content=input_content,
+                            verdict=overall._asdict() if overall else None), indent=2),
+            "verifact_verdicts.json",
+            mime="application/json",
+            use_container_width=True
+        )
+
 # Simple Professional Footer - Fixed Copyright Display
 # Simple Professional Footer - Fixed Copyright Display
 st.markdown("""
@@ -815,4 +903,9 @@ st.markdown("""
     
     © 2025 RAMANA SOFT - All Rights Reserved
 </div>
-""", unsafe_allow_html=True)
\ No newline at end of file
+""", unsafe_allow_html=True)
+
+# Keep polling while the job is queued or running
+if job is not None and job.pending:
+    time.sleep(jobs.POLL_INTERVAL)
+    st.rerun()
\ No newline at end of file
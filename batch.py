@@ -0,0 +1,180 @@
+import asyncio
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterator, NamedTuple
+
+from . import metrics
+from .verdict_store import StoredVerdict
+
+BATCH_CONCURRENCY = int(os.getenv("FACT_CHECKER_BATCH_CONCURRENCY", 8))
+
+INPUT_FIELDS = ("claim", "url", "input_content", "input", "text")
+
+
+class BatchItem(NamedTuple):
+    id: str
+    request: dict
+
+
+def _request(value: str, field: str = "input_content") -> dict:
+    value = value.strip()
+    if field == "url" or value.startswith(("http://", "https://")):
+        return {"input_content": value, "kind": "url"}
+    return {"input_content": value, "kind": "claim", "claim": value}
+
+
+def _item(record, line_no) -> BatchItem:
+    if isinstance(record, str):
+        return BatchItem(f"line-{line_no}", _request(record))
+    field = next((f for f in INPUT_FIELDS if record.get(f)), None)
+    if field is None:
+        raise ValueError(f"expected one of {', '.join(INPUT_FIELDS)}")
+    return BatchItem(str(record.get("id") or f"line-{line_no}"), _request(str(record[field]), field))
+
+
+def read_items(path) -> Iterator[BatchItem]:
+    """Yield batch items from a JSONL or CSV file, lazily.
+
+    JSONL lines are objects with a ``claim``, ``url``, ``input_content``,
+    ``input`` or ``text`` field and an optional ``id``, or bare JSON strings.
+    CSV files need a header row with the same column names. Items without an
+    ``id`` are identified by their line number. Malformed lines are reported
+    on stderr and skipped rather than stopping a long run.
+    """
+    path = Path(path)
+    with open(path, newline="", encoding="utf-8") as f:
+        if path.suffix.lower() == ".csv":
+            records = enumerate(csv.DictReader(f), start=2)
+        else:
+            records = ((line_no, line) for line_no, line in enumerate(f, start=1) if line.strip())
+        for line_no, record in records:
+            try:
+                yield _item(record if isinstance(record, dict) else json.loads(record), line_no)
+            except (ValueError, AttributeError) as e:
+                print(f"Skipping line {line_no}: {e}", file=sys.stderr)
+
+
+def completed_ids(output_path) -> set:
+    """IDs that already have a successful result line in ``output_path``."""
+    done = set()
+    if not os.path.exists(output_path):
+        return done
+    with open(output_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # a line cut short by a crash
+            if record.get("status") == "ok":
+                done.add(record["id"])
+    return done
+
+
+class BatchSummary():
+    """Throughput counters for a batch run."""
+
+    def __init__(self):
+        self.skipped = 0
+        self.ok = 0
+        self.errors = 0
+        self.reused = 0
+        self.latencies = []
+        self.started = time.monotonic()
+
+    def record(self, line: dict):
+        self.latencies.append(line["seconds"])
+        if line["status"] == "ok":
+            self.ok += 1
+            self.reused += "stored" in line
+        else:
+            self.errors += 1
+
+    def __str__(self):
+        elapsed = time.monotonic() - self.started
+        done = self.ok + self.errors
+        latencies = sorted(self.latencies) or [0.0]
+        return (
+            f"Processed {done} items in {elapsed:.1f}s ({done / elapsed * 60 if elapsed else 0:.1f}/min): "
+            f"{self.ok} ok ({self.reused} from stored verdicts), {self.errors} failed, "
+            f"{self.skipped} skipped as already done. "
+            f"Latency p50 {latencies[len(latencies) // 2]:.1f}s, p95 {latencies[int(len(latencies) * 0.95)]:.1f}s"
+        )
+
+
+async def _process(item, bypass_cache):
+    from . import pipeline
+
+    request = dict(item.request, bypass_cache=bypass_cache)
+    started = time.monotonic()
+    line = {"id": item.id, "input": request["input_content"]}
+    try:
+        with metrics.run_trace(item.id, request) as trace:
+            result = await pipeline.run_request_async(request)
+    except Exception as e:
+        line.update(status="error", error=f"{type(e).__name__}: {e}")
+    else:
+        run = result.run if isinstance(result, StoredVerdict) else result
+        line.update(status="ok", verdict=run.verdict._asdict() if run.verdict else None, **run.to_dict())
+        if isinstance(result, StoredVerdict):
+            line["stored"] = {"claim": result.claim, "similarity": result.similarity, "stored_at": result.stored_at}
+        if trace is not None:
+            line["trace"] = trace.summary()
+    line["seconds"] = round(time.monotonic() - started, 3)
+    return line
+
+
+async def run_batch(items, output_path, concurrency: int = BATCH_CONCURRENCY,
+                    resume: bool = True, bypass_cache: bool = False) -> BatchSummary:
+    """Fact-check ``items`` with at most ``concurrency`` in flight.
+
+    Each result is appended to ``output_path`` as one JSON line as soon as it
+    finishes, so an interrupted run loses nothing already written. With
+    ``resume``, items whose ID already has an ``ok`` line are skipped; failed
+    items are retried and their new line supersedes the old one.
+    """
+    done = completed_ids(output_path) if resume else set()
+    summary = BatchSummary()
+    items = iter(items)
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=concurrency))
+
+    with open(output_path, "a" if resume else "w", encoding="utf-8") as out:
+        async def worker():
+            for item in items:
+                if item.id in done:
+                    summary.skipped += 1
+                    continue
+                line = await _process(item, bypass_cache)
+                out.write(json.dumps(line) + "\n")
+                out.flush()
+                summary.record(line)
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summary
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="batch", description="Fact-check claims and URLs from a JSONL or CSV file.")
+    parser.add_argument("input", help="JSONL or CSV file of claims and URLs")
+    parser.add_argument("-o", "--output", help="JSONL results file (default: <input>.results.jsonl)")
+    parser.add_argument("-c", "--concurrency", type=int, default=BATCH_CONCURRENCY)
+    parser.add_argument("--no-resume", action="store_true", help="overwrite the results file instead of resuming")
+    parser.add_argument("--bypass-cache", action="store_true", help="re-verify claims that have a stored verdict")
+    args = parser.parse_args(argv)
+
+    output = args.output or str(Path(args.input).with_suffix(".results.jsonl"))
+    summary = asyncio.run(run_batch(
+        read_items(args.input), output, concurrency=args.concurrency,
+        resume=not args.no_resume, bypass_cache=args.bypass_cache,
+    ))
+    print(summary, file=sys.stderr)
+    metrics.write_textfile()
+    print(f"Results written to {output}", file=sys.stderr)
+    return summary
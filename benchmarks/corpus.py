@@ -0,0 +1,138 @@
+"""Synthetic documents for the offline benchmarks."""
+import io
+import random
+
+_WORDS = (
+    "the tower was completed in 1889 and stands 330 metres tall according to official records "
+    "population grew by 12 percent over the decade while unemployment fell to 4 percent "
+    "researchers reported that the vaccine reduced hospital admissions by half in trials "
+    "the river flows for 6650 kilometres through eleven countries before reaching the sea"
+).split()
+
+
+def sentences(count: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    out = []
+    for _ in range(count):
+        words = rng.choices(_WORDS, k=rng.randint(8, 20))
+        out.append(" ".join(words).capitalize() + ".")
+    return out
+
+
+def make_pdf(pages: int, lines_per_page: int = 40, seed: int = 0) -> bytes:
+    """Build a plain-text PDF with ``pages`` pages of Helvetica text."""
+    lines = iter(sentences(pages * lines_per_page, seed))
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None,
+               b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for _ in range(pages):
+        text = [b"BT /F1 9 Tf 40 800 Td 11 TL"]
+        for _ in range(lines_per_page):
+            line = next(lines)[:110].replace("(", "").replace(")", "")
+            text.append(b"(" + line.encode("latin-1") + b") Tj T*")
+        text.append(b"ET")
+        stream = b"\n".join(text)
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        content_id = len(objects)
+        objects.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+                       b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_id)
+        kids.append(len(objects))
+    objects[1] = (b"<< /Type /Pages /Count %d /Kids [" % pages
+                  + b" ".join(b"%d 0 R" % k for k in kids) + b"] >>")
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n" % number + body + b"\nendobj\n")
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for offset in offsets:
+        out.write(b"%010d 00000 n \n" % offset)
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+    return out.getvalue()
+
+
+def make_docx(paragraphs: int, seed: int = 0) -> bytes:
+    """Build a minimal DOCX with ``paragraphs`` body paragraphs."""
+    import zipfile
+    from xml.sax.saxutils import escape
+
+    body = "".join(f"<w:p><w:r><w:t>{escape(s)}</w:t></w:r></w:p>" for s in sentences(paragraphs, seed))
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f"<w:body>{body}</w:body></w:document>"
+    )
+    out = io.BytesIO()
+    with zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml", (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/word/document.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+            "</Types>"
+        ))
+        archive.writestr("_rels/.rels", (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+            '<Relationship Id="rId1" '
+            'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+            'Target="word/document.xml"/></Relationships>'
+        ))
+        archive.writestr("word/document.xml", document)
+    return out.getvalue()
+
+
+def make_news_page(paragraphs: int = 30, seed: int = 0, webforms: bool = False) -> str:
+    """A news article page with the boilerplate of a real site.
+
+    Scripts, styles, navigation, a cookie banner, inline ads, related links,
+    comments and a footer surround ``paragraphs`` paragraphs of article text.
+    ``webforms`` lays the page out like an ASP.NET WebForms site: everything
+    inside one ``<form>``, and the article in a ``post-body share-enabled``
+    div rather than ``<main><article>``.
+    """
+    rng = random.Random(seed)
+    text = sentences(paragraphs * 3 + 40, seed)
+
+    def links(count, prefix):
+        return "".join(f"<li><a href='/{prefix}/{i}'>{' '.join(rng.choices(_WORDS, k=3)).title()}</a></li>"
+                       for i in range(count))
+
+    script = "window.__STATE__ = %s;" % ([{"id": i, "headline": s} for i, s in enumerate(text[:20])],)
+    body = []
+    for i in range(paragraphs):
+        body.append("<p>" + " ".join(text[i * 3:i * 3 + 3]) + "</p>")
+        if i % 6 == 5:
+            body.append("<div class='ad-slot'><span>Advertisement</span><a href='/ads/%d'>Sponsored offer</a></div>" % i)
+    comments = "".join(
+        f"<div class='comment'><b>reader{i}</b><p>{text[paragraphs * 3 + i]}</p></div>" for i in range(20)
+    )
+    return (
+        "<!DOCTYPE html><html lang='en'><head><meta charset='utf-8'>"
+        f"<title>{text[0][:60]} | Stub News</title>"
+        f"<meta property='og:title' content='{text[0][:60]}'>"
+        "<meta name='author' content='Jane Reporter'>"
+        f"<meta property='article:published_time' content='2024-03-{seed % 28 + 1:02d}T08:00:00Z'>"
+        + "".join(f"<script>{script}</script><style>.c{i}{{margin:{i}px;color:#{i:06x}}}</style>" for i in range(8))
+        + "</head><body>"
+        + ("<form id='aspnetForm' method='post' action='./story.aspx'>" if webforms else "")
+        + "<div id='cookie-banner'>We use cookies to improve your experience. <button>Accept</button></div>"
+        f"<header class='masthead'><a href='/'>Stub News</a><nav><ul>{links(60, 'section')}</ul></nav></header>"
+        + ("<div class='layout'><div class='post-body share-enabled'>" if webforms else "<div class='layout'><main><article>")
+        + f"<h1>{text[0][:60]}</h1><p class='byline'>By Jane Reporter, <time datetime='2024-03-01'>March 1</time></p>"
+        + "".join(body)
+        + "<div class='share-tools'><a href='/share/fb'>Share</a><a href='/share/x'>Post</a></div>"
+        + ("</div>" if webforms else "</article>")
+        + f"<section class='related'><h2>Related</h2><ul>{links(12, 'story')}</ul></section>"
+        f"<section id='comments'><h2>Comments</h2>{comments}</section>"
+        + ("" if webforms else "</main>")
+        + f"<aside class='sidebar'><h2>Most read</h2><ol>{links(10, 'popular')}</ol></aside></div>"
+        f"<footer><ul>{links(80, 'about')}</ul><p>Copyright Stub News. All rights reserved.</p></footer>"
+        + ("</form>" if webforms else "")
+        + "</body></html>"
+    )
@@ -0,0 +1,55 @@
+"""Measure the per-request cost of building a FactChecker crew.
+
+Compares constructing a new ``FactChecker().crew()`` for every request with
+taking a copy from the warm, process-wide ``CrewFactory``.
+
+    python -m fact_checker.benchmarks.crew_construction [iterations]
+"""
+import statistics
+import sys
+import time
+
+from dotenv import load_dotenv
+
+from fact_checker.crew import FactChecker
+from fact_checker.factory import CrewFactory
+
+
+def _time(fn, iterations):
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def _report(label, samples):
+    print(f"{label:<28} mean {statistics.mean(samples):8.2f} ms   "
+          f"median {statistics.median(samples):8.2f} ms   "
+          f"max {max(samples):8.2f} ms")
+
+
+def main():
+    load_dotenv()
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    cold = _time(lambda: FactChecker().crew(), iterations)
+
+    factory = CrewFactory()
+    start = time.perf_counter()
+    factory.crew()
+    warmup_ms = (time.perf_counter() - start) * 1000
+    warm = _time(factory.crew, iterations)
+
+    print(f"Crew construction over {iterations} requests")
+    _report("FactChecker().crew()", cold)
+    _report("CrewFactory.crew() (warm)", warm)
+    print(f"{'one-off factory warm-up':<28} {warmup_ms:8.2f} ms")
+    saved = statistics.mean(cold) - statistics.mean(warm)
+    print(f"Saved per request: {saved:.2f} ms "
+          f"({saved / statistics.mean(cold) * 100:.0f}%)")
+
+
+if __name__ == "__main__":
+    main()
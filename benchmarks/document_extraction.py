@@ -0,0 +1,41 @@
+"""Compare single-threaded and process-pool document text extraction.
+
+Generates 50, 200 and 1000 page PDFs (and DOCX files of a similar size) and
+times extraction on the calling thread against ``fact_checker.extraction``.
+
+    python -m fact_checker.benchmarks.document_extraction [pages ...]
+"""
+import io
+import sys
+import time
+
+from fact_checker import extraction
+from fact_checker.benchmarks.corpus import make_docx, make_pdf
+from fact_checker.ingest import iter_docx_paragraphs, iter_pdf_pages
+
+
+def _time(fn):
+    start = time.perf_counter()
+    text = fn()
+    return time.perf_counter() - start, len(text)
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [50, 200, 1000]
+    # Start the pool once so worker spawn time is not charged to the first document
+    extraction.extract_document(make_pdf(1), ".pdf")
+
+    print(f"Process pool: {extraction.EXTRACT_PROCESSES} workers")
+    print(f"{'document':<16}{'single (s)':>12}{'pooled (s)':>12}{'speedup':>10}{'chars':>12}")
+    for pages in sizes:
+        for label, data, single, suffix in (
+            (f"pdf {pages}p", make_pdf(pages), iter_pdf_pages, ".pdf"),
+            (f"docx ~{pages}p", make_docx(pages * 40), iter_docx_paragraphs, ".docx"),
+        ):
+            single_s, chars = _time(lambda: "".join(single(io.BytesIO(data))))
+            pooled_s, _ = _time(lambda: extraction.extract_document(data, suffix))
+            print(f"{label:<16}{single_s:>12.2f}{pooled_s:>12.2f}{single_s / pooled_s:>9.1f}x{chars:>12}")
+
+
+if __name__ == "__main__":
+    main()
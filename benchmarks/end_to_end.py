@@ -0,0 +1,190 @@
+"""Offline end-to-end throughput and latency of the fact-checking pipeline.
+
+Runs a mixed corpus through the batch runner at several concurrency levels:
+text claims, HTML page URLs, YouTube URLs and generated PDFs. The LLM,
+Serper and scraped pages are served by ``benchmarks.stubs`` in a separate
+process. YouTube transcripts come from a pre-seeded TranscriptStore, since
+the transcript client has no endpoint override. Each level runs in a fresh
+process with an empty cache directory, so levels do not warm each other
+and peak RSS is measured per level.
+
+    python -m fact_checker.benchmarks.end_to_end [--levels 1 4 16] [--requests 40]
+        [--llm-latency 0.05] [--json results.json] [--baseline results.json]
+
+With ``--baseline``, the run fails (exit status 1) when p95 latency or
+requests/sec at any level is more than ``--tolerance`` worse than in the
+baseline file, for use as a release gate.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import queue
+import resource
+import sys
+import tempfile
+import time
+
+from fact_checker.benchmarks import stubs
+from fact_checker.benchmarks.corpus import make_pdf, sentences
+
+KINDS = ("claim", "page", "youtube", "pdf")
+
+
+def _video_id(i):
+    return f"stub{i:07d}"[-11:]
+
+
+def workload(count: int, base_url: str, doc_dir: str, seed: int = 0) -> list:
+    """``count`` batch items cycling through the input kinds."""
+    from fact_checker.batch import BatchItem
+
+    claims = iter(sentences(count, seed=seed))
+    items = []
+    for i in range(count):
+        kind = KINDS[i % len(KINDS)]
+        if kind == "claim":
+            text = next(claims)
+            request = {"input_content": text, "kind": "claim", "claim": text}
+        elif kind == "page":
+            request = {"input_content": f"{base_url}/page/{(seed * count + i) % stubs.PAGES}", "kind": "url"}
+        elif kind == "youtube":
+            request = {"input_content": f"https://www.youtube.com/watch?v={_video_id(i)}", "kind": "youtube"}
+        else:
+            path = os.path.join(doc_dir, f"doc{i}.pdf")
+            with open(path, "wb") as f:
+                f.write(make_pdf(3, seed=seed + i))
+            request = {"input_content": f"Document: doc{i}.pdf", "kind": "document", "document_path": path,
+                       "suffix": ".pdf"}
+        items.append(BatchItem(f"{kind}-{i}", request))
+    return items
+
+
+def _environment(base_url, cache_dir):
+    return {
+        "FACT_CHECKER_CACHE_DIR": cache_dir,
+        "MODEL": "gpt-4o-mini",
+        "OPENAI_API_KEY": "stub",
+        "OPENAI_API_BASE": f"{base_url}/v1",
+        "OPENAI_BASE_URL": f"{base_url}/v1",
+        "SERPER_API_KEY": "stub",
+        "SERPER_BASE_URL": base_url,
+        "LITELLM_LOCAL_MODEL_COST_MAP": "True",
+        "CREWAI_DISABLE_TELEMETRY": "true",
+        # Suppresses crewAI's first-run trace upload and its interactive prompt
+        "CREWAI_TESTING": "true",
+        "OTEL_SDK_DISABLED": "true",
+        "NO_PROXY": "127.0.0.1,localhost",
+        # Every stub endpoint shares one host; per-host politeness would measure itself
+        "FACT_CHECKER_HOST_RATE": "0",
+    }
+
+
+def _run_level(level, count, base_url, results):
+    """Child process body: run one concurrency level against a cold cache."""
+    import asyncio
+
+    with tempfile.TemporaryDirectory() as cache_dir, tempfile.TemporaryDirectory() as doc_dir:
+        os.environ.update(_environment(base_url, cache_dir))
+        from fact_checker.batch import run_batch
+        from fact_checker.factory import get_factory
+        from fact_checker.transcript_store import get_transcript_store
+
+        factory = get_factory()
+        for name in ('analysis_crew', 'routed_analysis_crew', 'claim_extraction_crew', 'claim_verification_crew'):
+            factory.crew(name)
+        items = workload(count, base_url, doc_dir, seed=level)
+        store = get_transcript_store()
+        for i, item in enumerate(items):
+            if item.id.startswith("youtube"):
+                store.save(_video_id(i), " ".join(sentences(60, seed=i)))
+
+        started = time.perf_counter()
+        summary = asyncio.run(run_batch(items, os.path.join(cache_dir, "results.jsonl"),
+                                        concurrency=level, resume=False))
+        elapsed = time.perf_counter() - started
+
+    latencies = sorted(summary.latencies) or [0.0]
+    rss_kb = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                 resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    results.put({
+        "concurrency": level,
+        "requests": count,
+        "ok": summary.ok,
+        "errors": summary.errors,
+        "p50": latencies[len(latencies) // 2],
+        "p95": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+        "rps": count / elapsed if elapsed else 0.0,
+        "peak_rss_mb": rss_kb / 1024,
+    })
+
+
+def regressions(results, baseline, tolerance) -> list:
+    """Levels with more errors, or a p95 or throughput more than ``tolerance`` worse, than ``baseline``."""
+    previous = {row["concurrency"]: row for row in baseline}
+    failures = []
+    for row in results:
+        old = previous.get(row["concurrency"])
+        if old is None:
+            continue
+        if row["errors"] > old["errors"]:
+            failures.append(f"c={row['concurrency']}: {row['errors']} errors vs {old['errors']}")
+        if row["p95"] > old["p95"] * (1 + tolerance):
+            failures.append(f"c={row['concurrency']}: p95 {row['p95']:.2f}s vs {old['p95']:.2f}s")
+        if row["rps"] < old["rps"] * (1 - tolerance):
+            failures.append(f"c={row['concurrency']}: {row['rps']:.2f} req/s vs {old['rps']:.2f} req/s")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--requests", type=int, default=40, help="requests per concurrency level")
+    parser.add_argument("--llm-latency", type=float, default=0.05, help="seconds the stub LLM waits per call")
+    parser.add_argument("--web-latency", type=float, default=0.01, help="seconds stub pages and search wait")
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--baseline", help="fail on regressions against this results file")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    ports = context.Queue()
+    server = context.Process(target=stubs.serve, args=(ports, args.llm_latency, args.web_latency), daemon=True)
+    server.start()
+    base_url = f"http://127.0.0.1:{ports.get(timeout=30)}"
+
+    rows = []
+    print(f"{'concurrency':>11}{'requests':>10}{'errors':>8}{'p50 (s)':>9}{'p95 (s)':>9}{'req/s':>8}{'peak RSS':>11}")
+    try:
+        for level in args.levels:
+            results = context.Queue()
+            child = context.Process(target=_run_level, args=(level, args.requests, base_url, results))
+            child.start()
+            while True:
+                try:
+                    row = results.get(timeout=1)
+                    break
+                except queue.Empty:
+                    if not child.is_alive():
+                        raise RuntimeError(f"Benchmark process for concurrency {level} exited with {child.exitcode}")
+            child.join()
+            rows.append(row)
+            print(f"{row['concurrency']:>11}{row['requests']:>10}{row['errors']:>8}{row['p50']:>9.2f}"
+                  f"{row['p95']:>9.2f}{row['rps']:>8.2f}{row['peak_rss_mb']:>8.0f} MB")
+    finally:
+        server.terminate()
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(rows, f, indent=2)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            failures = regressions(rows, json.load(f), args.tolerance)
+        for failure in failures:
+            print(f"REGRESSION {failure}", file=sys.stderr)
+        if failures:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
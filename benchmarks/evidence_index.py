@@ -0,0 +1,58 @@
+"""Build rate and query latency of the BM25 evidence index.
+
+Indexes synthetic articles into a fresh index directory, then times queries
+made from sentences of indexed and unseen articles. Segment reads are
+bounded by TOP_POSTINGS per term, so query latency should stay flat as
+``--articles`` grows.
+
+    python -m fact_checker.benchmarks.evidence_index [--articles 20000] [--queries 200]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from fact_checker.benchmarks.corpus import sentences
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--articles", type=int, default=20000)
+    parser.add_argument("--sentences", type=int, default=24, help="sentences per article")
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        os.environ["FACT_CHECKER_CACHE_DIR"] = directory
+        from fact_checker.evidence_index import EvidenceIndex
+
+        index = EvidenceIndex(os.path.join(directory, "evidence"), os.path.join(directory, "evidence.sqlite3"))
+        started = time.perf_counter()
+        for i in range(args.articles):
+            index.add(f"https://example.org/article/{i}", " ".join(sentences(args.sentences, seed=i)))
+        index.flush()
+        elapsed = time.perf_counter() - started
+        passages = len(index)
+        size = sum(entry.stat().st_size for entry in os.scandir(os.path.join(directory, "evidence")))
+        print(f"indexed {args.articles} articles as {passages} passages in {elapsed:.1f}s "
+              f"({passages / elapsed:.0f} passages/s), {len(index._segments)} segments, "
+              f"{size / passages:.0f} bytes of postings per passage")
+
+        rng = random.Random(1)
+        queries = [sentences(1, seed=rng.randrange(args.articles * 2))[0] for _ in range(args.queries)]
+        latencies = []
+        covered = 0
+        for query in queries:
+            started = time.perf_counter()
+            results = index.search(query)
+            latencies.append(time.perf_counter() - started)
+            covered += bool(results) and results[0].coverage >= 0.6
+        latencies.sort()
+        print(f"{args.queries} queries: p50 {latencies[len(latencies) // 2] * 1000:.1f} ms, "
+              f"p95 {latencies[int(len(latencies) * 0.95)] * 1000:.1f} ms, "
+              f"{covered / args.queries:.0%} answered locally")
+
+
+if __name__ == "__main__":
+    main()
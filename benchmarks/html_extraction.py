@@ -0,0 +1,99 @@
+"""CPU time and output size of HTML-to-text extraction.
+
+Compares the main-content extractor in ``html_text`` against the parse it
+replaced, BeautifulSoup ``get_text()`` as used by the WebScrapingTool, and
+against an lxml tree without scripts and styles. Sizes are relative to the
+BeautifulSoup output, and ``lost`` counts pages a parser returned no text
+for although BeautifulSoup found some. Without bs4 installed the lxml full
+text is the baseline. Pages come from a directory of saved ``.html`` files,
+or are generated with ``corpus.make_news_page``, every other one in its
+WebForms layout.
+
+    python -m fact_checker.benchmarks.html_extraction [--pages saved_pages/] [--count 50] [--repeat 3]
+"""
+import argparse
+import time
+from pathlib import Path
+
+from lxml import etree, html
+
+from fact_checker.benchmarks.corpus import make_news_page
+from fact_checker.html_text import extract
+
+
+def _soup_text(markup):
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(markup, "lxml")
+    for element in soup(["script", "style"]):
+        element.decompose()
+    return soup.get_text("\n", strip=True)
+
+
+def _lxml_text(markup):
+    root = html.fromstring(markup)
+    etree.strip_elements(root, "script", "style", "noscript", with_tail=False)
+    lines = (" ".join(text.split()) for text in root.itertext())
+    return "\n".join(line for line in lines if line)
+
+
+def _main_content(markup):
+    return extract(markup).text
+
+
+def parsers() -> dict:
+    found = {}
+    try:
+        import bs4  # noqa: F401
+        found["bs4 get_text"] = _soup_text
+    except ImportError:
+        pass
+    found["lxml full text"] = _lxml_text
+    found["main content"] = _main_content
+    return found
+
+
+def load_pages(directory, count) -> list:
+    if directory:
+        return [path.read_text(encoding="utf-8", errors="replace") for path in sorted(Path(directory).glob("*.htm*"))]
+    return [make_news_page(30, seed=i, webforms=bool(i % 2)) for i in range(count)]
+
+
+def measure(parse, pages, repeat) -> dict:
+    texts = [parse(page) for page in pages]
+    started = time.process_time()
+    for _ in range(repeat):
+        for page in pages:
+            parse(page)
+    cpu = time.process_time() - started
+    return {"cpu_ms": cpu * 1000 / (repeat * len(pages)), "chars": sum(map(len, texts)) / len(pages),
+            "texts": texts}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", help="directory of saved .html pages")
+    parser.add_argument("--count", type=int, default=50, help="generated pages when --pages is not given")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    pages = load_pages(args.pages, args.count)
+    if not pages:
+        parser.error(f"no .html files in {args.pages}")
+    html_kb = sum(len(page) for page in pages) / len(pages) / 1024
+    print(f"{len(pages)} pages, {html_kb:.0f} KB of HTML each on average")
+    found = parsers()
+    if "bs4 get_text" not in found:
+        print("bs4 is not installed; sizes are relative to lxml full text instead")
+    print(f"{'parser':<16}{'CPU ms/page':>12}{'chars/page':>12}{'~tokens':>9}{'size':>8}{'lost':>6}")
+    baseline = None
+    for name, parse in found.items():
+        row = measure(parse, pages, args.repeat)
+        baseline = baseline or row
+        lost = sum(1 for text, base in zip(row["texts"], baseline["texts"]) if base and not text)
+        print(f"{name:<16}{row['cpu_ms']:>12.2f}{row['chars']:>12.0f}{row['chars'] / 4:>9.0f}"
+              f"{row['chars'] / baseline['chars']:>8.0%}{lost:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Scrape latency under concurrent load: per-request connections vs the shared HTTP client.
+
+Fetches stub article pages from ``benchmarks.stubs`` on a thread pool, the
+way crew tools call the fetch layer. The baseline opens a new connection for
+every request with ``requests``; the pooled run goes through
+``http_client.get_http_client()`` and reuses keep-alive connections.
+
+    python -m fact_checker.benchmarks.http_fetch [--requests 400] [--concurrency 16] [--latency 0.005]
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from fact_checker.benchmarks import stubs
+
+
+def _timed(fetch, url):
+    started = time.perf_counter()
+    fetch(url)
+    return time.perf_counter() - started
+
+
+def _per_request(url):
+    response = requests.get(url, headers={"User-Agent": "Verifact Bot 1.0"}, timeout=15)
+    response.raise_for_status()
+    return response.text
+
+
+def _pooled(url):
+    from fact_checker.http_client import get_http_client
+
+    response = get_http_client().get(url)
+    if not response.ok:
+        raise RuntimeError(f"HTTP {response.status_code}")
+    return response.text
+
+
+def measure(fetch, urls, concurrency) -> dict:
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        latencies = sorted(pool.map(lambda url: _timed(fetch, url), urls))
+    elapsed = time.perf_counter() - started
+    return {
+        "total": elapsed,
+        "p50": latencies[len(latencies) // 2],
+        "p95": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+        "rps": len(urls) / elapsed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--latency", type=float, default=0.005, help="seconds the stub waits per page")
+    args = parser.parse_args()
+    # Measure the connection layer, not the per-host rate limit
+    os.environ.setdefault("FACT_CHECKER_HOST_RATE", "0")
+
+    server = stubs.start(web_latency=args.latency)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    urls = [f"{base_url}/page/{i % stubs.PAGES}" for i in range(args.requests)]
+    # Warm both paths so neither pays import or client start-up inside the timing
+    _per_request(urls[0])
+    _pooled(urls[0])
+
+    print(f"{'fetch layer':<14}{'total (s)':>10}{'p50 (ms)':>10}{'p95 (ms)':>10}{'req/s':>9}")
+    for name, fetch in (("per-request", _per_request), ("pooled", _pooled)):
+        row = measure(fetch, urls, args.concurrency)
+        print(f"{name:<14}{row['total']:>10.2f}{row['p50'] * 1000:>10.1f}{row['p95'] * 1000:>10.1f}{row['rps']:>9.0f}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
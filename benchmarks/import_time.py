@@ -0,0 +1,68 @@
+"""Cold import time of the modules the UI, the workers and the crew load.
+
+Imports each module in a fresh interpreter under ``python -X importtime``
+and reports the median cumulative import time, plus which heavy
+dependencies it pulled in. The UI's imports should not load crewai,
+crewai_tools or the document parsers; those belong to the first crew run
+or the first uploaded document.
+
+    python -m fact_checker.benchmarks.import_time [--runs 5]
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+TARGETS = {
+    "app imports": ["fact_checker.ingest", "fact_checker.jobs", "fact_checker.metrics", "fact_checker.progress",
+                    "fact_checker.verification", "fact_checker.transcript_store"],
+    "pipeline": ["fact_checker.pipeline"],
+    "tool registry": ["fact_checker.tool_registry"],
+    "crew": ["fact_checker.crew"],
+}
+HEAVY = ("crewai", "crewai_tools", "litellm", "lxml", "httpx", "PyPDF2", "docx")
+
+
+def importtime(modules) -> tuple:
+    """Total import time in ms of ``modules`` in a fresh interpreter, and the heavy packages it loaded."""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {', '.join(modules)}"],
+                            capture_output=True, text=True)
+    if result.returncode:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    total = 0
+    loaded = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        if not name.startswith("  "):
+            total += int(cumulative)
+        name = name.strip()
+        if name in HEAVY:
+            loaded[name] = int(cumulative) / 1000
+    return total / 1000, loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'target':<16}{'median ms':>11}{'min ms':>9}   heavy dependencies loaded (ms)")
+    for label, modules in TARGETS.items():
+        samples = []
+        loaded = {}
+        for _ in range(args.runs):
+            total, run_loaded = importtime(modules)
+            samples.append(total)
+            for name, ms in run_loaded.items():
+                loaded.setdefault(name, []).append(ms)
+        heavy = ", ".join(f"{name} {statistics.median(ms):.0f}"
+                          for name, ms in sorted(loaded.items(), key=lambda i: -max(i[1]))) or "none"
+        print(f"{label:<16}{statistics.median(samples):>11.0f}{min(samples):>9.0f}   {heavy}")
+
+
+if __name__ == "__main__":
+    main()
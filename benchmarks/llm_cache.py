@@ -0,0 +1,66 @@
+"""Cold vs warm crew runs with the LLM response cache, against the stub LLM.
+
+Runs the same claim verification crew repeatedly against ``benchmarks.stubs``
+with a simulated model latency. The first run fills the cache and the
+following runs should be served from it without reaching the endpoint.
+
+    python -m fact_checker.benchmarks.llm_cache [--claims 4] [--llm-latency 0.5]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from fact_checker.benchmarks import stubs
+from fact_checker.benchmarks.corpus import sentences
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--claims", type=int, default=4)
+    parser.add_argument("--runs", type=int, default=2)
+    parser.add_argument("--llm-latency", type=float, default=0.5, help="seconds the stub LLM waits per call")
+    args = parser.parse_args()
+
+    server = stubs.start(llm_latency=args.llm_latency)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    with tempfile.TemporaryDirectory() as cache_dir:
+        os.environ.update({
+            "FACT_CHECKER_CACHE_DIR": cache_dir,
+            "MODEL": "gpt-4o-mini",
+            "OPENAI_API_KEY": "stub",
+            "OPENAI_API_BASE": f"{base_url}/v1",
+            "OPENAI_BASE_URL": f"{base_url}/v1",
+            "LITELLM_LOCAL_MODEL_COST_MAP": "True",
+            "CREWAI_DISABLE_TELEMETRY": "true",
+            "CREWAI_TESTING": "true",
+            "OTEL_SDK_DISABLED": "true",
+            "NO_PROXY": "127.0.0.1,localhost",
+        })
+        from crewai import Agent, Crew, Task
+
+        from fact_checker.llm_cache import cached_llm, get_llm_cache
+        from fact_checker.verdicts import ClaimVerdict
+
+        verifier = Agent(role="Fact verifier", goal="Verify claims", backstory="A careful fact checker.",
+                         llm=cached_llm(), verbose=False)
+        task = Task(description="Verify the claim.\n\nClaim ID: {claim_id}\nClaim: {claim_text}",
+                    expected_output="A verdict for claim {claim_id}.", agent=verifier, output_pydantic=ClaimVerdict)
+        crew = Crew(agents=[verifier], tasks=[task], verbose=False)
+        claims = sentences(args.claims, seed=7)
+
+        print(f"{'run':<6}{'seconds':>9}{'cache hits':>12}{'misses':>8}")
+        for run in range(1, args.runs + 1):
+            before = get_llm_cache().stats()
+            started = time.perf_counter()
+            verdicts = [crew.kickoff(inputs={"claim_id": f"claim_{i:03d}", "claim_text": claim}).pydantic.verdict
+                        for i, claim in enumerate(claims, 1)]
+            elapsed = time.perf_counter() - started
+            after = get_llm_cache().stats()
+            print(f"{run:<6}{elapsed:>9.2f}{after['hits'] - before['hits']:>12}{after['misses'] - before['misses']:>8}"
+                  f"   {' '.join(verdicts)}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
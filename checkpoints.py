@@ -0,0 +1,108 @@
+import contextvars
+import hashlib
+import json
+import os
+import sqlite3
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Optional
+
+from .storage import SqliteCache, singleton
+
+if TYPE_CHECKING:
+    from crewai.tasks.task_output import TaskOutput
+
+# Completed task outputs are kept so a retried or resumed run skips them;
+# other runs save checkpoints but never restore them
+CHECKPOINTS_ENABLED = os.getenv("FACT_CHECKER_CHECKPOINTS", "1") != "0"
+CHECKPOINT_TTL_HOURS = float(os.getenv("FACT_CHECKER_CHECKPOINT_TTL_HOURS", 24))
+CHECKPOINT_MAX_MB = float(os.getenv("FACT_CHECKER_CHECKPOINT_MB", 64))
+# Share of free pages in the store file above which compaction rewrites it
+COMPACT_FREE_RATIO = 0.25
+
+_resume = contextvars.ContextVar("fact_checker_resume", default=False)
+
+
+def checkpoint_key(inputs, task, agent, context: str) -> str:
+    """Checkpoint key of ``task`` run by ``agent`` on ``inputs`` with ``context``.
+
+    The context is the output of the tasks it depends on, so a task whose
+    upstream tasks were re-run with a different result is re-run as well.
+    """
+    value = {
+        "inputs": inputs or {},
+        "task": task.name or "",
+        "description": task.description,
+        "expected_output": task.expected_output,
+        "agent": getattr(agent, "role", None),
+        "model": getattr(getattr(agent, "llm", None), "model", None),
+        "context": context or "",
+    }
+    return hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def resuming() -> bool:
+    """Whether task runs in this context may be served from checkpoints."""
+    return _resume.get()
+
+
+@contextmanager
+def resumed_run():
+    """Restore checkpointed tasks in this context, for a retry or a requeue of a job that did not finish."""
+    token = _resume.set(True)
+    try:
+        yield
+    finally:
+        _resume.reset(token)
+
+
+class CheckpointStore(SqliteCache):
+    """Outputs of completed crew tasks keyed by checkpoint_key(), with a TTL and LRU size cap."""
+
+    def __init__(self, ttl=CHECKPOINT_TTL_HOURS * 3600, max_bytes=int(CHECKPOINT_MAX_MB * 1024 * 1024), path=None):
+        super().__init__("checkpoints", ttl=ttl, max_bytes=max_bytes, path=path)
+
+    def load(self, key: str, task) -> Optional["TaskOutput"]:
+        # Imported here so the job queue can use resumed_run() without loading crewai
+        from crewai.tasks.task_output import TaskOutput
+
+        entry = self.get(key)
+        if entry is None:
+            return None
+        data = json.loads(entry.value)
+        # TaskOutput types ``pydantic`` as a bare BaseModel, so it is rebuilt from the task's model
+        structured = data.pop("pydantic", None)
+        if structured is not None and task.output_pydantic is not None:
+            data["pydantic"] = task.output_pydantic.model_validate(structured)
+        return TaskOutput.model_validate(data)
+
+    def save(self, key: str, task, output: "TaskOutput"):
+        data = output.model_dump(mode="json", exclude={"pydantic"})
+        data["pydantic"] = output.pydantic.model_dump(mode="json") if output.pydantic is not None else None
+        self.set(key, json.dumps(data), {"task": task.name or ""})
+
+    def compact(self) -> int:
+        """Drop expired checkpoints and return the file's free pages to the OS once they pile up.
+
+        Returns the number of checkpoints removed.
+        """
+        removed = self.purge_expired()
+        with self._lock:
+            pages = self._conn.execute("PRAGMA page_count").fetchone()[0]
+            free = self._conn.execute("PRAGMA freelist_count").fetchone()[0]
+            if pages and free / pages > COMPACT_FREE_RATIO:
+                try:
+                    self._conn.execute("VACUUM")
+                    # In WAL mode the rewritten pages only reach the main file on a checkpoint
+                    self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                except sqlite3.OperationalError:
+                    # Another process is reading the store; the next one to open it compacts
+                    pass
+        return removed
+
+
+@singleton
+def get_checkpoint_store() -> CheckpointStore:
+    """Return the CheckpointStore shared by the whole process, compacted when first opened."""
+    store = CheckpointStore()
+    store.compact()
+    return store
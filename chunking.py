@@ -0,0 +1,122 @@
+import os
+import re
+from functools import lru_cache
+from typing import Iterable, Iterator, NamedTuple
+
+CHUNK_TOKENS = int(os.getenv("FACT_CHECKER_CHUNK_TOKENS", 1500))
+CHUNK_OVERLAP_TOKENS = int(os.getenv("FACT_CHECKER_CHUNK_OVERLAP_TOKENS", 100))
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])[\"')\]”’]*\s+|\n\s*\n")
+
+
+@lru_cache(maxsize=None)
+def _encoding():
+    try:
+        import tiktoken
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+
+def count_tokens(text: str) -> int:
+    """Token count with tiktoken when available, else a 4-characters-per-token estimate."""
+    encoding = _encoding()
+    if encoding is not None:
+        return len(encoding.encode(text, disallowed_special=()))
+    return -(-len(text) // 4)
+
+
+def split_sentences(text: str) -> list:
+    """Split on sentence-ending punctuation and blank lines, keeping the delimiters."""
+    sentences = []
+    start = 0
+    for match in _SENTENCE_END.finditer(text):
+        sentences.append(text[start:match.end()])
+        start = match.end()
+    if start < len(text):
+        sentences.append(text[start:])
+    return [s for s in sentences if s.strip()]
+
+
+class Chunk(NamedTuple):
+    index: int
+    text: str
+    tokens: int
+
+
+def _pieces(sentence, max_tokens):
+    """Split a sentence that is over budget on its own at word boundaries."""
+    piece = []
+    size = 0
+    for word in sentence.split(" "):
+        tokens = count_tokens(word + " ")
+        if piece and size + tokens > max_tokens:
+            yield " ".join(piece) + " "
+            piece, size = [], 0
+        piece.append(word)
+        size += tokens
+    if piece:
+        yield " ".join(piece)
+
+
+def chunk_sentences(sentences: Iterable[str], max_tokens: int = CHUNK_TOKENS,
+                    overlap_tokens: int = CHUNK_OVERLAP_TOKENS) -> Iterator[Chunk]:
+    """Pack sentences into chunks of at most ``max_tokens`` tokens.
+
+    Chunks end on sentence boundaries, and each chunk repeats trailing
+    sentences of the previous one, up to ``overlap_tokens``, so a claim that
+    straddles a boundary is still seen whole.
+    """
+    buffer = []
+    size = 0
+    index = 0
+    for sentence in sentences:
+        tokens = count_tokens(sentence)
+        parts = [(sentence, tokens)] if tokens <= max_tokens else [
+            (piece, count_tokens(piece)) for piece in _pieces(sentence, max_tokens)
+        ]
+        for text, tokens in parts:
+            if buffer and size + tokens > max_tokens:
+                yield Chunk(index, "".join(t for t, _ in buffer), size)
+                index += 1
+                overlap = []
+                carried = 0
+                for item in reversed(buffer):
+                    if carried + item[1] > overlap_tokens or carried + item[1] + tokens > max_tokens:
+                        break
+                    overlap.insert(0, item)
+                    carried += item[1]
+                buffer, size = overlap, carried
+            buffer.append((text, tokens))
+            size += tokens
+    if buffer:
+        yield Chunk(index, "".join(t for t, _ in buffer), size)
+
+
+def chunk_text(text: str, max_tokens: int = CHUNK_TOKENS, overlap_tokens: int = CHUNK_OVERLAP_TOKENS) -> Iterator[Chunk]:
+    return chunk_sentences(split_sentences(text), max_tokens, overlap_tokens)
+
+
+def chunk_stream(segments: Iterable[str], max_tokens: int = CHUNK_TOKENS,
+                 overlap_tokens: int = CHUNK_OVERLAP_TOKENS) -> Iterator[Chunk]:
+    """Chunk text arriving in segments, such as PDF pages, without joining them all.
+
+    The unfinished last sentence of each segment is carried into the next one,
+    joined with a newline so words at the segment boundary stay apart, unless
+    it grows past what a chunk could hold (text without punctuation).
+    """
+    def sentences():
+        carry = ""
+        for segment in segments:
+            parts = split_sentences(f"{carry}\n{segment}" if carry else segment)
+            if not parts:
+                continue
+            carry = parts.pop()
+            yield from parts
+            if len(carry) > max_tokens * 8:
+                yield carry
+                carry = ""
+        if carry.strip():
+            yield carry
+
+    return chunk_sentences(sentences(), max_tokens, overlap_tokens)
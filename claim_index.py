@@ -0,0 +1,264 @@
+import functools
+import hashlib
+import operator
+import os
+import re
+import struct
+import threading
+import unicodedata
+from array import array
+from typing import NamedTuple
+
+from .storage import cache_path, connect, singleton
+from .verdict_store import claim_fingerprint, normalize_claim
+
+NEAR_DUPLICATE_THRESHOLD = float(os.getenv("FACT_CHECKER_NEAR_DUPLICATE_THRESHOLD", 0.5))
+# Word-order similarity a candidate needs before its stored verdict is reused
+DUPLICATE_THRESHOLD = float(os.getenv("FACT_CHECKER_DUPLICATE_THRESHOLD", 0.8))
+
+NUM_BANDS = 18
+ROWS_PER_BAND = 4
+NUM_PERM = NUM_BANDS * ROWS_PER_BAND
+# Recorded as the database's user_version; buckets written under another layout are rebuilt
+_LAYOUT = NUM_BANDS * 100 + ROWS_PER_BAND
+# Candidates sharing the most bands with a query that are scored on their full signatures
+MAX_CANDIDATES = 16
+
+_PRIME = (1 << 61) - 1
+_PERMUTATIONS = [
+    (int.from_bytes(hashlib.blake2b(b"a%d" % i, digest_size=8).digest(), "big") % (_PRIME - 1) + 1,
+     int.from_bytes(hashlib.blake2b(b"b%d" % i, digest_size=8).digest(), "big") % _PRIME)
+    for i in range(NUM_PERM)
+]
+
+STOPWORDS = frozenset("""
+    a an the is are was were be been being am of in on at to for from by with as and or that this
+    these those it its there their they which who whom what when where has have had do
+    does did than then so very about over into
+""".split())
+_NEGATIONS = frozenset({"not", "no", "never", "none", "nobody", "nothing", "neither", "nor", "without"})
+# Verbs that only link a subject to a measurement or place, like "is"
+_COPULAS = frozenset({"stand", "stands", "stood", "measure", "measures", "measured", "lies", "lie", "lay",
+                      "sits", "sit", "sat", "remains", "remain", "remained"})
+_DIGIT = re.compile(r"\d")
+_SYNONYMS = {"high": "tall", "height": "tall", "large": "big", "huge": "big"}
+_UNITS = {
+    "metre": "m", "metres": "m", "meter": "m", "meters": "m",
+    "kilometre": "km", "kilometres": "km", "kilometer": "km", "kilometers": "km",
+    "percent": "%", "pct": "%", "feet": "ft", "foot": "ft",
+    "million": "m_", "millions": "m_", "billion": "b_", "billions": "b_",
+}
+
+
+def content_words(text: str) -> list:
+    """Content words of a claim in order, with units, plurals and common synonyms folded together.
+
+    Linking verbs such as "stands" are dropped like "is", so "The tower is
+    330m tall" and "The tower stands 330 metres high" have the same words.
+    """
+    text = normalize_claim(text.replace("%", " percent "))
+    text = re.sub(r"(\d)([a-z]+)", r"\1 \2", text)
+    words = []
+    for word in text.split():
+        if word in STOPWORDS or word in _COPULAS:
+            continue
+        word = _UNITS.get(word) or _SYNONYMS.get(word, word)
+        if len(word) > 4 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        words.append(word)
+    return words
+
+
+def claim_tokens(text: str) -> set:
+    """Content-word tokens of a claim, with units and plurals folded together."""
+    return set(content_words(text))
+
+
+def _guard(tokens):
+    """Numbers, operators and negations two claims must share to be considered the same."""
+    return frozenset(t for t in tokens if _DIGIT.search(t) or t in _NEGATIONS
+                     or unicodedata.category(t[0]) in ("Sm", "Sc"))
+
+
+def _entities(text):
+    """Capitalized names in a claim, people, places and organisations, folded like content words."""
+    return set(content_words(" ".join(re.findall(r"\b[A-Z][\w'-]*", text))))
+
+
+def _shingles(words):
+    return set(zip(words, words[1:])) or set(words)
+
+
+class _Claim(NamedTuple):
+    """A claim parsed for ``same_claim``; parses are cached, so the fields are frozen."""
+    words: frozenset
+    guard: frozenset
+    entities: frozenset
+    shingles: frozenset
+
+    @classmethod
+    @functools.lru_cache(maxsize=4096)
+    def of(cls, text):
+        words = content_words(text)
+        return cls(frozenset(words), _guard(words), frozenset(_entities(text)), frozenset(_shingles(words)))
+
+
+def _same(claim: _Claim, other: _Claim, threshold: float) -> bool:
+    if claim.guard != other.guard:
+        return False
+    if not (claim.entities <= other.words and other.entities <= claim.words):
+        return False
+    union = claim.shingles | other.shingles
+    return bool(union) and len(claim.shingles & other.shingles) / len(union) >= threshold
+
+
+def same_claim(claim: str, other: str, threshold: float = DUPLICATE_THRESHOLD) -> bool:
+    """Whether ``other`` asserts the same thing as ``claim``, not just shares its words.
+
+    MinHash compares bags of words, so "The Sun orbits the Earth" and "The
+    Earth orbits the Sun" look identical to it. This requires the same
+    names, numbers and negations and a high overlap of ordered word pairs.
+    Names are compared against the other claim's words, so a claim typed in
+    lower case still matches.
+    """
+    return _same(_Claim.of(claim), _Claim.of(other), threshold)
+
+
+@functools.lru_cache(maxsize=8192)
+def _permuted(h: int) -> array:
+    """``h`` under every permutation; cached, since claims share most of their words."""
+    return array("Q", ((a * h + b) % _PRIME for a, b in _PERMUTATIONS))
+
+
+def minhash(tokens) -> array:
+    """MinHash signature of a token set over NUM_PERM universal hash functions."""
+    rows = [_permuted(int.from_bytes(hashlib.blake2b(t.encode("utf-8"), digest_size=8).digest(), "big"))
+            for t in tokens] or [_permuted(0)]
+    return array("Q", map(min, *rows) if len(rows) > 1 else rows[0])
+
+
+def _bands(signature):
+    for band in range(NUM_BANDS):
+        rows = signature[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND]
+        digest = hashlib.blake2b(rows.tobytes(), digest_size=8).digest()
+        yield band, struct.unpack(">q", digest)[0]
+
+
+class Match(NamedTuple):
+    fingerprint: str
+    claim: str
+    similarity: float
+    # Passed same_claim(); only these may stand in for the queried claim
+    duplicate: bool = False
+
+
+class ClaimIndex():
+    """Locality-sensitive hashing index over previously verified claims.
+
+    Each claim is stored once with its MinHash signature and is bucketed into
+    NUM_BANDS bands of ROWS_PER_BAND rows, so pairs with a Jaccard similarity
+    above roughly 0.5 become candidates. Each band is one indexed lookup, and
+    only the MAX_CANDIDATES candidates sharing the most bands are scored on
+    their full signatures. Both tables live in SQLite, so
+    memory stays flat as the index grows and inserts are incremental.
+    """
+
+    def __init__(self, path=None):
+        self._lock = threading.Lock()
+        self._conn = connect(path or cache_path("claim_index"))
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS claims (
+                id INTEGER PRIMARY KEY,
+                fingerprint TEXT UNIQUE NOT NULL,
+                claim TEXT NOT NULL,
+                signature BLOB NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS buckets (
+                band INTEGER NOT NULL,
+                bucket INTEGER NOT NULL,
+                claim_id INTEGER NOT NULL
+            );
+            DROP INDEX IF EXISTS buckets_lookup;
+            CREATE INDEX IF NOT EXISTS buckets_covering ON buckets (band, bucket, claim_id);
+        """)
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] != _LAYOUT:
+            self._rebuild_buckets()
+
+    def _rebuild_buckets(self):
+        """Re-bucket every stored signature, after NUM_BANDS or ROWS_PER_BAND changed."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute("DELETE FROM buckets")
+                for claim_id, blob in self._conn.execute("SELECT id, signature FROM claims").fetchall():
+                    signature = array("Q")
+                    signature.frombytes(blob)
+                    self._conn.executemany(
+                        "INSERT INTO buckets VALUES (?, ?, ?)",
+                        ((band, bucket, claim_id) for band, bucket in _bands(signature)),
+                    )
+                self._conn.execute(f"PRAGMA user_version = {_LAYOUT}")
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def add(self, claim: str):
+        """Index ``claim``; claims already present are ignored."""
+        signature = minhash(claim_tokens(claim))
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                cur = self._conn.execute(
+                    "INSERT OR IGNORE INTO claims (fingerprint, claim, signature) VALUES (?, ?, ?)",
+                    (claim_fingerprint(claim), claim, signature.tobytes()),
+                )
+                if cur.rowcount:
+                    self._conn.executemany(
+                        "INSERT INTO buckets VALUES (?, ?, ?)",
+                        ((band, bucket, cur.lastrowid) for band, bucket in _bands(signature)),
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def query(self, claim: str, threshold: float = NEAR_DUPLICATE_THRESHOLD, limit: int = 5) -> list:
+        """Return indexed claims similar to ``claim``, best match first.
+
+        Matches are candidates sharing most of the claim's words; only those
+        flagged ``duplicate`` make the same assertion.
+        """
+        query = _Claim.of(claim)
+        signature = minhash(query.words)
+        bands = list(_bands(signature))
+        with self._lock:
+            rows = self._conn.execute(
+                f"WITH query (band, bucket) AS (VALUES {', '.join(['(?, ?)'] * len(bands))}), "
+                f"hits (claim_id, shared) AS (SELECT claim_id, COUNT(*) FROM query "
+                f"JOIN buckets INDEXED BY buckets_covering USING (band, bucket) GROUP BY claim_id "
+                f"ORDER BY 2 DESC LIMIT {MAX_CANDIDATES}) "
+                f"SELECT fingerprint, claim, signature FROM hits JOIN claims ON claims.id = hits.claim_id",
+                [value for pair in bands for value in pair],
+            ).fetchall()
+
+        scored = []
+        for fingerprint, text, blob in rows:
+            other = array("Q")
+            other.frombytes(blob)
+            similarity = sum(map(operator.eq, signature, other)) / NUM_PERM
+            if similarity >= threshold:
+                scored.append((similarity, fingerprint, text))
+        scored.sort(key=lambda m: m[0], reverse=True)
+        return [Match(fingerprint, text, similarity, _same(query, _Claim.of(text), DUPLICATE_THRESHOLD))
+                for similarity, fingerprint, text in scored[:limit]]
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM claims").fetchone()[0]
+
+
+@singleton
+def get_claim_index() -> ClaimIndex:
+    """Return the ClaimIndex shared by the whole process."""
+    return ClaimIndex()
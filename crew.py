@@ -1,15 +1,10 @@
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
-from .tools.youtube_tool import YouTubeTranscriptTool
-from .tools.web_scraping_tool import WebScrapingTool
+from .llm_cache import agent_llm
+from .scheduler import TASK_CONCURRENCY, ConcurrentCrew
+from .tool_registry import available, shared_tool
+from .verdicts import ClaimVerdict, VerificationReport
 
-# Try to import SerperDevTool, fallback if not available
-try:
-    from crewai_tools import SerperDevTool
-    SERPER_AVAILABLE = True
-except ImportError:
-    SERPER_AVAILABLE = False
-    print("SerperDevTool not available, web search will be limited")
 
 @CrewBase
 class FactChecker():
@@ -20,12 +15,13 @@ class FactChecker():
 
     @agent
     def fact_researcher(self) -> Agent:
-        tools = [YouTubeTranscriptTool(), WebScrapingTool()]
-        if SERPER_AVAILABLE:
-            tools.append(SerperDevTool())
+        tools = [shared_tool('youtube'), shared_tool('web')]
+        if available('search'):
+            tools.append(shared_tool('search'))
         
         return Agent(
             config=self.agents_config['fact_researcher'],
+            llm=agent_llm(self.agents_config['fact_researcher']),
             verbose=True,
             tools=tools
         )
@@ -34,18 +30,22 @@ class FactChecker():
     def content_analyzer(self) -> Agent:
         return Agent(
             config=self.agents_config['content_analyzer'],
+            llm=agent_llm(self.agents_config['content_analyzer']),
             verbose=True,
-            tools=[YouTubeTranscriptTool(), WebScrapingTool()]
+            tools=[shared_tool('youtube'), shared_tool('web')]
         )
 
     @agent
     def fact_verifier(self) -> Agent:
         tools = []
-        if SERPER_AVAILABLE:
-            tools.append(SerperDevTool())
+        if available('evidence'):
+            tools.append(shared_tool('evidence'))
+        elif available('search'):
+            tools.append(shared_tool('search'))
             
         return Agent(
             config=self.agents_config['fact_verifier'],
+            llm=agent_llm(self.agents_config['fact_verifier']),
             verbose=True,
             tools=tools
         )
@@ -70,15 +70,130 @@ class FactChecker():
         return Task(
             config=self.tasks_config['verification_task'],
             agent=self.fact_verifier(),
-            context=[self.research_task(), self.content_analysis_task()]
+            context=[self.research_task(), self.content_analysis_task()],
+            output_pydantic=VerificationReport
+        )
+
+    def claim_extraction_task(self) -> Task:
+        """Claim extraction over one chunk of already extracted document text"""
+        return Task(
+            name="claim_extraction_task",
+            description=(
+                "Extract every verifiable factual claim from the document excerpt below. "
+                "Skip opinions and keep each claim self-contained so it can be verified "
+                "without the rest of the document.\n\n"
+                "Excerpt:\n{input_content}"
+            ),
+            expected_output=(
+                'A JSON object of the form {"claims": [{"id": "claim_001", "text": "...", '
+                '"category": "statistical/factual/opinion", "confidence": 0.85, '
+                '"context": "...", "entities": ["..."]}]}'
+            ),
+            agent=self.content_analyzer(),
+            # Works on the input alone, so it can run alongside research
+            context=[]
+        )
+
+    def claim_verification_task(self) -> Task:
+        """Verification of a single extracted claim, run once per claim"""
+        return Task(
+            name="claim_verification_task",
+            description=(
+                "Verify the following claim against reliable, authoritative sources.\n\n"
+                "Claim ID: {claim_id}\n"
+                "Claim: {claim_text}\n"
+                "Context: {claim_context}\n\n"
+                "Search for supporting and contradicting evidence, assess the credibility "
+                "of each source and decide whether the claim is TRUE, FALSE, MISLEADING, "
+                "UNCERTAIN or UNVERIFIABLE."
+            ),
+            expected_output=(
+                "The verdict for claim {claim_id} with a confidence score between 0 and 1, "
+                "the evidence sources used and a short explanation."
+            ),
+            agent=self.fact_verifier(),
+            output_pydantic=ClaimVerdict
+        )
+
+    def routed_analysis_task(self, analyzer) -> Task:
+        """Claim extraction over content the input router already fetched, or over a text claim"""
+        return Task(
+            name="routed_analysis_task",
+            description=(
+                "The content below has already been retrieved for you; do not fetch anything. "
+                "Identify every verifiable factual claim in it, skip opinions and keep each "
+                "claim self-contained with the context needed to verify it.\n\n"
+                "Content:\n{input_content}"
+            ),
+            expected_output=(
+                'A JSON object of the form {"claims": [{"id": "claim_001", "text": "...", '
+                '"category": "statistical/factual/opinion", "confidence": 0.85, '
+                '"context": "...", "entities": ["..."]}]}'
+            ),
+            agent=analyzer
         )
 
     @crew
     def crew(self) -> Crew:
         """Creates the fact checking crew"""
-        return Crew(
+        return ConcurrentCrew(
             agents=[self.fact_researcher(), self.content_analyzer(), self.fact_verifier()],
             tasks=[self.research_task(), self.content_analysis_task(), self.verification_task()],
             process=Process.sequential,
             verbose=True,
-        )
\ No newline at end of file
+        )
+
+    def analysis_crew(self) -> Crew:
+        """Research and claim extraction only, verification is fanned out per claim
+
+        When tasks run concurrently, claims are also extracted from the raw
+        input while the research runs, and the analysis gets both results.
+        """
+        if TASK_CONCURRENCY > 1:
+            extraction = self.claim_extraction_task()
+            tasks = [self.research_task(), extraction, Task(
+                config=self.tasks_config['content_analysis_task'],
+                agent=self.content_analyzer(),
+                context=[self.research_task(), extraction]
+            )]
+        else:
+            tasks = [self.research_task(), self.content_analysis_task()]
+        return ConcurrentCrew(
+            agents=[self.fact_researcher(), self.content_analyzer()],
+            tasks=tasks,
+            process=Process.sequential,
+            verbose=True,
+        )
+
+    def routed_analysis_crew(self) -> Crew:
+        """Claim extraction for routed input: no research step and an analyzer without tools"""
+        analyzer = Agent(
+            config=self.agents_config['content_analyzer'],
+            llm=agent_llm(self.agents_config['content_analyzer']),
+            verbose=True,
+            tools=[]
+        )
+        return ConcurrentCrew(
+            agents=[analyzer],
+            tasks=[self.routed_analysis_task(analyzer)],
+            process=Process.sequential,
+            verbose=True,
+        )
+
+    def claim_extraction_crew(self) -> Crew:
+        """Extracts claims from one chunk of document text, no research step"""
+        return ConcurrentCrew(
+            agents=[self.content_analyzer()],
+            tasks=[self.claim_extraction_task()],
+            process=Process.sequential,
+            verbose=True,
+        )
+
+    def claim_verification_crew(self) -> Crew:
+        """Verifies a single claim, one kickoff per extracted claim"""
+        return ConcurrentCrew(
+            agents=[self.fact_verifier()],
+            tasks=[self.claim_verification_task()],
+            process=Process.sequential,
+            verbose=True,
+        )
@@ -0,0 +1,476 @@
+import contextvars
+import heapq
+import itertools
+import math
+import mmap
+import os
+import re
+import struct
+import threading
+import time
+import zlib
+from array import array
+from collections import Counter
+from contextlib import contextmanager
+from operator import itemgetter
+from pathlib import Path
+from typing import Iterable, NamedTuple, Optional
+
+from .chunking import chunk_text
+from .claim_index import STOPWORDS
+from .storage import CACHE_DIR, cache_path, connect, singleton
+
+EVIDENCE_INDEX_ENABLED = os.getenv("FACT_CHECKER_EVIDENCE_INDEX", "1") != "0"
+EVIDENCE_DIR = Path(os.getenv("FACT_CHECKER_EVIDENCE_DIR", CACHE_DIR / "evidence"))
+EVIDENCE_MIN_COVERAGE = float(os.getenv("FACT_CHECKER_EVIDENCE_MIN_COVERAGE", 0.6))
+PASSAGE_TOKENS = int(os.getenv("FACT_CHECKER_PASSAGE_TOKENS", 160))
+FLUSH_PASSAGES = int(os.getenv("FACT_CHECKER_EVIDENCE_FLUSH", 2000))
+
+MERGE_FACTOR = 4
+TOP_POSTINGS = 2000
+LEASE_SECONDS = 300
+K1 = 1.2
+B = 0.75
+
+_IMPACT_SCALE = 255 / (K1 + 1)
+_WORD = re.compile(r"\w+")
+_SEGMENT_NAME = re.compile(r"seg_(\d+)_(\d+)\.bm25$")
+# term bytes, term offsets, postings offsets, posting counts, terms, passages, total passage length, magic
+_FOOTER = struct.Struct("=QQQQIIQ8s")
+_MAGIC = b"FCBM25v1"
+
+
+def terms(text: str) -> list:
+    """Index terms of ``text``: lowercased words without stopwords, plurals folded."""
+    out = []
+    for word in _WORD.findall(text.lower()):
+        if word in STOPWORDS or (len(word) == 1 and not word.isdigit()):
+            continue
+        if len(word) > 4 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        out.append(word)
+    return out
+
+
+def _impact(tf, length, average_length) -> float:
+    return tf * (K1 + 1) / (tf + K1 * (1 - B + B * length / average_length))
+
+
+def _pad(f, alignment=8):
+    f.write(b"\0" * (-f.tell() % alignment))
+
+
+def write_segment(path: Path, postings, passages: int, total_length: int):
+    """Write term postings, given in sorted term order as ``(term, [(impact, passage_id)])``, to ``path``.
+
+    Layout: for each term its passage ids (uint32) and then their impacts
+    (uint8), highest impact first; then the sorted UTF-8 terms, their offsets,
+    the postings offsets and counts, and a fixed-size footer. The file is
+    written under a temporary name and renamed into place.
+    """
+    term_bytes = bytearray()
+    term_offsets = array("Q", [0])
+    postings_offsets = array("Q")
+    counts = array("I")
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "wb") as f:
+        for term, entries in postings:
+            entries.sort(reverse=True)
+            postings_offsets.append(f.tell())
+            counts.append(len(entries))
+            f.write(array("I", (passage_id for _, passage_id in entries)).tobytes())
+            f.write(bytes(impact for impact, _ in entries))
+            _pad(f)
+            term_bytes += term.encode("utf-8")
+            term_offsets.append(len(term_bytes))
+        terms_start = f.tell()
+        f.write(term_bytes)
+        _pad(f)
+        sections = []
+        for table in (term_offsets, postings_offsets, counts):
+            sections.append(f.tell())
+            f.write(table.tobytes())
+            _pad(f)
+        f.write(_FOOTER.pack(terms_start, *sections, len(counts), passages, total_length, _MAGIC))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+class Segment():
+    """Immutable, memory-mapped BM25 postings for a contiguous range of passage ids.
+
+    Nothing is loaded up front: term lookup is a binary search over the
+    mapped term table, and postings are read as zero-copy views.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        first, last = _SEGMENT_NAME.search(path.name).groups()
+        self.first = int(first)
+        self.last = int(last)
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._map)
+        (terms_start, term_offsets, postings_offsets, counts, self.terms, self.passages,
+         self.total_length, magic) = _FOOTER.unpack_from(self._map, len(self._map) - _FOOTER.size)
+        if magic != _MAGIC:
+            raise ValueError(f"{path} is not an evidence index segment")
+        self._terms_start = terms_start
+        self._term_offsets = view[term_offsets:term_offsets + 8 * (self.terms + 1)].cast("Q")
+        self._postings_offsets = view[postings_offsets:postings_offsets + 8 * self.terms].cast("Q")
+        self._counts = view[counts:counts + 4 * self.terms].cast("I")
+
+    def _term(self, i) -> bytes:
+        return self._map[self._terms_start + self._term_offsets[i]:self._terms_start + self._term_offsets[i + 1]]
+
+    def find(self, term: str) -> int:
+        """Position of ``term`` in the term table, or -1."""
+        key = term.encode("utf-8")
+        low, high = 0, self.terms
+        while low < high:
+            mid = (low + high) // 2
+            if self._term(mid) < key:
+                low = mid + 1
+            else:
+                high = mid
+        return low if low < self.terms and self._term(low) == key else -1
+
+    def df(self, i: int) -> int:
+        return self._counts[i]
+
+    def postings(self, i: int, limit: Optional[int] = None):
+        """Passage ids and quantized impacts of term ``i``, highest impact first."""
+        count = self._counts[i]
+        start = self._postings_offsets[i]
+        take = count if limit is None else min(count, limit)
+        ids = memoryview(self._map)[start:start + 4 * take].cast("I")
+        return ids, self._map[start + 4 * count:start + 4 * count + take]
+
+    def iter_terms(self):
+        for i in range(self.terms):
+            ids, impacts = self.postings(i)
+            yield self._term(i).decode("utf-8"), list(zip(impacts, ids))
+
+
+class Passage(NamedTuple):
+    id: int
+    url: str
+    text: str
+    score: float
+    coverage: float
+
+
+class EvidenceIndex():
+    """Incremental BM25 index over passages of pages and transcripts fetched by the tools.
+
+    Passage text lives in SQLite. Postings live in immutable segment files
+    under EVIDENCE_DIR, each covering a contiguous range of passage ids.
+    Segment postings are stored in impact order, so a query reads at most
+    TOP_POSTINGS entries per term, whatever the size of the index. Passages
+    newer than the last segment are held in memory and flushed into a new
+    segment every FLUSH_PASSAGES. Runs of MERGE_FACTOR segments of similar
+    size are merged, as in a log-structured merge tree.
+
+    Several processes can share the index. Flushes and merges are serialized
+    by a lease in SQLite, and a generation counter next to it tells every
+    process when the set of segment files has changed.
+    """
+
+    def __init__(self, directory: Path = EVIDENCE_DIR, path=None):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = connect(path or cache_path("evidence"))
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS sources (
+                id INTEGER PRIMARY KEY,
+                url TEXT UNIQUE NOT NULL,
+                added_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS passages (
+                id INTEGER PRIMARY KEY,
+                source_id INTEGER NOT NULL,
+                text BLOB NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS state (
+                id INTEGER PRIMARY KEY CHECK (id = 0),
+                lease_until REAL NOT NULL,
+                generation INTEGER NOT NULL
+            );
+            INSERT OR IGNORE INTO state VALUES (0, 0, 0);
+        """)
+        self._segments = []
+        self._generation = None
+        self._covered = 0
+        self._reset_buffer()
+
+    def _reset_buffer(self):
+        self._buffer = {}
+        self._buffer_passages = 0
+        self._buffer_length = 0
+        self._buffer_upto = self._covered
+
+    def _open_segments(self):
+        """The segments covering passage ids 1..n without gaps, preferring merged ones."""
+        opened = {segment.path: segment for segment in self._segments}
+        found = []
+        for path in self.directory.glob("seg_*.bm25"):
+            match = _SEGMENT_NAME.search(path.name)
+            found.append((int(match.group(1)), -int(match.group(2)), path))
+        segments = []
+        covered = 0
+        for first, last, path in sorted(found):
+            if first != covered + 1:
+                if -last <= covered:
+                    # Superseded by a merge whose cleanup failed, e.g. a file still mapped on Windows
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+                continue
+            segment = opened.get(path) or Segment(path)
+            segments.append(segment)
+            covered = segment.last
+        return segments
+
+    def _sync(self):
+        """Pick up new segments and passages added by any process. Call with the lock held."""
+        generation = self._conn.execute("SELECT generation FROM state").fetchone()[0]
+        if generation != self._generation:
+            try:
+                self._segments = self._open_segments()
+                self._generation = generation
+            except FileNotFoundError:
+                # A merge removed a file between listing and opening; retry on the next call
+                pass
+            covered = self._segments[-1].last if self._segments else 0
+            if covered != self._covered:
+                self._covered = covered
+                self._reset_buffer()
+        rows = self._conn.execute(
+            "SELECT id, text FROM passages WHERE id > ? ORDER BY id", (self._buffer_upto,)
+        ).fetchall()
+        for passage_id, blob in rows:
+            counts = Counter(terms(zlib.decompress(blob).decode("utf-8")))
+            length = sum(counts.values())
+            for term, tf in counts.items():
+                self._buffer.setdefault(term, []).append((passage_id, tf, length))
+            self._buffer_passages += 1
+            self._buffer_length += length
+            self._buffer_upto = passage_id
+
+    def _totals(self):
+        passages = self._buffer_passages + sum(segment.passages for segment in self._segments)
+        length = self._buffer_length + sum(segment.total_length for segment in self._segments)
+        return passages, (length / passages if passages else 1.0)
+
+    def __contains__(self, url: str) -> bool:
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM sources WHERE url = ?", (url,)).fetchone() is not None
+
+    def add(self, url: str, text: str) -> int:
+        """Index ``text`` fetched from ``url`` and return the number of passages added.
+
+        A source is indexed once; later fetches of the same URL are ignored.
+        """
+        if not text or url in self:
+            return 0
+        passages = [zlib.compress(chunk.text.encode("utf-8"), 6)
+                    for chunk in chunk_text(text, PASSAGE_TOKENS, 0) if chunk.text.strip()]
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                cur = self._conn.execute(
+                    "INSERT OR IGNORE INTO sources (url, added_at) VALUES (?, ?)", (url, time.time())
+                )
+                if cur.rowcount:
+                    self._conn.executemany(
+                        "INSERT INTO passages (source_id, text) VALUES (?, ?)",
+                        ((cur.lastrowid, blob) for blob in passages),
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            if not cur.rowcount:
+                return 0
+            self._sync()
+            full = self._buffer_passages >= FLUSH_PASSAGES
+        if full:
+            self.flush()
+        return len(passages)
+
+    def _take_lease(self) -> bool:
+        now = time.time()
+        with self._lock:
+            cur = self._conn.execute(
+                "UPDATE state SET lease_until = ? WHERE lease_until < ?", (now + LEASE_SECONDS, now)
+            )
+        return cur.rowcount == 1
+
+    def _release_lease(self):
+        with self._lock:
+            self._conn.execute("UPDATE state SET lease_until = 0")
+
+    def _publish(self):
+        """Tell every process that the segment files changed. Call with the lease held."""
+        with self._lock:
+            self._conn.execute("UPDATE state SET generation = generation + 1")
+
+    def flush(self) -> bool:
+        """Write buffered passages to a new segment and merge segments if due.
+
+        Returns False when another process or thread is already flushing.
+        """
+        if not self._take_lease():
+            return False
+        try:
+            with self._lock:
+                self._sync()
+                if not self._buffer_passages:
+                    return True
+                _, average_length = self._totals()
+                first, last = self._covered + 1, self._buffer_upto
+                postings = [
+                    (term, [(max(1, min(255, round(_impact(tf, length, average_length) * _IMPACT_SCALE))), passage_id)
+                            for passage_id, tf, length in entries])
+                    for term, entries in sorted(self._buffer.items())
+                ]
+                passages, length = self._buffer_passages, self._buffer_length
+            write_segment(self.directory / f"seg_{first:010d}_{last:010d}.bm25", postings, passages, length)
+            self._publish()
+            self._merge()
+            return True
+        finally:
+            self._release_lease()
+
+    def _merge(self):
+        """Merge trailing runs of MERGE_FACTOR segments in the same size tier. Call with the lease held."""
+        while True:
+            with self._lock:
+                self._sync()
+                segments = list(self._segments)
+            if len(segments) < MERGE_FACTOR:
+                return
+            run = segments[-MERGE_FACTOR:]
+            tiers = {int(math.log(max(1, segment.passages // FLUSH_PASSAGES), MERGE_FACTOR)) for segment in run}
+            if len(tiers) != 1:
+                return
+            streams = heapq.merge(*(segment.iter_terms() for segment in run), key=itemgetter(0))
+            merged = (
+                (term, [entry for _, entries in group for entry in entries])
+                for term, group in itertools.groupby(streams, key=itemgetter(0))
+            )
+            write_segment(self.directory / f"seg_{run[0].first:010d}_{run[-1].last:010d}.bm25", merged,
+                          sum(segment.passages for segment in run), sum(segment.total_length for segment in run))
+            self._publish()
+            for segment in run:
+                try:
+                    os.remove(segment.path)
+                except OSError:
+                    pass
+
+    def search(self, query: str, limit: int = 5, exclude: Iterable[str] = ()) -> list:
+        """Passages best matching ``query`` by BM25, best first, leaving out sources in ``exclude``.
+
+        ``coverage`` is the IDF-weighted share of query terms a passage
+        contains, a length-independent measure of how well it answers. Terms
+        no passage contains weigh in at the IDF of an unseen term, so a
+        passage missing the one word that decides the claim is not covered.
+        """
+        query_terms = list(dict.fromkeys(terms(query)))
+        with self._lock:
+            self._sync()
+            segments = list(self._segments)
+            buffered = {term: list(self._buffer.get(term, ())) for term in query_terms}
+            passages, average_length = self._totals()
+        if not passages or not query_terms:
+            return []
+
+        scores = {}
+        idfs = {}
+        for term in query_terms:
+            found = [(segment, segment.find(term)) for segment in segments]
+            found = [(segment, i) for segment, i in found if i >= 0]
+            df = sum(segment.df(i) for segment, i in found) + len(buffered[term])
+            idf = idfs[term] = math.log(1 + (passages - df + 0.5) / (df + 0.5))
+            if not df:
+                continue
+            weight = idf / _IMPACT_SCALE
+            for segment, i in found:
+                share = max(100, TOP_POSTINGS * segment.passages // passages)
+                ids, impacts = segment.postings(i, share)
+                for passage_id, impact in zip(ids, impacts):
+                    scores[passage_id] = scores.get(passage_id, 0.0) + weight * impact
+            for passage_id, tf, length in buffered[term]:
+                scores[passage_id] = scores.get(passage_id, 0.0) + idf * _impact(tf, length, average_length)
+        exclude = list(exclude)
+        if exclude and scores:
+            with self._lock:
+                excluded = self._conn.execute(
+                    f"SELECT passages.id FROM passages JOIN sources ON sources.id = source_id "
+                    f"WHERE sources.url IN ({','.join('?' * len(exclude))})", exclude,
+                ).fetchall()
+            for (passage_id,) in excluded:
+                scores.pop(passage_id, None)
+        if not scores:
+            return []
+
+        best = heapq.nlargest(limit, scores.items(), key=itemgetter(1))
+        with self._lock:
+            rows = {row[0]: row[1:] for row in self._conn.execute(
+                f"SELECT passages.id, sources.url, passages.text FROM passages JOIN sources ON sources.id = source_id "
+                f"WHERE passages.id IN ({','.join('?' * len(best))})",
+                [passage_id for passage_id, _ in best],
+            )}
+        total_idf = sum(idfs.values()) or 1.0
+        results = []
+        for passage_id, score in best:
+            if passage_id not in rows:
+                continue
+            url, blob = rows[passage_id]
+            text = zlib.decompress(blob).decode("utf-8")
+            present = set(terms(text))
+            coverage = sum(idf for term, idf in idfs.items() if term in present) / total_idf
+            results.append(Passage(passage_id, url, text, score, coverage))
+        return results
+
+    def __len__(self):
+        with self._lock:
+            self._sync()
+            return self._totals()[0]
+
+
+@singleton
+def get_evidence_index() -> EvidenceIndex:
+    """Return the EvidenceIndex shared by the whole process."""
+    return EvidenceIndex()
+
+
+_excluded = contextvars.ContextVar("fact_checker_excluded_sources", default=frozenset())
+
+
+@contextmanager
+def excluding_sources(urls: Iterable[str]):
+    """Keep ``urls`` out of evidence searches made in this context.
+
+    Used for the sources of the content being fact-checked, which would
+    otherwise be found as evidence for the claims taken from them.
+    """
+    token = _excluded.set(_excluded.get() | frozenset(urls))
+    try:
+        yield
+    finally:
+        _excluded.reset(token)
+
+
+def excluded_sources() -> frozenset:
+    """Source URLs kept out of evidence searches in this context."""
+    return _excluded.get()
+
+
+def index_source(url: str, text: str):
+    """Add fetched text to the evidence index, unless it is disabled or the fetch failed."""
+    if EVIDENCE_INDEX_ENABLED and text and not str(text).lower().startswith("error"):
+        get_evidence_index().add(url, str(text))
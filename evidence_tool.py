@@ -0,0 +1,35 @@
+from typing import Optional, Type
+
+from crewai.tools import BaseTool
+from pydantic import BaseModel, Field
+
+from .evidence_index import EVIDENCE_MIN_COVERAGE, excluded_sources, get_evidence_index
+from .metrics import record_cache
+
+
+class EvidenceSearchInput(BaseModel):
+    search_query: str = Field(description="What to look for, usually the claim being verified")
+
+
+class EvidenceSearchTool(BaseTool):
+    """Searches previously fetched sources first and falls through to web search on a poor match."""
+
+    name: str = "Search evidence"
+    description: str = (
+        "Search for evidence about a claim. Looks in pages and video transcripts already fetched "
+        "in earlier fact checks first and searches the web only when they do not cover the query. "
+        "Returns passages with their source URLs."
+    )
+    args_schema: Type[BaseModel] = EvidenceSearchInput
+    fallback: Optional[BaseTool] = None
+    min_coverage: float = EVIDENCE_MIN_COVERAGE
+
+    def _run(self, search_query: str, **kwargs) -> str:
+        passages = get_evidence_index().search(search_query, exclude=excluded_sources())
+        good = [p for p in passages if p.coverage >= self.min_coverage]
+        record_cache("evidence", bool(good))
+        if good:
+            return "\n\n".join(f"Source: {p.url}\n{p.text.strip()}" for p in good)
+        if self.fallback is not None:
+            return self.fallback.run(search_query=search_query)
+        return "No previously fetched source covers this query."
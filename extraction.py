@@ -0,0 +1,209 @@
+import collections
+import contextlib
+import html
+import io
+import itertools
+import multiprocessing
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+import zipfile
+from typing import Iterator
+
+from .ingest import IngestError
+
+EXTRACT_PROCESSES = int(os.getenv("FACT_CHECKER_EXTRACT_PROCESSES", os.cpu_count() or 2))
+EXTRACT_TIMEOUT = float(os.getenv("FACT_CHECKER_EXTRACT_TIMEOUT", 120))
+MIN_PAGES_PER_JOB = 10
+PARAGRAPHS_PER_JOB = 2000
+
+_PARAGRAPH = re.compile(rb"<w:p(?:\s[^>]*)?>.*?</w:p>|<w:p(?:\s[^>]*)?/>", re.S)
+_RUN_TEXT = re.compile(rb"<w:t(?:\s[^>]*)?>(.*?)</w:t>|<w:(tab|br|cr)(?:\s[^>]*)?/>", re.S)
+
+
+class ExtractionTimeout(IngestError):
+    """Raised when a document takes longer than the per-file timeout to extract."""
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = multiprocessing.get_context("spawn").Pool(EXTRACT_PROCESSES)
+        return _pool
+
+
+def _reset_pool():
+    """Kill the workers, e.g. after a pathological file hit the timeout."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.terminate()
+            _pool = None
+
+
+def _read_pdf(path):
+    import PyPDF2
+
+    try:
+        return PyPDF2.PdfReader(path)
+    except PyPDF2.errors.PdfReadError as e:
+        raise IngestError(f"Unable to read PDF: {e}") from e
+
+
+def _pdf_page_count(path) -> int:
+    return len(_read_pdf(path).pages)
+
+
+def _pdf_pages(path, start, stop) -> str:
+    reader = _read_pdf(path)
+    stop = len(reader.pages) if stop is None else stop
+    return "".join(reader.pages[i].extract_text() or "" for i in range(start, stop))
+
+
+def _docx_xml(source) -> bytes:
+    try:
+        with zipfile.ZipFile(source) as archive:
+            return archive.read("word/document.xml")
+    except (zipfile.BadZipFile, KeyError) as e:
+        raise IngestError(f"Unable to read Word document: {e}") from e
+
+
+def _docx_section(xml: bytes) -> str:
+    paragraphs = []
+    for paragraph in _PARAGRAPH.finditer(xml):
+        parts = []
+        for text, special in _RUN_TEXT.findall(paragraph.group(0)):
+            if special:
+                parts.append("\t" if special == b"tab" else "\n")
+            else:
+                parts.append(html.unescape(text.decode("utf-8")))
+        paragraphs.append("".join(parts) + "\n")
+    return "".join(paragraphs)
+
+
+def _docx_document(source) -> str:
+    return _docx_section(_docx_xml(io.BytesIO(source) if isinstance(source, bytes) else source))
+
+
+def _run_job(job):
+    func, *args = job
+    return func(*args)
+
+
+class _Budget():
+    """Seconds left of a per-file timeout, spent only while waiting on workers."""
+
+    def __init__(self, timeout):
+        self.timeout = timeout
+        self.left = timeout
+
+    def wait(self, result):
+        started = time.monotonic()
+        try:
+            return result.get(timeout=max(0.0, self.left))
+        except multiprocessing.TimeoutError:
+            _reset_pool()
+            raise ExtractionTimeout(f"Document extraction exceeded {self.timeout:g}s")
+        finally:
+            self.left -= time.monotonic() - started
+
+
+def _ordered(jobs, budget, window=None) -> Iterator[str]:
+    """Yield the results of ``jobs`` in order, waiting at most ``budget`` in total.
+
+    Only ``window`` jobs are queued ahead of the result being yielded, so text
+    extracted ahead of a slow consumer stays bounded. The budget counts time
+    spent waiting for results, not time the consumer spends between them.
+    """
+    pool = _get_pool()
+    jobs = iter(jobs)
+    pending = collections.deque()
+    while True:
+        for job in itertools.islice(jobs, (window or EXTRACT_PROCESSES * 2) - len(pending)):
+            pending.append(pool.apply_async(_run_job, (job,)))
+        if not pending:
+            return
+        yield budget.wait(pending.popleft())
+
+
+def _as_file(data):
+    """Return ``data`` as a binary file object; bytes are wrapped, files are rewound."""
+    if isinstance(data, (bytes, bytearray)):
+        return io.BytesIO(data)
+    data.seek(0)
+    return data
+
+
+@contextlib.contextmanager
+def _on_disk(data, suffix):
+    """Path of ``data`` on disk; bytes and in-memory files are copied to a temporary file."""
+    source = _as_file(data)
+    path = getattr(source, "name", None)
+    if isinstance(path, str) and os.path.isfile(path):
+        yield path
+        return
+    with tempfile.NamedTemporaryFile(suffix=suffix) as f:
+        shutil.copyfileobj(source, f)
+        f.flush()
+        yield f.name
+
+
+def iter_pdf(data, timeout: float = EXTRACT_TIMEOUT, split: bool = True) -> Iterator[str]:
+    """Yield the text of a PDF in page order, extracting it on the process pool.
+
+    ``data`` is the PDF's bytes or a binary file. Every job, including the
+    page count, runs in a worker under the ``timeout`` for the whole file.
+    With ``split`` the pages are extracted in ranges across workers; every job
+    reopens the file, so ranges are sized to about two per worker rather than
+    one page each. Without it one job extracts the whole document.
+    """
+    budget = _Budget(timeout)
+    with _on_disk(data, ".pdf") as path:
+        if not split:
+            yield budget.wait(_get_pool().apply_async(_run_job, ((_pdf_pages, path, 0, None),)))
+            return
+        page_count = budget.wait(_get_pool().apply_async(_run_job, ((_pdf_page_count, path),)))
+        pages_per_job = max(MIN_PAGES_PER_JOB, -(-page_count // (EXTRACT_PROCESSES * 2)))
+        jobs = ((_pdf_pages, path, start, min(start + pages_per_job, page_count))
+                for start in range(0, page_count, pages_per_job))
+        yield from _ordered(jobs, budget)
+
+
+def iter_docx(data, paragraphs_per_job: int = PARAGRAPHS_PER_JOB, timeout: float = EXTRACT_TIMEOUT,
+              split: bool = True) -> Iterator[str]:
+    """Yield the text of a DOCX in order, extracting it on the process pool under ``timeout``.
+
+    ``data`` is the document's bytes or a binary file. With ``split``
+    ``word/document.xml`` is cut at paragraph boundaries without building a
+    tree, so the parse of each section happens in a worker. Without it one
+    job reads and parses the whole document.
+    """
+    budget = _Budget(timeout)
+    if not split:
+        source = _as_file(data)
+        path = getattr(source, "name", None)
+        job = (_docx_document, path if isinstance(path, str) and os.path.isfile(path) else source.read())
+        yield budget.wait(_get_pool().apply_async(_run_job, (job,)))
+        return
+    xml = _docx_xml(_as_file(data))
+    bounds = [m.end() for m in re.finditer(rb"</w:p>|<w:p(?:\s[^>]*)?/>", xml)]
+    cuts = [0] + bounds[paragraphs_per_job - 1::paragraphs_per_job] + [len(xml)]
+    jobs = ((_docx_section, xml[a:b]) for a, b in zip(cuts, cuts[1:]) if b > a)
+    yield from _ordered(jobs, budget)
+
+
+def extract_document(data, suffix: str, timeout: float = EXTRACT_TIMEOUT) -> str:
+    """Extract the full text of a PDF or DOCX on the process pool."""
+    if suffix == ".pdf":
+        return "".join(iter_pdf(data, timeout=timeout))
+    if suffix == ".docx":
+        return "".join(iter_docx(data, timeout=timeout))
+    raise IngestError(f"Unsupported format: {suffix}")
@@ -0,0 +1,58 @@
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .crew import FactChecker
+
+
+class CrewFactory():
+    """Warm, process-wide source of FactChecker crews.
+
+    The YAML configs, agents and tools are built once, on the first request
+    for a crew, which is also when crewai and the tool modules are imported.
+    Every call to ``crew()`` returns a copy of a template crew, so each
+    request gets fresh agent and task state while the tool instances stay
+    shared.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._checker = None
+        self._templates = {}
+
+    def _template(self, name):
+        with self._lock:
+            if self._checker is None:
+                from .crew import FactChecker
+                self._checker = FactChecker()
+            if name not in self._templates:
+                self._templates[name] = getattr(self._checker, name)()
+            return self._templates[name]
+
+    @property
+    def checker(self) -> "FactChecker":
+        """The FactChecker instance backing the template crews."""
+        self._template('crew')
+        return self._checker
+
+    def crew(self, name='crew'):
+        """Return a fresh copy of the named FactChecker crew for a single kickoff.
+
+        ``name`` is the FactChecker method that builds the crew: ``crew``,
+        ``analysis_crew``, ``routed_analysis_crew`` or ``claim_verification_crew``.
+        """
+        return self._template(name).copy()
+
+
+_factory = None
+_factory_lock = threading.Lock()
+
+
+def get_factory() -> CrewFactory:
+    """Return the CrewFactory shared by the whole process."""
+    global _factory
+    if _factory is None:
+        with _factory_lock:
+            if _factory is None:
+                _factory = CrewFactory()
+    return _factory
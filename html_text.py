@@ -0,0 +1,218 @@
+import re
+from typing import NamedTuple, Optional
+
+from lxml import etree
+
+# Never readable text
+_UNREADABLE_TAGS = ("script", "style", "noscript", "template", "svg", "canvas", "iframe", "object", "embed")
+# Page chrome around the content. Not <form>: ASP.NET WebForms wraps the whole body in one
+_CHROME_TAGS = ("button", "input", "select", "textarea", "nav", "footer", "aside", "dialog")
+_DROPPED_ROLES = {"navigation", "banner", "contentinfo", "complementary", "search", "menu", "menubar", "dialog"}
+_BOILERPLATE = re.compile(
+    r"(^|[\s_-])(nav|navbar|menu|footer|sidebar|side-bar|widget|comment|comments|share|sharing|social|"
+    r"advert|advertisement|ads?|sponsor|promo|related|recommended|cookie|consent|banner|subscribe|newsletter|"
+    r"breadcrumbs?|popup|modal|masthead|skip|paywall|outbrain|taboola)([\s_-]|$)",
+    re.IGNORECASE,
+)
+_CONTENT = re.compile(r"article|content|main|post|story|entry|body|text", re.IGNORECASE)
+_BLOCK_TAGS = {"p", "div", "section", "article", "main", "header", "h1", "h2", "h3", "h4", "h5", "h6", "li",
+               "ul", "ol", "dl", "dt", "dd", "blockquote", "pre", "table", "tr", "td", "th", "figure",
+               "figcaption", "br", "hr", "address", "details", "summary"}
+_XML_DECLARATION = re.compile(r"^\s*<\?xml[^>]*>")
+_BYLINE = re.compile(r"^by\s+", re.IGNORECASE)
+_LINK_LIST_TAGS = {"ul", "ol", "div", "section", "table", "p", "li", "header"}
+_SCORED_TAGS = ("p", "pre", "blockquote", "td")
+_MIN_PARAGRAPH = 25
+_MIN_ARTICLE = 140
+
+
+# Plain etree elements: lxml.html's element classes cost a lookup per node
+_PARSER = etree.HTMLParser(remove_comments=True, remove_pis=True)
+
+
+class Article(NamedTuple):
+    title: str
+    author: str
+    published: str
+    text: str
+
+
+def _clean(text: Optional[str]) -> str:
+    return " ".join((text or "").split())
+
+
+def _text(element) -> str:
+    return "".join(element.itertext())
+
+
+def _drop(element):
+    """Remove ``element`` and its children, keeping the text that follows it."""
+    parent = element.getparent()
+    if element.tail:
+        previous = element.getprevious()
+        if previous is not None:
+            previous.tail = (previous.tail or "") + element.tail
+        else:
+            parent.text = (parent.text or "") + element.tail
+    parent.remove(element)
+
+
+def _meta(root, *names) -> str:
+    for name in names:
+        for attribute in ("property", "name", "itemprop"):
+            for element in root.iterfind(f".//meta[@{attribute}='{name}']"):
+                content = _clean(element.get("content"))
+                if content:
+                    return content
+    return ""
+
+
+def _metadata(root):
+    title = _meta(root, "og:title", "twitter:title", "headline") or _clean(root.findtext(".//title"))
+    if not title:
+        heading = root.find(".//h1")
+        title = _clean(_text(heading)) if heading is not None else ""
+    author = _meta(root, "author", "article:author", "parsely-author", "dc.creator", "byl")
+    if not author:
+        for element in root.xpath(".//*[@rel='author' or @itemprop='author' or contains(@class, 'byline')]"):
+            author = _clean(_text(element))
+            if author:
+                break
+    published = _meta(root, "article:published_time", "datePublished", "date", "pubdate", "publish-date",
+                      "dc.date", "sailthru.date")
+    if not published:
+        for element in root.iterfind(".//time"):
+            published = _clean(element.get("datetime") or _text(element))
+            if published:
+                break
+    return title, _BYLINE.sub("", author), published
+
+
+def _text_length(element) -> int:
+    return len(_text(element))
+
+
+def _link_density(element) -> float:
+    length = _text_length(element)
+    if not length:
+        return 0.0
+    return sum(_text_length(link) for link in element.iterfind(".//a")) / length
+
+
+def _is_boilerplate(element) -> bool:
+    """Whether ``element`` is page chrome rather than content.
+
+    A class or id naming a menu, ad or share bar only condemns an element that
+    is also mostly links or has little text, and never one that is also marked
+    as content, so ``class="post-body share-enabled"`` survives.
+    """
+    if element.get("role") in _DROPPED_ROLES or element.get("aria-hidden") == "true" or element.get("hidden") is not None:
+        return True
+    marker = f"{element.get('class', '')} {element.get('id', '')}"
+    if (not _BOILERPLATE.search(marker) or _CONTENT.search(marker)
+            or element.tag in ("article", "main", "body", "html") or element.get("itemprop") == "articleBody"):
+        return False
+    return _text_length(element) < _MIN_ARTICLE or _link_density(element) > 0.5
+
+
+def _main_node(root):
+    """The element holding the article body.
+
+    Semantic containers (``itemprop=articleBody``, ``<article>``, ``<main>``)
+    win when they hold enough text. Otherwise paragraphs vote for their parent
+    and grandparent, weighted by length and commas, as in Readability.
+    """
+    for path in (".//*[@itemprop='articleBody']", ".//article", ".//main", ".//*[@role='main']"):
+        candidates = [element for element in root.iterfind(path) if _text_length(element) >= _MIN_ARTICLE]
+        if candidates:
+            return max(candidates, key=_text_length)
+
+    scores = {}
+    for paragraph in root.iter(*_SCORED_TAGS):
+        text = _clean(_text(paragraph))
+        if len(text) < _MIN_PARAGRAPH:
+            continue
+        score = 1 + text.count(",") + min(len(text) // 100, 3)
+        parent = paragraph.getparent()
+        if parent is None:
+            continue
+        scores[parent] = scores.get(parent, 0) + score
+        grandparent = parent.getparent()
+        if grandparent is not None:
+            scores[grandparent] = scores.get(grandparent, 0) + score / 2
+    if not scores:
+        return root.find(".//body") if root.find(".//body") is not None else root
+    for element in scores:
+        if _CONTENT.search(f"{element.get('class', '')} {element.get('id', '')}"):
+            scores[element] *= 1.25
+    return max(scores, key=lambda element: scores[element] * (1 - _link_density(element)))
+
+
+def _lines(node):
+    """Text of ``node`` with one line per block element, whitespace collapsed."""
+    parts = []
+    for event, element in etree.iterwalk(node, events=("start", "end")):
+        block = element.tag in _BLOCK_TAGS
+        if event == "start":
+            if block:
+                parts.append("\n")
+            if element.text:
+                parts.append(element.text)
+        else:
+            if block:
+                parts.append("\n")
+            if element.tail and element is not node:
+                parts.append(element.tail)
+    seen = set()
+    for line in "".join(parts).split("\n"):
+        line = _clean(line)
+        if line and line not in seen:
+            seen.add(line)
+            yield line
+
+
+def _parse(markup):
+    root = etree.fromstring(markup, _PARSER)
+    if root is None:
+        raise ValueError("Document is empty")
+    etree.strip_elements(root, *_UNREADABLE_TAGS, with_tail=False)
+    return root
+
+
+def _full_text(markup, title) -> str:
+    """All readable text of the page body, for pages the pruning empties."""
+    root = _parse(markup)
+    body = root.find(".//body")
+    return "\n".join(line for line in _lines(body if body is not None else root) if line != title)
+
+
+def extract(markup) -> Article:
+    """Main content and metadata of an HTML page, without navigation, ads and other boilerplate.
+
+    Builds one lxml tree, drops non-content elements, picks the article body
+    and keeps only its link-sparse blocks. A page with no text left after
+    that gets its full body text instead. ``markup`` may be text or bytes.
+    Raises ``ValueError`` for empty or unparseable input.
+    """
+    if isinstance(markup, str):
+        markup = _XML_DECLARATION.sub("", markup, count=1)
+    root = _parse(markup)
+    title, author, published = _metadata(root)
+
+    etree.strip_elements(root, *_CHROME_TAGS, with_tail=False)
+    marked = root.xpath(".//*[@class or @id or @role or @aria-hidden or @hidden]")
+    for element in [e for e in marked if _is_boilerplate(e)]:
+        if element.getparent() is not None:
+            _drop(element)
+
+    node = _main_node(root)
+    link_lists = []
+    walker = etree.iterwalk(node, events=("start",))
+    for _, element in walker:
+        if element is not node and element.tag in _LINK_LIST_TAGS and _link_density(element) > 0.5:
+            link_lists.append(element)
+            walker.skip_subtree()
+    for element in link_lists:
+        _drop(element)
+    text = "\n".join(line for line in _lines(node) if line != title)
+    return Article(title, author, published, text or _full_text(markup, title))
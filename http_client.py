@@ -0,0 +1,229 @@
+import asyncio
+import importlib.util
+import ipaddress
+import json
+import os
+import socket
+import threading
+import time
+from typing import NamedTuple, Optional
+
+import httpx
+from httpcore import AsyncNetworkBackend
+
+from .metrics import record_http_event
+from .politeness import MAX_PER_HOST, ROBOTS_ENABLED, HostPolicy, Robots, retry_after
+from .storage import singleton
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+MAX_CONNECTIONS = int(os.getenv("FACT_CHECKER_HTTP_MAX_CONNECTIONS", 100))
+MAX_BODY_BYTES = int(float(os.getenv("FACT_CHECKER_HTTP_MAX_BODY_MB", 5)) * 1024 * 1024)
+HTTP_TIMEOUT = float(os.getenv("FACT_CHECKER_HTTP_TIMEOUT", 15))
+DNS_TTL = float(os.getenv("FACT_CHECKER_DNS_TTL", 300))
+RETRIES = int(os.getenv("FACT_CHECKER_HTTP_RETRIES", 2))
+MAX_RETRY_WAIT = float(os.getenv("FACT_CHECKER_HTTP_MAX_RETRY_WAIT", 30))
+USER_AGENT = "Verifact Bot 1.0"
+ROBOTS_MAX_BYTES = 512 * 1024
+
+
+class RobotsDisallowed(Exception):
+    """The site's robots.txt does not allow fetching the URL."""
+
+
+# What callers should catch from a failed fetch
+FETCH_ERRORS = (httpx.HTTPError, RobotsDisallowed)
+
+
+class Response(NamedTuple):
+    url: str
+    status_code: int
+    headers: httpx.Headers
+    content: bytes
+    encoding: Optional[str]
+    truncated: bool
+    http_version: str
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class _CachingResolver(AsyncNetworkBackend):
+    """Network backend that remembers DNS answers for ``ttl`` seconds.
+
+    Only the TCP connect is redirected to the cached address; TLS still
+    verifies and sends SNI for the original host name.
+    """
+
+    def __init__(self, backend, ttl: float = DNS_TTL):
+        self._backend = backend
+        self._ttl = ttl
+        self._cache = {}
+
+    async def _resolve(self, host: str, port: int) -> str:
+        try:
+            ipaddress.ip_address(host)
+            return host
+        except ValueError:
+            pass
+        cached = self._cache.get((host, port))
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+        infos = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        address = infos[0][4][0]
+        self._cache[(host, port)] = (address, time.monotonic() + self._ttl)
+        return address
+
+    async def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        address = await self._resolve(host, port)
+        try:
+            return await self._backend.connect_tcp(address, port, timeout=timeout, local_address=local_address,
+                                                   socket_options=socket_options)
+        except Exception:
+            self._cache.pop((host, port), None)
+            raise
+
+    async def connect_unix_socket(self, path, timeout=None, socket_options=None):
+        return await self._backend.connect_unix_socket(path, timeout=timeout, socket_options=socket_options)
+
+    async def sleep(self, seconds):
+        await self._backend.sleep(seconds)
+
+
+class HttpClient():
+    """One pooled async HTTP client for the whole process.
+
+    The ``httpx.AsyncClient`` lives on a dedicated event loop thread, so tools
+    running on any worker thread share its keep-alive connections, HTTP/2
+    sessions (when ``h2`` is installed) and DNS cache. Bodies are read as a
+    stream and cut off at ``max_bytes``.
+
+    Every host gets a HostPolicy: a token bucket, a cap of MAX_PER_HOST
+    requests in flight, and a pause whenever it answers 429 or 503. The
+    request is retried after the server's Retry-After, or after exponential
+    backoff, up to RETRIES times, and is given up once the wait would exceed
+    MAX_RETRY_WAIT. Other hosts are unaffected. Page fetches may also ask
+    for robots.txt to be honoured, including its Crawl-delay.
+    """
+
+    def __init__(self, max_connections: int = MAX_CONNECTIONS, max_per_host: int = MAX_PER_HOST,
+                 timeout: float = HTTP_TIMEOUT, http2: bool = HTTP2_AVAILABLE):
+        self.max_per_host = max_per_host
+        self._hosts = {}
+        self._robots = {}
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, name="fact-checker-http", daemon=True).start()
+        self._client = self._submit(self._create(max_connections, timeout, http2)).result()
+
+    async def _create(self, max_connections, timeout, http2):
+        transport = httpx.AsyncHTTPTransport(
+            http2=http2,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections,
+                                keepalive_expiry=60),
+            retries=1,
+        )
+        # httpx has no option for the network backend; wrap the one its pool uses
+        pool = getattr(transport, "_pool", None)
+        if hasattr(pool, "_network_backend"):
+            pool._network_backend = _CachingResolver(pool._network_backend)
+        return httpx.AsyncClient(transport=transport, timeout=timeout, follow_redirects=True,
+                                 headers={"User-Agent": USER_AGENT})
+
+    def _submit(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def _policy(self, host: str) -> HostPolicy:
+        policy = self._hosts.get(host)
+        if policy is None:
+            policy = self._hosts[host] = HostPolicy(max_concurrent=self.max_per_host)
+        return policy
+
+    async def _fetch_robots(self, origin: str, policy: HostPolicy) -> Robots:
+        try:
+            response = await self._send(policy, "GET", f"{origin}/robots.txt", None, None, ROBOTS_MAX_BYTES)
+        except httpx.HTTPError:
+            return Robots.unreachable()
+        robots = Robots.from_response(response.status_code, response.text)
+        delay = robots.crawl_delay(USER_AGENT)
+        if delay:
+            policy.bucket.slow_down(1 / delay)
+        return robots
+
+    async def _allowed(self, url: httpx.URL, policy: HostPolicy) -> bool:
+        origin = f"{url.scheme}://{url.netloc.decode('ascii')}"
+        task = self._robots.get(origin)
+        if task is None or (task.done() and task.result().expired):
+            task = self._robots[origin] = asyncio.ensure_future(self._fetch_robots(origin, policy))
+        robots = await asyncio.shield(task)
+        return robots.allows(USER_AGENT, str(url))
+
+    async def _request(self, method, url, headers, json, max_bytes, respect_robots) -> Response:
+        parsed = httpx.URL(url)
+        policy = self._policy(parsed.host)
+        if respect_robots and ROBOTS_ENABLED and not await self._allowed(parsed, policy):
+            raise RobotsDisallowed(f"robots.txt disallows {url}")
+        for attempt in range(RETRIES + 1):
+            response = await self._send(policy, method, url, headers, json, max_bytes)
+            if response.status_code not in (429, 503):
+                return response
+            record_http_event(f"throttled_{response.status_code}")
+            wait = retry_after(response.headers.get("Retry-After"), 2 ** attempt)
+            policy.pause(min(wait, MAX_RETRY_WAIT))
+            if wait > MAX_RETRY_WAIT:
+                break
+        return response
+
+    async def _send(self, policy, method, url, headers, json, max_bytes) -> Response:
+        async with policy.slots:
+            await policy.ready()
+            async with self._client.stream(method, url, headers=headers, json=json) as response:
+                chunks = []
+                size = 0
+                truncated = False
+                async for chunk in response.aiter_bytes():
+                    if size + len(chunk) > max_bytes:
+                        chunks.append(chunk[:max_bytes - size])
+                        truncated = True
+                        break
+                    chunks.append(chunk)
+                    size += len(chunk)
+                return Response(str(response.url), response.status_code, response.headers, b"".join(chunks),
+                                response.encoding, truncated, response.http_version)
+
+    def request(self, method: str, url: str, headers: Optional[dict] = None, json=None,
+                max_bytes: int = MAX_BODY_BYTES, respect_robots: bool = False) -> Response:
+        """Send a request from any thread and wait for the (possibly truncated) response.
+
+        Raises RobotsDisallowed when ``respect_robots`` is set and robots.txt
+        forbids the URL.
+        """
+        return self._submit(self._request(method, url, headers, json, max_bytes, respect_robots)).result()
+
+    async def arequest(self, method: str, url: str, headers: Optional[dict] = None, json=None,
+                       max_bytes: int = MAX_BODY_BYTES, respect_robots: bool = False) -> Response:
+        """Send a request from any event loop."""
+        return await asyncio.wrap_future(
+            self._submit(self._request(method, url, headers, json, max_bytes, respect_robots))
+        )
+
+    def get(self, url: str, **kwargs) -> Response:
+        return self.request("GET", url, **kwargs)
+
+    def head(self, url: str, **kwargs) -> Response:
+        return self.request("HEAD", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> Response:
+        return self.request("POST", url, **kwargs)
+
+
+@singleton
+def get_http_client() -> HttpClient:
+    """Return the HttpClient shared by the whole process."""
+    return HttpClient()
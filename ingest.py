@@ -0,0 +1,132 @@
+import codecs
+import contextvars
+import io
+import os
+import queue
+import threading
+from typing import Iterable, Iterator
+
+from .metrics import timed_iter
+
+SUPPORTED_SUFFIXES = (".pdf", ".docx", ".txt")
+TEXT_BLOCK_CHARS = 64 * 1024
+TEXT_SNIFF_BYTES = 8 * 1024
+PARALLEL_EXTRACT_MIN_BYTES = int(float(os.getenv("FACT_CHECKER_PARALLEL_EXTRACT_MB", 2)) * 1024 * 1024)
+
+
+class IngestError(Exception):
+    """Raised when an uploaded document cannot be read."""
+
+
+def iter_pdf_pages(source) -> Iterator[str]:
+    """Yield the text of each PDF page as it is parsed."""
+    import PyPDF2
+
+    try:
+        reader = PyPDF2.PdfReader(source)
+        for page in reader.pages:
+            yield page.extract_text() or ""
+    except PyPDF2.errors.PdfReadError as e:
+        raise IngestError(f"Unable to read PDF: {e}") from e
+
+
+def iter_docx_paragraphs(source) -> Iterator[str]:
+    from docx import Document
+
+    for paragraph in Document(source).paragraphs:
+        yield paragraph.text + "\n"
+
+
+def _text_encoding(head: bytes) -> str:
+    """Pick the encoding of a text file from its first bytes."""
+    if head.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    if head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return "utf-16"
+    if b"\x00" in head:
+        return "utf-16-le" if head[1::2].count(0) >= head[::2].count(0) else "utf-16-be"
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(head, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        return "latin-1"
+
+
+def iter_text(source, block_chars: int = TEXT_BLOCK_CHARS) -> Iterator[str]:
+    """Yield a text file in blocks of about ``block_chars``, decoding as it reads.
+
+    Blocks end at a line break, or at a space inside a very long line, so no
+    word is split between two of them.
+    """
+    if not hasattr(source, "peek"):
+        source = io.BufferedReader(source)
+    text = io.TextIOWrapper(source, encoding=_text_encoding(source.peek(TEXT_SNIFF_BYTES)[:TEXT_SNIFF_BYTES]),
+                            errors="replace", newline="")
+    pending = ""
+    while block := text.read(block_chars):
+        block = pending + block
+        cut = (block.rfind("\n") + 1) or (block.rfind(" ") + 1) or len(block)
+        yield block[:cut]
+        pending = block[cut:]
+    if pending:
+        yield pending
+
+
+def iter_document(source, suffix: str) -> Iterator[str]:
+    """Yield text segments of an uploaded document in reading order.
+
+    PDF and DOCX files are extracted on the process pool in ``extraction``,
+    under its per-file timeout; files of at least PARALLEL_EXTRACT_MIN_BYTES
+    are split into jobs across its workers. Extraction time is recorded as an
+    ``ingest`` span.
+    """
+    if suffix in (".pdf", ".docx"):
+        from .extraction import iter_docx, iter_pdf
+
+        split = source.seek(0, io.SEEK_END) >= PARALLEL_EXTRACT_MIN_BYTES
+        source.seek(0)
+        segments = iter_pdf(source, split=split) if suffix == ".pdf" else iter_docx(source, split=split)
+        return timed_iter("ingest", f"{suffix[1:]}_parallel" if split else suffix[1:], segments)
+    if suffix == ".txt":
+        return timed_iter("ingest", "txt", iter_text(source))
+    raise IngestError(f"Unsupported format: {suffix}")
+
+
+def prefetch(iterable: Iterable, maxsize: int = 2) -> Iterator:
+    """Run ``iterable`` on a background thread, at most ``maxsize`` items ahead.
+
+    Parsing later pages overlaps with whatever the consumer does with earlier
+    ones, and the bounded queue caps how much parsed text is held at once.
+    Exceptions from the producer are re-raised in the consumer. The producer
+    runs in a copy of the caller's context, so the current trace follows it.
+    """
+    done = object()
+    items = queue.Queue(maxsize=maxsize)
+    stop = threading.Event()
+
+    def produce():
+        try:
+            for item in iterable:
+                while not stop.is_set():
+                    try:
+                        items.put(item, timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+                if stop.is_set():
+                    return
+            items.put(done)
+        except BaseException as e:
+            items.put(e)
+
+    threading.Thread(target=contextvars.copy_context().run, args=(produce,), daemon=True).start()
+    try:
+        while True:
+            item = items.get()
+            if item is done:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
@@ -0,0 +1,340 @@
+import asyncio
+import atexit
+import json
+import multiprocessing
+import os
+import signal
+import sys
+import threading
+import time
+import traceback
+import uuid
+from contextlib import nullcontext
+from typing import NamedTuple, Optional
+
+from . import metrics
+from .checkpoints import resumed_run
+from .progress import ProgressEvent
+from .storage import CACHE_DIR, cache_path, connect, singleton
+
+JOB_WORKERS = int(os.getenv("FACT_CHECKER_JOB_WORKERS", 2))
+POLL_INTERVAL = float(os.getenv("FACT_CHECKER_JOB_POLL_INTERVAL", 0.5))
+UPLOAD_DIR = CACHE_DIR / "uploads"
+# Uploads of failed jobs are kept this long for a retry
+UPLOAD_MAX_AGE_HOURS = float(os.getenv("FACT_CHECKER_UPLOAD_MAX_AGE_HOURS", 24))
+# Finished jobs and their progress events are kept this long for the UI
+JOB_MAX_AGE_HOURS = float(os.getenv("FACT_CHECKER_JOB_MAX_AGE_HOURS", 7 * 24))
+PURGE_INTERVAL = 3600
+# A job whose worker died this many times is failed instead of requeued again
+MAX_ATTEMPTS = int(os.getenv("FACT_CHECKER_JOB_MAX_ATTEMPTS", 3))
+
+
+class Job(NamedTuple):
+    id: str
+    status: str
+    request: dict
+    result: Optional[dict]
+    error: Optional[str]
+    error_type: Optional[str]
+    created_at: float
+    started_at: Optional[float]
+    finished_at: Optional[float]
+
+    @property
+    def pending(self) -> bool:
+        return self.status in ("queued", "running")
+
+
+class JobQueue():
+    """Analysis jobs persisted in SQLite, shared by the UI and worker processes.
+
+    Jobs move from ``queued`` to ``running`` when a worker claims them and end
+    as ``done`` with a result payload or ``failed`` with an error message.
+    """
+
+    def __init__(self, path=None):
+        self._lock = threading.Lock()
+        self._conn = connect(path or cache_path("jobs"))
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                request TEXT NOT NULL,
+                result TEXT,
+                error TEXT,
+                error_type TEXT,
+                worker INTEGER,
+                created_at REAL NOT NULL,
+                started_at REAL,
+                finished_at REAL
+            );
+            CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at);
+            CREATE TABLE IF NOT EXISTS job_events (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                job_id TEXT NOT NULL,
+                event TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS job_events_job ON job_events (job_id, seq);
+        """)
+
+    def submit(self, request: dict) -> str:
+        """Queue an analysis request and return its job ID."""
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs (id, status, request, created_at) VALUES (?, 'queued', ?, ?)",
+                (job_id, json.dumps(request), time.time()),
+            )
+        return job_id
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id, status, request, result, error, error_type, created_at, started_at, finished_at "
+                "FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return Job(row[0], row[1], json.loads(row[2]), json.loads(row[3]) if row[3] else None, *row[4:])
+
+    def claim(self, worker: int) -> Optional[Job]:
+        """Atomically take the oldest queued job for ``worker``."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT id FROM jobs WHERE status = 'queued' ORDER BY created_at LIMIT 1"
+                ).fetchone()
+                if row is not None:
+                    self._conn.execute(
+                        "UPDATE jobs SET status = 'running', worker = ?, started_at = ? WHERE id = ?",
+                        (worker, time.time(), row[0]),
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return self.get(row[0]) if row else None
+
+    def finish(self, job_id: str, result: Optional[dict] = None, error: Optional[BaseException] = None):
+        status = "failed" if error is not None else "done"
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, error_type = ?, finished_at = ? WHERE id = ?",
+                (status, json.dumps(result) if result is not None else None,
+                 str(error) if error is not None else None,
+                 type(error).__name__ if error is not None else None,
+                 time.time(), job_id),
+            )
+
+    def add_event(self, job_id: str, event: ProgressEvent):
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO job_events (job_id, event) VALUES (?, ?)", (job_id, json.dumps(event))
+            )
+
+    def events(self, job_id: str, after: int = 0) -> list:
+        """Return ``(seq, ProgressEvent)`` pairs recorded for a job after ``seq``."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT seq, event FROM job_events WHERE job_id = ? AND seq > ? ORDER BY seq", (job_id, after)
+            ).fetchall()
+        return [(seq, ProgressEvent(*json.loads(event))) for seq, event in rows]
+
+    def requeue_orphans(self) -> int:
+        """Put back jobs left ``running`` by worker processes that no longer exist.
+
+        Requeued jobs are marked ``resume`` to pick up from their checkpoints.
+        A job that has already taken down MAX_ATTEMPTS workers is failed
+        instead, so it cannot crash workers forever. Returns the number of
+        jobs requeued.
+        """
+        with self._lock:
+            rows = self._conn.execute("SELECT id, worker, request FROM jobs WHERE status = 'running'").fetchall()
+            orphans = [(job_id, json.loads(request)) for job_id, pid, request in rows if not _alive(pid)]
+            requeued = [(job_id, dict(request, resume=True, attempts=request.get("attempts", 1) + 1))
+                        for job_id, request in orphans if request.get("attempts", 1) < MAX_ATTEMPTS]
+            failed = [job_id for job_id, request in orphans if request.get("attempts", 1) >= MAX_ATTEMPTS]
+            self._conn.executemany("DELETE FROM job_events WHERE job_id = ?", [(job_id,) for job_id, _ in requeued])
+            self._conn.executemany(
+                "UPDATE jobs SET status = 'queued', worker = NULL, started_at = NULL, request = ? WHERE id = ?",
+                [(json.dumps(request), job_id) for job_id, request in requeued],
+            )
+            self._conn.executemany(
+                "UPDATE jobs SET status = 'failed', error = ?, error_type = 'WorkerCrash', finished_at = ? "
+                "WHERE id = ?",
+                [(f"The worker running this job exited {MAX_ATTEMPTS} times", time.time(), job_id)
+                 for job_id in failed],
+            )
+        return len(requeued)
+
+    def purge(self, max_age: float = JOB_MAX_AGE_HOURS * 3600) -> int:
+        """Delete jobs that finished more than ``max_age`` seconds ago, with their events."""
+        cutoff = time.time() - max_age
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "DELETE FROM job_events WHERE job_id IN "
+                    "(SELECT id FROM jobs WHERE status IN ('done', 'failed') AND finished_at < ?)", (cutoff,)
+                )
+                removed = self._conn.execute(
+                    "DELETE FROM jobs WHERE status IN ('done', 'failed') AND finished_at < ?", (cutoff,)
+                ).rowcount
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return removed
+
+
+def _alive(pid) -> bool:
+    try:
+        os.kill(pid, 0)
+    except (OSError, TypeError):
+        return False
+    return True
+
+
+@singleton
+def get_job_queue() -> JobQueue:
+    """Return the JobQueue shared by the whole process."""
+    return JobQueue()
+
+
+def save_upload(name: str, data: bytes) -> str:
+    """Write an uploaded document where worker processes can read it."""
+    UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+    path = UPLOAD_DIR / f"{uuid.uuid4().hex}{os.path.splitext(name)[1].lower()}"
+    path.write_bytes(data)
+    return str(path)
+
+
+def purge_uploads(max_age: float = UPLOAD_MAX_AGE_HOURS * 3600) -> int:
+    """Delete uploads older than ``max_age`` seconds, left behind by jobs nobody retried."""
+    cutoff = time.time() - max_age
+    removed = 0
+    for entry in os.scandir(UPLOAD_DIR) if UPLOAD_DIR.exists() else ():
+        try:
+            if entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+                removed += 1
+        except OSError:
+            pass
+    return removed
+
+
+def result_payload(result, trace=None) -> dict:
+    """JSON-serializable form of a pipeline result."""
+    from .verdict_store import StoredVerdict
+    from .web_cache import get_web_cache
+
+    run = result.run if isinstance(result, StoredVerdict) else result
+    payload = {"run": run.to_dict(), "web_cache": get_web_cache().stats()}
+    if trace is not None:
+        payload["trace"] = trace.summary()
+    if isinstance(result, StoredVerdict):
+        payload["stored"] = {"claim": result.claim, "similarity": result.similarity, "stored_at": result.stored_at}
+    return payload
+
+
+def work(stop: Optional[threading.Event] = None):
+    """Claim and run jobs until ``stop`` is set.
+
+    The crews are built before the first job is claimed so every job runs on
+    a warm factory. Progress events of the running job are recorded as they
+    happen, for the UI to render while the job is still running. Each job is
+    traced, and the worker's metrics file is refreshed after every job.
+
+    Jobs whose request is marked ``resume``, retries and requeued jobs,
+    restore the tasks an earlier attempt checkpointed. An uploaded document
+    is deleted once its job succeeds; a failed job keeps
+    it for a retry until ``purge_uploads`` finds it stale. Stale uploads and
+    old finished jobs are purged at startup and every PURGE_INTERVAL seconds.
+
+    A job that fails, including while its result is serialized or stored,
+    is marked ``failed`` rather than taking the worker down with it.
+    """
+    from . import pipeline
+    from .factory import get_factory
+
+    factory = get_factory()
+    for name in ('analysis_crew', 'routed_analysis_crew', 'claim_extraction_crew', 'claim_verification_crew'):
+        factory.crew(name)
+
+    queue = get_job_queue()
+    pid = os.getpid()
+    purged_at = 0.0
+    while stop is None or not stop.is_set():
+        if time.monotonic() - purged_at >= PURGE_INTERVAL:
+            purge_uploads()
+            queue.purge()
+            purged_at = time.monotonic()
+        job = queue.claim(pid)
+        if job is None:
+            time.sleep(POLL_INTERVAL)
+            continue
+        try:
+            with metrics.run_trace(job.id, job.request) as trace, \
+                    resumed_run() if job.request.get("resume") else nullcontext():
+                result = asyncio.run(pipeline.run_request_async(
+                    job.request, lambda event, job_id=job.id: queue.add_event(job_id, event)
+                ))
+            queue.finish(job.id, result=result_payload(result, trace))
+        except Exception as e:
+            traceback.print_exc()
+            queue.finish(job.id, error=e)
+        else:
+            if job.request.get("document_path"):
+                try:
+                    os.remove(job.request["document_path"])
+                except OSError:
+                    pass
+        finally:
+            metrics.write_textfile()
+
+
+def _worker_main():
+    # Exit through SystemExit on terminate() so the worker's own extraction pool is shut down too
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    work()
+
+
+class WorkerPool():
+    """A fixed number of local worker processes running ``work``.
+
+    Workers are not daemonic, since a daemonic process may not start the
+    extraction pool, so the pool stops them itself when the server exits.
+    """
+
+    def __init__(self, size: int = JOB_WORKERS):
+        self.size = size
+        self._processes = []
+        self._context = multiprocessing.get_context("spawn")
+        # Streamlit runs each session's script on its own thread
+        self._lock = threading.Lock()
+
+    def start(self):
+        get_job_queue().requeue_orphans()
+        atexit.register(self.stop)
+        self.ensure_running()
+
+    def ensure_running(self):
+        """Replace workers that have exited, requeueing the jobs they held."""
+        with self._lock:
+            alive = [p for p in self._processes if p.is_alive()]
+            if len(alive) < len(self._processes):
+                get_job_queue().requeue_orphans()
+            self._processes = alive
+            while len(self._processes) < self.size:
+                process = self._context.Process(target=_worker_main, daemon=False, name="fact-checker-worker")
+                process.start()
+                self._processes.append(process)
+
+    def stop(self):
+        with self._lock:
+            for process in self._processes:
+                process.terminate()
+            for process in self._processes:
+                process.join()
+            self._processes = []
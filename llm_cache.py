@@ -0,0 +1,123 @@
+import hashlib
+import inspect
+import json
+import os
+from typing import Any, Optional
+
+from crewai import LLM
+from crewai.utilities.llm_utils import create_llm
+
+from .storage import SqliteCache, singleton
+
+# "0" (default) disables the cache, "1" caches every text completion, and
+# "deterministic" pins temperature 0 and a seed and only reuses responses
+# recorded in that mode
+LLM_CACHE_MODE = os.getenv("FACT_CHECKER_LLM_CACHE", "0").strip().lower()
+LLM_CACHE_ENABLED = LLM_CACHE_MODE not in ("", "0", "off", "false")
+LLM_CACHE_DETERMINISTIC = LLM_CACHE_MODE == "deterministic"
+LLM_CACHE_TTL = float(os.getenv("FACT_CHECKER_LLM_CACHE_TTL", 7 * 86400))
+LLM_CACHE_MAX_MB = float(os.getenv("FACT_CHECKER_LLM_CACHE_MB", 256))
+# Bump to drop every cached response, e.g. after changing agent prompts by hand
+LLM_CACHE_NAMESPACE = os.getenv("FACT_CHECKER_LLM_CACHE_NAMESPACE", "1")
+LLM_SEED = int(os.getenv("FACT_CHECKER_LLM_SEED", 0))
+
+
+def _normalize(text) -> str:
+    return " ".join(str(text or "").split())
+
+
+def _digest(value) -> str:
+    return hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def prompt_key(llm: LLM, messages, deterministic: bool = LLM_CACHE_DETERMINISTIC) -> str:
+    """Cache key of a completion request.
+
+    Covers the model and sampling settings, and the whitespace-normalized
+    prompt split into the agent's instructions and a hash per later turn,
+    so a changed tool result anywhere in the conversation is a different
+    request.
+    """
+    if isinstance(messages, str):
+        messages = [{"role": "user", "content": messages}]
+    turns = [(m.get("role"), _digest(_normalize(m.get("content")))) for m in messages]
+    return _digest({
+        "namespace": LLM_CACHE_NAMESPACE,
+        "deterministic": deterministic,
+        "model": llm.model,
+        "settings": [llm.temperature, llm.top_p, llm.seed, llm.max_tokens, llm.max_completion_tokens,
+                     sorted(llm.stop or []), getattr(llm.response_format, "__name__", llm.response_format)],
+        "turns": turns,
+    })
+
+
+class LLMCache(SqliteCache):
+    """Completions keyed by prompt_key(), with a TTL and LRU size cap."""
+
+    def __init__(self, ttl=LLM_CACHE_TTL, max_bytes=int(LLM_CACHE_MAX_MB * 1024 * 1024), path=None):
+        super().__init__("llm", ttl=ttl, max_bytes=max_bytes, path=path)
+
+    def load(self, key: str) -> Optional[str]:
+        entry = self.get(key)
+        return entry.value if entry else None
+
+    def save(self, key: str, response: str, model: str, deterministic: bool = LLM_CACHE_DETERMINISTIC):
+        self.set(key, response, {"model": model, "deterministic": deterministic})
+
+
+@singleton
+def get_llm_cache() -> LLMCache:
+    """Return the LLMCache shared by the whole process."""
+    return LLMCache()
+
+
+class CachedLLM(LLM):
+    """crewAI LLM that replays stored responses to identical prompts.
+
+    Only plain text completions are cached. Native function-calling requests
+    (``tools``/``available_functions``) run their tools inside the call, so
+    they always go to the model. In ``deterministic`` mode the model runs at
+    temperature 0 with a fixed seed, and only responses recorded in that mode
+    are replayed.
+    """
+
+    def __init__(self, *args, deterministic: bool = LLM_CACHE_DETERMINISTIC, **kwargs):
+        if deterministic:
+            kwargs.update(temperature=0, seed=LLM_SEED)
+        super().__init__(*args, **kwargs)
+        self.deterministic = deterministic
+
+    def call(self, messages, tools: Optional[list] = None, callbacks: Optional[list] = None,
+             available_functions: Optional[dict] = None, from_task: Any = None, from_agent: Any = None):
+        if tools or available_functions:
+            return super().call(messages, tools, callbacks, available_functions, from_task, from_agent)
+        cache = get_llm_cache()
+        key = prompt_key(self, messages, self.deterministic)
+        response = cache.load(key)
+        if response is not None:
+            return response
+        response = super().call(messages, tools, callbacks, available_functions, from_task, from_agent)
+        if isinstance(response, str) and response.strip():
+            cache.save(key, response, self.model, self.deterministic)
+        return response
+
+
+def _init_params(llm: LLM) -> dict:
+    """Constructor arguments that rebuild ``llm``."""
+    names = [name for name, parameter in inspect.signature(LLM.__init__).parameters.items()
+             if name != "self" and parameter.kind is not parameter.VAR_KEYWORD and hasattr(llm, name)]
+    return {**(llm.additional_params or {}), **{name: getattr(llm, name) for name in names}}
+
+
+def cached_llm(model=None, deterministic: bool = LLM_CACHE_DETERMINISTIC) -> CachedLLM:
+    """A CachedLLM set up the way crewAI would set up ``model``, or the model from the environment."""
+    # create_llm resolves MODEL, API base and keys from the environment; build the
+    # caching subclass from its settings rather than repeating that resolution here
+    return CachedLLM(deterministic=deterministic, **_init_params(create_llm(model)))
+
+
+def agent_llm(config: dict):
+    """LLM argument for an agent built from ``config``: a CachedLLM when the cache is enabled."""
+    if not LLM_CACHE_ENABLED:
+        return config.get('llm')
+    return cached_llm(config.get('llm'))
@@ -66,3 +66,22 @@ def test():
 
     except Exception as e:
         raise Exception(f"An error occurred while testing the crew: {e}")
+
+def batch():
+    """
+    Fact-check every claim or URL in a JSONL or CSV file.
+    """
+    from fact_checker import batch as batch_runner
+
+    batch_runner.main(sys.argv[1:])
+
+def worker():
+    """
+    Run a background worker that processes queued analysis jobs.
+    """
+    from fact_checker import jobs
+
+    try:
+        jobs.work()
+    except KeyboardInterrupt:
+        pass
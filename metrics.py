@@ -0,0 +1,370 @@
+import contextvars
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+METRICS_ENABLED = os.getenv("FACT_CHECKER_METRICS", "1") != "0"
+PROMPT_COST_PER_1K = float(os.getenv("FACT_CHECKER_PROMPT_COST_PER_1K", 0))
+COMPLETION_COST_PER_1K = float(os.getenv("FACT_CHECKER_COMPLETION_COST_PER_1K", 0))
+
+BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+
+HELP = {
+    "fact_checker_stage_seconds": ("histogram", "Wall time of tasks, tool calls, LLM calls and document extraction"),
+    "fact_checker_stage_errors_total": ("counter", "Tasks, tool calls, LLM calls and extractions that raised"),
+    "fact_checker_tokens_total": ("counter", "LLM tokens used per crew, by direction"),
+    "fact_checker_retries_total": ("counter", "Tool attempts beyond the first"),
+    "fact_checker_cache_requests_total": ("counter", "Cache lookups per store, by result"),
+    "fact_checker_http_wait_seconds": ("histogram", "Time outbound requests waited on host rate limits and Retry-After pauses"),
+    "fact_checker_http_events_total": ("counter", "Outbound requests throttled by servers or refused by robots.txt"),
+}
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(labels) -> str:
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels) + "}" if labels else ""
+
+
+class Registry():
+    """In-process counters and histograms rendered in the Prometheus text format."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._histograms = {}
+
+    def inc(self, metric: str, value: float = 1, **labels):
+        key = (metric, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, metric: str, value: float, **labels):
+        key = (metric, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = [[0] * len(BUCKETS), 0.0, 0]
+            for i, bound in enumerate(BUCKETS):
+                if value <= bound:
+                    histogram[0][i] += 1
+            histogram[1] += value
+            histogram[2] += 1
+
+    def render(self) -> str:
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted((k, (list(v[0]), v[1], v[2])) for k, v in self._histograms.items())
+        lines = []
+        described = set()
+
+        def describe(name):
+            if name not in described and name in HELP:
+                kind, text = HELP[name]
+                lines.extend([f"# HELP {name} {text}", f"# TYPE {name} {kind}"])
+                described.add(name)
+
+        for (name, labels), value in counters:
+            describe(name)
+            lines.append(f"{name}{_labels(labels)} {value:g}")
+        for (name, labels), (buckets, total, count) in histograms:
+            describe(name)
+            for bound, hits in zip(BUCKETS, buckets):
+                lines.append(f"{name}_bucket{_labels(labels + (('le', f'{bound:g}'),))} {hits}")
+            lines.append(f"{name}_bucket{_labels(labels + (('le', '+Inf'),))} {count}")
+            lines.append(f"{name}_sum{_labels(labels)} {total:.6f}")
+            lines.append(f"{name}_count{_labels(labels)} {count}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+
+class Trace():
+    """Spans and counters of one analysis run, written out as JSON."""
+
+    def __init__(self, trace_id: str, request: Optional[dict] = None):
+        self.id = trace_id
+        self.request = request or {}
+        self.started_at = time.time()
+        self.finished_at = None
+        self.spans = []
+        self.tokens = {"prompt": 0, "completion": 0}
+        self.cache = {}
+        self.retries = 0
+        self._lock = threading.Lock()
+
+    def add(self, span: dict):
+        with self._lock:
+            self.spans.append(span)
+
+    def summary(self) -> dict:
+        """Wall time per span kind plus token, cost, retry and cache totals.
+
+        Cost uses the per-1K-token prices in FACT_CHECKER_PROMPT_COST_PER_1K
+        and FACT_CHECKER_COMPLETION_COST_PER_1K.
+        """
+        with self._lock:
+            by_kind = {}
+            for span in self.spans:
+                by_kind[span["kind"]] = round(by_kind.get(span["kind"], 0) + span["seconds"], 3)
+            return {
+                "wall_seconds": round((self.finished_at or time.time()) - self.started_at, 3),
+                "seconds_by_kind": by_kind,
+                "tokens": dict(self.tokens),
+                "cost": round(self.tokens["prompt"] / 1000 * PROMPT_COST_PER_1K
+                              + self.tokens["completion"] / 1000 * COMPLETION_COST_PER_1K, 6),
+                "retries": self.retries,
+                "cache": {name: dict(counts) for name, counts in self.cache.items()},
+            }
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            spans = list(self.spans)
+        return dict(self.summary(), id=self.id, request=self.request, started_at=self.started_at, spans=spans)
+
+
+_trace: contextvars.ContextVar[Optional[Trace]] = contextvars.ContextVar("metrics_trace", default=None)
+_installed = False
+_install_lock = threading.Lock()
+
+
+def _dir(env, name) -> Path:
+    from .storage import CACHE_DIR
+
+    return Path(os.getenv(env, CACHE_DIR / name))
+
+
+@contextmanager
+def run_trace(trace_id: str, request: Optional[dict] = None):
+    """Collect a Trace for everything run in this context and save it as JSON.
+
+    Traces are written to FACT_CHECKER_TRACE_DIR (default ``<cache>/traces``).
+    Yields ``None`` when metrics are disabled.
+    """
+    if not METRICS_ENABLED:
+        yield None
+        return
+    _install()
+    trace = Trace(trace_id, request)
+    token = _trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _trace.reset(token)
+        trace.finished_at = time.time()
+        trace_dir = _dir("FACT_CHECKER_TRACE_DIR", "traces")
+        trace_dir.mkdir(parents=True, exist_ok=True)
+        (trace_dir / f"{trace_id}.json").write_text(json.dumps(trace.to_dict(), default=str), encoding="utf-8")
+
+
+def record(kind: str, name: str, seconds: float, error: Optional[str] = None, **attrs):
+    """Record one finished span in the registry and the current trace."""
+    if not METRICS_ENABLED:
+        return
+    REGISTRY.observe("fact_checker_stage_seconds", seconds, kind=kind, name=name)
+    if error is not None:
+        REGISTRY.inc("fact_checker_stage_errors_total", kind=kind, name=name)
+    trace = _trace.get()
+    if trace is not None:
+        span = dict(kind=kind, name=name, seconds=round(seconds, 4), ended_at=time.time(), **attrs)
+        if error is not None:
+            span["error"] = error
+        trace.add(span)
+
+
+@contextmanager
+def span(kind: str, name: str, **attrs):
+    """Time the enclosed block as a span."""
+    if not METRICS_ENABLED:
+        yield
+        return
+    started = time.perf_counter()
+    error = None
+    try:
+        yield
+    except BaseException as e:
+        error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        record(kind, name, time.perf_counter() - started, error, **attrs)
+
+
+def timed_iter(kind: str, name: str, iterable: Iterable) -> Iterator:
+    """Iterate ``iterable``, recording the time spent producing items as one span.
+
+    Time the consumer spends between items is not counted, so a streamed
+    document's extraction time is measured apart from what is done with it.
+    """
+    if not METRICS_ENABLED:
+        return iter(iterable)
+    return _timed(kind, name, iter(iterable))
+
+
+def _timed(kind, name, iterator):
+    busy = 0.0
+    items = 0
+    error = None
+    try:
+        while True:
+            started = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                busy += time.perf_counter() - started
+                return
+            except BaseException as e:
+                busy += time.perf_counter() - started
+                error = f"{type(e).__name__}: {e}"
+                raise
+            busy += time.perf_counter() - started
+            items += 1
+            yield item
+    finally:
+        record(kind, name, busy, error, items=items)
+
+
+def record_tokens(crew: str, usage):
+    """Add a crew kickoff's token usage (crewAI UsageMetrics) to the counters."""
+    if not METRICS_ENABLED or usage is None:
+        return
+    prompt = getattr(usage, "prompt_tokens", 0) or 0
+    completion = getattr(usage, "completion_tokens", 0) or 0
+    REGISTRY.inc("fact_checker_tokens_total", prompt, crew=crew, direction="prompt")
+    REGISTRY.inc("fact_checker_tokens_total", completion, crew=crew, direction="completion")
+    trace = _trace.get()
+    if trace is not None:
+        with trace._lock:
+            trace.tokens["prompt"] += prompt
+            trace.tokens["completion"] += completion
+
+
+def record_cache(cache: str, hit: bool):
+    if not METRICS_ENABLED:
+        return
+    result = "hit" if hit else "miss"
+    REGISTRY.inc("fact_checker_cache_requests_total", cache=cache, result=result)
+    trace = _trace.get()
+    if trace is not None:
+        with trace._lock:
+            counts = trace.cache.setdefault(cache, {"hit": 0, "miss": 0})
+            counts[result] += 1
+
+
+def record_http_wait(reason: str, seconds: float):
+    if METRICS_ENABLED and seconds > 0:
+        REGISTRY.observe("fact_checker_http_wait_seconds", seconds, reason=reason)
+
+
+def record_http_event(event: str):
+    if METRICS_ENABLED:
+        REGISTRY.inc("fact_checker_http_events_total", event=event)
+
+
+def _record_retries(tool: str, attempts):
+    if attempts and attempts > 1:
+        REGISTRY.inc("fact_checker_retries_total", attempts - 1, tool=tool)
+        trace = _trace.get()
+        if trace is not None:
+            with trace._lock:
+                trace.retries += attempts - 1
+
+
+def _install():
+    """Register crewAI event bus handlers for task, tool and LLM spans, once per process."""
+    global _installed
+    with _install_lock:
+        if _installed:
+            return
+        from crewai.events import (
+            LLMCallCompletedEvent,
+            LLMCallFailedEvent,
+            LLMCallStartedEvent,
+            TaskCompletedEvent,
+            TaskFailedEvent,
+            TaskStartedEvent,
+            ToolUsageErrorEvent,
+            ToolUsageFinishedEvent,
+            crewai_event_bus,
+        )
+
+        task_starts = {}
+        llm_starts = {}
+
+        def task_name(task):
+            return getattr(task, "name", None) or "task"
+
+        def agent_role(task):
+            return str(getattr(getattr(task, "agent", None), "role", "") or "").strip()
+
+        @crewai_event_bus.on(TaskStartedEvent)
+        def on_task_started(source, event):
+            task_starts[id(event.task)] = time.perf_counter()
+
+        def task_finished(event, error=None):
+            started = task_starts.pop(id(event.task), None)
+            if started is not None:
+                record("task", task_name(event.task), time.perf_counter() - started, error,
+                       agent=agent_role(event.task))
+
+        @crewai_event_bus.on(TaskCompletedEvent)
+        def on_task_completed(source, event):
+            task_finished(event)
+
+        @crewai_event_bus.on(TaskFailedEvent)
+        def on_task_failed(source, event):
+            task_finished(event, event.error)
+
+        @crewai_event_bus.on(ToolUsageFinishedEvent)
+        def on_tool_finished(source, event):
+            record("tool", event.tool_name, (event.finished_at - event.started_at).total_seconds(),
+                   agent=event.agent_role, from_cache=event.from_cache, attempts=event.run_attempts)
+            _record_retries(event.tool_name, event.run_attempts)
+
+        @crewai_event_bus.on(ToolUsageErrorEvent)
+        def on_tool_error(source, event):
+            record("tool", event.tool_name, 0.0, str(event.error), agent=event.agent_role)
+            _record_retries(event.tool_name, event.run_attempts)
+
+        @crewai_event_bus.on(LLMCallStartedEvent)
+        def on_llm_started(source, event):
+            llm_starts.setdefault(threading.get_ident(), []).append(time.perf_counter())
+
+        def llm_finished(event, error=None):
+            stack = llm_starts.get(threading.get_ident())
+            if stack:
+                record("llm", event.model or "llm", time.perf_counter() - stack.pop(), error,
+                       task=event.task_name, agent=event.agent_role)
+
+        @crewai_event_bus.on(LLMCallCompletedEvent)
+        def on_llm_completed(source, event):
+            llm_finished(event)
+
+        @crewai_event_bus.on(LLMCallFailedEvent)
+        def on_llm_failed(source, event):
+            llm_finished(event, event.error)
+
+        _installed = True
+
+
+def write_textfile() -> Optional[Path]:
+    """Write this process's metrics for the Prometheus node exporter textfile collector.
+
+    Each process writes its own ``fact_checker_<pid>.prom`` file under
+    FACT_CHECKER_METRICS_DIR (default ``<cache>/metrics``).
+    """
+    if not METRICS_ENABLED:
+        return None
+    metrics_dir = _dir("FACT_CHECKER_METRICS_DIR", "metrics")
+    metrics_dir.mkdir(parents=True, exist_ok=True)
+    path = metrics_dir / f"fact_checker_{os.getpid()}.prom"
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(REGISTRY.render(), encoding="utf-8")
+    os.replace(tmp, path)
+    return path
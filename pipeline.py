@@ -0,0 +1,198 @@
+import asyncio
+import contextvars
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from .chunking import CHUNK_TOKENS, chunk_stream, chunk_text, count_tokens
+from .claim_index import get_claim_index
+from .evidence_index import excluding_sources
+from .factory import get_factory
+from .ingest import iter_document, prefetch
+from .metrics import record_tokens
+from .progress import emit, listen
+from .router import ROUTER_ENABLED, classify, fetch, source_urls
+from .verdict_store import get_verdict_store
+from .verdicts import ClaimVerdict
+from .verification import VerificationRun, merge_claims, parse_claims, verdict_markdown, verify_claims
+
+VERIFICATION_WORKERS = int(os.getenv("FACT_CHECKER_VERIFY_WORKERS", "8"))
+EXTRACTION_WORKERS = int(os.getenv("FACT_CHECKER_EXTRACT_WORKERS", "4"))
+
+
+def _claim_inputs(claim, input_content):
+    return {
+        "input_content": input_content,
+        "claim_id": str(claim["id"]),
+        "claim_text": str(claim["text"]),
+        "claim_context": str(claim.get("context") or "None provided"),
+    }
+
+
+def _claim_verdict(output, claim) -> ClaimVerdict:
+    """The validated verdict of a verification crew run, tied back to ``claim``.
+
+    crewAI converts the task output to ClaimVerdict; if the model's answer
+    could not be converted, the claim is recorded as UNVERIFIABLE with the raw
+    answer as explanation rather than guessed from its wording.
+    """
+    verdict = output.pydantic
+    if not isinstance(verdict, ClaimVerdict):
+        verdict = ClaimVerdict(claim_id=str(claim["id"]), claim=str(claim["text"]), verdict="UNVERIFIABLE",
+                               confidence=0.0, explanation=output.raw)
+    return verdict.model_copy(update={"claim_id": str(claim["id"]), "claim": str(claim["text"])})
+
+
+def _verify(claims, input_content, max_workers):
+    factory = get_factory()
+
+    def verify(claim):
+        crew = factory.crew('claim_verification_crew')
+        output = crew.kickoff(inputs=_claim_inputs(claim, input_content or claim["text"]))
+        record_tokens('claim_verification_crew', output.token_usage)
+        verdict = _claim_verdict(output, claim)
+        emit("finding", "Verification", claim["text"], verdict_markdown(verdict))
+        return verdict
+
+    emit("stage", "Verification", f"Verifying {len(claims)} claims", count=len(claims))
+    return verify_claims(claims, verify, max_workers or VERIFICATION_WORKERS)
+
+
+def run(input_content, max_workers=None, routed=False):
+    """Fact-check ``input_content`` with claims verified concurrently.
+
+    Research and claim extraction run once, then every extracted claim is
+    verified by its own single-task crew on a bounded worker pool, so wall
+    time follows the slowest claim rather than the sum of all claims. If the
+    analyzer output has no parsable claim list, the input is verified as a
+    single claim with the analysis as its context.
+
+    ``routed`` marks ``input_content`` as content the input router already
+    fetched, or as a text claim: claims are then extracted by an analyzer
+    without tools and the research step is skipped.
+
+    Text longer than the chunk token budget goes through ``run_chunks``.
+    """
+    if count_tokens(input_content) > CHUNK_TOKENS:
+        return run_chunks(chunk_text(input_content), max_workers)
+    factory = get_factory()
+    crew_name = 'routed_analysis_crew' if routed else 'analysis_crew'
+    emit("stage", "Analysis", "Extracting claims" if routed else "Researching and extracting claims")
+    analysis = factory.crew(crew_name).kickoff(inputs={"input_content": input_content})
+    record_tokens(crew_name, analysis.token_usage)
+    analysis_text = analysis.tasks_output[-1].raw if analysis.tasks_output else str(analysis)
+    claims = parse_claims(analysis_text) or [
+        {"id": "claim_001", "text": input_content, "context": analysis_text}
+    ]
+    emit("finding", "Analysis", "Content analysis", analysis_text)
+    results = _verify(claims, input_content, max_workers)
+    return VerificationRun(analysis=analysis_text, results=results)
+
+
+def run_chunks(chunks, max_workers=None, extract_workers=None):
+    """Fact-check a document delivered as an iterator of text chunks.
+
+    ``chunks`` are strings or ``chunking.Chunk`` tuples. Claim extraction starts on each chunk as soon as it is produced, with at
+    most ``extract_workers`` chunks in flight, so a long document is never held
+    in memory as a whole and parsing of later pages overlaps extraction of
+    earlier ones. The merged, de-duplicated claims are then verified
+    concurrently as in ``run``.
+    """
+    factory = get_factory()
+    extract_workers = extract_workers or EXTRACTION_WORKERS
+
+    def extract(chunk):
+        text = getattr(chunk, "text", chunk)
+        output = factory.crew('claim_extraction_crew').kickoff(inputs={"input_content": text})
+        record_tokens('claim_extraction_crew', output.token_usage)
+        claims = parse_claims(output.raw)
+        emit("finding", "Extraction", f"Chunk {getattr(chunk, 'index', 0) + 1}: {len(claims)} claims",
+             "\n".join(f"- {claim['text']}" for claim in claims))
+        return claims
+
+    emit("stage", "Extraction", "Extracting claims from document chunks")
+    futures = []
+    with ThreadPoolExecutor(max_workers=extract_workers) as pool:
+        for chunk in chunks:
+            pending = [f for f in futures if not f.done()]
+            if len(pending) >= extract_workers:
+                wait(pending, return_when=FIRST_COMPLETED)
+            futures.append(pool.submit(contextvars.copy_context().run, extract, chunk))
+    claims = merge_claims(f.result() for f in futures)
+    analysis = f"Extracted {len(claims)} distinct claims from {len(futures)} document chunks."
+    return VerificationRun(analysis=analysis, results=_verify(claims, None, max_workers))
+
+
+def run_request(request):
+    """Run one analysis request from the UI, the job queue or the batch runner.
+
+    ``request`` carries ``input_content``, the input ``kind`` (see
+    ``router.KINDS``) and, depending on it, ``claim`` and ``bypass_cache`` for
+    text claims or ``document_path`` and ``suffix`` for uploaded documents.
+    URL and YouTube input is fetched by the input router before any crew runs,
+    unless the router is disabled or the fetch fails, in which case the
+    research agent gets the URL.
+
+    The fetched page or video is kept out of evidence searches for this
+    request, so claims are never confirmed by the source they came from.
+    """
+    if request.get("document_path"):
+        with open(request["document_path"], "rb") as f:
+            return run_chunks(chunk_stream(prefetch(iter_document(f, request["suffix"]))))
+    if request.get("claim"):
+        return check_claim(request["claim"], bypass_cache=request.get("bypass_cache", False))
+    route = classify(request)
+    with excluding_sources(source_urls(route)):
+        if ROUTER_ENABLED:
+            if route.kind in ("url", "youtube"):
+                emit("stage", "Routing", f"Fetching {route.source}")
+            fetched = fetch(route)
+            if fetched is not None:
+                return run(fetched.content, routed=True)
+        return run(route.source)
+
+
+async def run_request_async(request, on_event=None):
+    """asyncio entry point for ``run_request`` that streams progress events.
+
+    The crews run on a worker thread while ``on_event`` is called on the event
+    loop with each ``progress.ProgressEvent``: stage changes, crewAI task and
+    tool starts and finishes, and partial findings such as the analysis and
+    each verified claim as soon as they exist.
+    """
+    if on_event is None:
+        return await asyncio.to_thread(run_request, request)
+    loop = asyncio.get_running_loop()
+
+    def forward(event):
+        loop.call_soon_threadsafe(on_event, event)
+
+    with listen(forward):
+        return await asyncio.to_thread(run_request, request)
+
+
+def check_claim(claim, bypass_cache=False, max_age=None):
+    """Fact-check a text claim, reusing the stored report for a claim seen before.
+
+    An exact fingerprint match is tried first, then claims from the claim
+    index that pass ``same_claim``; claims that merely share words with a
+    stored one are verified afresh. ``max_age`` overrides the store's freshness window in seconds
+    and ``bypass_cache`` forces a fresh run; either way the new report is
+    stored and indexed.
+    """
+    store = get_verdict_store()
+    index = get_claim_index()
+    if not bypass_cache:
+        stored = store.lookup(claim, max_age)
+        if stored is None:
+            for match in index.query(claim):
+                if not match.duplicate:
+                    continue
+                stored = store.lookup(match.claim, max_age)
+                if stored is not None:
+                    stored.similarity = match.similarity
+                    break
+        if stored is not None:
+            return stored
+    result = run(claim, routed=ROUTER_ENABLED)
+    store.remember(claim, result)
+    index.add(claim)
+    return result
@@ -0,0 +1,140 @@
+import asyncio
+import email.utils
+import os
+import time
+from typing import Optional
+from urllib.robotparser import RobotFileParser
+
+from .metrics import record_http_event, record_http_wait
+
+HOST_RATE = float(os.getenv("FACT_CHECKER_HOST_RATE", 5))
+HOST_BURST = int(os.getenv("FACT_CHECKER_HOST_BURST", 10))
+MAX_PER_HOST = int(os.getenv("FACT_CHECKER_HTTP_MAX_PER_HOST", 6))
+ROBOTS_ENABLED = os.getenv("FACT_CHECKER_ROBOTS", "1") != "0"
+ROBOTS_TTL = float(os.getenv("FACT_CHECKER_ROBOTS_TTL", 24 * 3600))
+ROBOTS_ERROR_TTL = 600.0
+
+
+def retry_after(value: Optional[str], default: float) -> float:
+    """Seconds to wait according to a Retry-After header (delta seconds or HTTP date)."""
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return default
+
+
+class TokenBucket():
+    """Token bucket refilled at ``rate`` tokens per second up to ``burst``.
+
+    ``reserve()`` always takes a token, letting the balance go negative, and
+    returns how long the caller must wait for it. Waiters are therefore spaced
+    1/rate apart instead of racing each other when tokens come back. A rate of
+    0 disables the limit.
+    """
+
+    def __init__(self, rate: float = HOST_RATE, burst: int = HOST_BURST):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+
+    def reserve(self) -> float:
+        if self.rate <= 0:
+            return 0.0
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate) - 1
+        self.updated = now
+        return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+    def slow_down(self, rate: float):
+        """Lower the refill rate, e.g. to honour a robots.txt Crawl-delay."""
+        if rate > 0 and (self.rate <= 0 or rate < self.rate):
+            self.rate = rate
+            self.burst = 1
+            self.tokens = min(self.tokens, 1.0)
+
+
+class HostPolicy():
+    """Politeness state for one host: rate limit, concurrency cap and server-requested pauses.
+
+    Only touched from the HTTP client's event loop, so it needs no locking.
+    """
+
+    def __init__(self, rate: float = HOST_RATE, burst: int = HOST_BURST, max_concurrent: int = MAX_PER_HOST):
+        self.bucket = TokenBucket(rate, burst)
+        self.slots = asyncio.Semaphore(max_concurrent)
+        self.paused_until = 0.0
+
+    def pause(self, seconds: float):
+        """Hold every request to this host for ``seconds``, e.g. after a 429 with Retry-After."""
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+    async def ready(self):
+        """Wait out any pause and this request's turn in the rate limit."""
+        paused = 0.0
+        remaining = self.paused_until - time.monotonic()
+        while remaining > 0:
+            paused += remaining
+            await asyncio.sleep(remaining)
+            remaining = self.paused_until - time.monotonic()
+        delay = self.bucket.reserve()
+        if delay:
+            await asyncio.sleep(delay)
+        record_http_wait("backoff", paused)
+        record_http_wait("rate", delay)
+
+
+class Robots():
+    """Parsed robots.txt of one origin."""
+
+    def __init__(self, parser: Optional[RobotFileParser], expires: float):
+        self.parser = parser
+        self.expires = expires
+
+    @classmethod
+    def from_response(cls, status_code: int, text: str) -> "Robots":
+        """Rules from a robots.txt response, following RFC 9309.
+
+        Missing or forbidden files (4xx) allow everything. Server errors (5xx)
+        disallow everything, as the RFC requires, but are retried sooner so an
+        outage does not lock a site out for a whole day.
+        """
+        now = time.monotonic()
+        if 200 <= status_code < 300:
+            parser = RobotFileParser()
+            parser.parse(text.splitlines())
+            return cls(parser, now + ROBOTS_TTL)
+        if 400 <= status_code < 500:
+            return cls(None, now + ROBOTS_TTL)
+        if status_code >= 500:
+            return cls.unreachable()
+        return cls(None, now + ROBOTS_ERROR_TTL)
+
+    @classmethod
+    def unreachable(cls) -> "Robots":
+        """Rules while robots.txt cannot be read: RFC 9309 assumes complete disallow."""
+        parser = RobotFileParser()
+        parser.disallow_all = True
+        return cls(parser, time.monotonic() + ROBOTS_ERROR_TTL)
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires
+
+    def allows(self, user_agent: str, url: str) -> bool:
+        allowed = self.parser is None or self.parser.can_fetch(user_agent, url)
+        if not allowed:
+            record_http_event("robots_disallowed")
+        return allowed
+
+    def crawl_delay(self, user_agent: str) -> Optional[float]:
+        if self.parser is None:
+            return None
+        delay = self.parser.crawl_delay(user_agent)
+        return float(delay) if delay else None
@@ -0,0 +1,135 @@
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, NamedTuple, Optional
+
+DETAIL_CHARS = 4000
+
+STAGES = {
+    "fact_researcher": "Research",
+    "content_analyzer": "Content analysis",
+    "fact_verifier": "Verification",
+}
+
+
+class ProgressEvent(NamedTuple):
+    """One step of an analysis run, as shown in the UI.
+
+    ``kind`` is ``stage``, ``task_started``, ``task_completed``,
+    ``task_failed``, ``tool_started``, ``tool_finished``, ``tool_error`` or
+    ``finding``. Task and finding events carry partial output in ``detail``;
+    stage events may carry a work item ``count``.
+    """
+    kind: str
+    stage: str
+    label: str
+    detail: str = ""
+    count: int = 0
+    at: float = 0.0
+
+
+_listener: contextvars.ContextVar[Optional[Callable]] = contextvars.ContextVar("progress_listener", default=None)
+_installed = False
+_install_lock = threading.Lock()
+
+
+def emit(kind: str, stage: str, label: str, detail: str = "", count: int = 0):
+    """Send an event to the listener of the current context, if any."""
+    listener = _listener.get()
+    if listener is not None:
+        listener(ProgressEvent(kind, stage, label, str(detail)[:DETAIL_CHARS], count, time.time()))
+
+
+@contextmanager
+def listen(callback: Callable[[ProgressEvent], None]):
+    """Route events emitted in this context, including crewAI task and tool events, to ``callback``.
+
+    The listener follows the context into threads started with
+    ``contextvars.copy_context().run`` and into ``asyncio.to_thread``.
+    """
+    _install()
+    token = _listener.set(callback)
+    try:
+        yield
+    finally:
+        _listener.reset(token)
+
+
+def _stage(role_or_agent) -> str:
+    role = getattr(role_or_agent, "role", role_or_agent) or ""
+    key = str(role).strip().lower().replace(" ", "_")
+    return STAGES.get(key, str(role).strip() or "Analysis")
+
+
+def _task_label(task) -> str:
+    name = getattr(task, "name", None) or ""
+    return name.replace("_", " ").capitalize() or "Task"
+
+
+def emit_task(kind: str, task, detail: str = ""):
+    """Send a task event for ``task`` that crewAI does not emit itself, e.g. a task restored from a checkpoint."""
+    emit(kind, _stage(getattr(task, "agent", None)), _task_label(task), detail)
+
+
+def _install():
+    """Register the crewAI event bus handlers once per process.
+
+    crewAI emits on the thread running the task, so each handler forwards to
+    whichever listener that thread's context holds.
+    """
+    global _installed
+    with _install_lock:
+        if _installed:
+            return
+        from crewai.events import (
+            TaskCompletedEvent,
+            TaskFailedEvent,
+            TaskStartedEvent,
+            ToolUsageErrorEvent,
+            ToolUsageFinishedEvent,
+            ToolUsageStartedEvent,
+            crewai_event_bus,
+        )
+
+        @crewai_event_bus.on(TaskStartedEvent)
+        def on_task_started(source, event):
+            emit("task_started", _stage(getattr(event.task, "agent", None)), _task_label(event.task))
+
+        @crewai_event_bus.on(TaskCompletedEvent)
+        def on_task_completed(source, event):
+            emit("task_completed", _stage(getattr(event.task, "agent", None)), _task_label(event.task),
+                 getattr(event.output, "raw", ""))
+
+        @crewai_event_bus.on(TaskFailedEvent)
+        def on_task_failed(source, event):
+            emit("task_failed", _stage(getattr(event.task, "agent", None)), _task_label(event.task), event.error)
+
+        @crewai_event_bus.on(ToolUsageStartedEvent)
+        def on_tool_started(source, event):
+            emit("tool_started", _stage(event.agent_role), event.tool_name, event.tool_args)
+
+        @crewai_event_bus.on(ToolUsageFinishedEvent)
+        def on_tool_finished(source, event):
+            emit("tool_finished", _stage(event.agent_role), event.tool_name,
+                 "cached" if event.from_cache else "")
+
+        @crewai_event_bus.on(ToolUsageErrorEvent)
+        def on_tool_error(source, event):
+            emit("tool_error", _stage(event.agent_role), event.tool_name, event.error)
+
+        _installed = True
+
+
+def fraction_done(events) -> float:
+    """Share of the run finished, from the events received so far.
+
+    Research, content analysis and chunk extraction make up the first half;
+    the second half advances one step per verified claim once the pipeline
+    has announced how many claims there are.
+    """
+    planned = [e.count for e in events if e.kind == "stage" and e.stage == "Verification" and e.count]
+    if not planned:
+        return min(0.45, 0.15 * sum(1 for e in events if e.kind == "task_completed"))
+    verified = sum(1 for e in events if e.kind == "finding" and e.stage == "Verification")
+    return 0.5 + 0.5 * min(verified, planned[-1]) / planned[-1]
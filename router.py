@@ -0,0 +1,75 @@
+import os
+import re
+from typing import NamedTuple, Optional
+
+from .tool_registry import shared_tool
+from .transcript_store import extract_video_id
+
+# The router fetches URL and YouTube input itself and sends text claims
+# straight to claim extraction; "0" leaves tool selection to the research agent
+ROUTER_ENABLED = os.getenv("FACT_CHECKER_ROUTER", "1") != "0"
+
+URL_PATTERN = re.compile(r"https?://\S+", re.IGNORECASE)
+_SCHEME = re.compile(r"^[a-z][a-z0-9+.-]*://", re.IGNORECASE)
+# Input kinds a request can name; the UI sets one per input mode
+KINDS = ("claim", "url", "youtube", "document")
+
+
+class Route(NamedTuple):
+    """Input type of a request, where its content comes from and the content once fetched."""
+    kind: str  # "youtube", "url", "document" or "claim"
+    source: str
+    content: Optional[str] = None
+
+
+def with_scheme(url: str) -> str:
+    """``url`` with https:// added when it was typed without a scheme, e.g. "www.bbc.com/news"."""
+    url = url.strip()
+    if _SCHEME.match(url):
+        return url
+    return f"https:{url}" if url.startswith("//") else f"https://{url}"
+
+
+def classify(request) -> Route:
+    """The README's decision logic applied to ``request`` without asking a model.
+
+    A request's ``kind`` (the input mode it was entered in) decides the route;
+    URLs entered as a URL or YouTube video may leave out the scheme. Requests
+    without one are routed as a URL only when the whole input is an http(s)
+    link.
+    """
+    kind = request.get("kind")
+    if request.get("document_path") or kind == "document":
+        return Route("document", request["document_path"])
+    if request.get("claim"):
+        return Route("claim", request["claim"], request["claim"])
+    text = request["input_content"].strip()
+    if kind in ("url", "youtube") or (kind is None and URL_PATTERN.fullmatch(text)):
+        url = with_scheme(text)
+        return Route("youtube" if extract_video_id(url) else "url", url)
+    return Route("claim", text, text)
+
+
+def source_urls(route: Route) -> set:
+    """URLs the content of ``route`` is indexed under as evidence once fetched."""
+    if route.kind == "youtube":
+        return {route.source, f"https://www.youtube.com/watch?v={extract_video_id(route.source)}"}
+    if route.kind == "url":
+        from .web_cache import normalize_url
+        return {route.source, normalize_url(route.source)}
+    return set()
+
+
+def fetch(route: Route) -> Optional[Route]:
+    """``route`` with its content fetched by the tool for its input type.
+
+    Returns None when the tool reports an error, so the caller can leave the
+    input to the research agent instead.
+    """
+    if route.content is not None or route.kind == "document":
+        return route
+    tool = shared_tool('youtube' if route.kind == "youtube" else 'web')
+    content = str(tool.run(route.source) or "").strip()
+    if not content or content.lower().startswith("error"):
+        return None
+    return route._replace(content=content)
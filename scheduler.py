@@ -0,0 +1,112 @@
+import contextvars
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from crewai import Crew, Process
+from crewai.tasks.conditional_task import ConditionalTask
+from crewai.utilities.constants import NOT_SPECIFIED
+
+from .checkpoints import CHECKPOINTS_ENABLED, checkpoint_key, get_checkpoint_store, resuming
+from .progress import emit_task
+
+# Tasks of one crew kickoff that may run at the same time; 1 with
+# checkpoints disabled keeps crewAI's own sequential loop
+TASK_CONCURRENCY = int(os.getenv("FACT_CHECKER_TASK_CONCURRENCY", "1"))
+
+
+def task_dependencies(tasks) -> list:
+    """Indices of the earlier tasks each of ``tasks`` has to wait for.
+
+    A declared ``context`` names the tasks it waits for; without one, crewAI
+    hands a task every earlier output, so it waits for all earlier tasks.
+    Tasks of the same agent also run in declared order, since an agent runs
+    one task at a time. Only earlier tasks count, as in sequential runs, so
+    the graph is acyclic.
+    """
+    position = {id(task): i for i, task in enumerate(tasks)}
+    dependencies = []
+    last_of_agent = {}
+    for i, task in enumerate(tasks):
+        if task.context is NOT_SPECIFIED:
+            waits = set(range(i))
+        else:
+            waits = {position[id(t)] for t in task.context or [] if position.get(id(t), i) < i}
+        if id(task.agent) in last_of_agent:
+            waits.add(last_of_agent[id(task.agent)])
+        last_of_agent[id(task.agent)] = i
+        dependencies.append(waits)
+    return dependencies
+
+
+class ConcurrentCrew(Crew):
+    """Sequential crew that runs tasks as soon as the tasks they depend on are done.
+
+    The dependency graph comes from ``task_dependencies``, at most
+    TASK_CONCURRENCY tasks run at once, and every task gets the same context
+    it would get in crewAI's sequential loop, so the outputs and their order
+    are those of a sequential run.
+
+    Each completed task is checkpointed; a task whose inputs, agent and
+    upstream outputs match a stored checkpoint is restored instead of run,
+    so a retry of a failed kickoff resumes after its last completed task.
+    Replays, conditional and async tasks, and hierarchical crews use
+    crewAI's own loop.
+    """
+
+    def copy(self):
+        # Crew.copy clones agents, tasks and memories but always builds a plain
+        # Crew; rebuild it as this class from the fields it was given.
+        crew = super().copy()
+        return type(self)(**{name: getattr(crew, name) for name in crew.model_fields_set})
+
+    def _execute_tasks(self, tasks, start_index=0, was_replayed=False):
+        if ((TASK_CONCURRENCY <= 1 and not CHECKPOINTS_ENABLED) or start_index or self.process != Process.sequential
+                or any(isinstance(task, ConditionalTask) or task.async_execution for task in tasks)):
+            return super()._execute_tasks(tasks, start_index, was_replayed)
+
+        plans = []
+        for task in tasks:
+            agent = self._get_agent_to_use(task)
+            if agent is None:
+                raise ValueError(f"No agent available for task: {task.description}. "
+                                 f"Ensure that either the task has an assigned agent "
+                                 f"or a manager agent is provided.")
+            plans.append((agent, self._prepare_tools(agent, task, task.tools or agent.tools or [])))
+        dependencies = task_dependencies(tasks)
+        outputs = [None] * len(tasks)
+        checkpoints = get_checkpoint_store() if CHECKPOINTS_ENABLED else None
+
+        def execute(index):
+            task = tasks[index]
+            agent, tools = plans[index]
+            context = self._get_context(task, outputs[:index])
+            if checkpoints is not None:
+                key = checkpoint_key(self._inputs, task, agent, context)
+                output = checkpoints.load(key, task) if resuming() else None
+                if output is not None:
+                    task.output = output
+                    emit_task("task_completed", task, output.raw)
+                    return output
+            self._log_task_start(task, agent.role)
+            output = task.execute_sync(agent=agent, context=context, tools=tools)
+            if checkpoints is not None:
+                checkpoints.save(key, task, output)
+            return output
+
+        pending = list(range(len(tasks)))
+        running = {}
+        workers = max(TASK_CONCURRENCY, 1)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            while pending or running:
+                for index in [i for i in pending if all(outputs[d] is not None for d in dependencies[i])]:
+                    if len(running) >= workers:
+                        break
+                    pending.remove(index)
+                    running[pool.submit(contextvars.copy_context().run, execute, index)] = index
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = running.pop(future)
+                    outputs[index] = future.result()
+                    self._process_task_result(tasks[index], outputs[index])
+                    self._store_execution_log(tasks[index], outputs[index], index, was_replayed)
+        return self._create_crew_output(outputs)
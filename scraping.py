@@ -0,0 +1,48 @@
+from lxml import etree
+
+from .evidence_index import index_source
+from .html_text import extract
+from .http_client import FETCH_ERRORS, Response, get_http_client
+from .tools.web_scraping_tool import WebScrapingTool
+
+
+class ScrapeError(Exception):
+    """A page could not be fetched or had no readable content."""
+
+
+def page_text(response: Response) -> str:
+    """Readable text of a fetched page: metadata header followed by the main content."""
+    if not response.ok:
+        raise ScrapeError(f"HTTP {response.status_code} for {response.url}")
+    content_type = response.headers.get("Content-Type", "")
+    if "html" not in content_type and content_type.startswith("text/"):
+        title = author = published = ""
+        body = response.text.strip()
+    else:
+        try:
+            title, author, published, body = extract(response.text)
+        except (etree.ParserError, ValueError) as e:
+            raise ScrapeError(f"Unreadable page {response.url}: {e}") from e
+    if not body:
+        raise ScrapeError(f"No readable text at {response.url}")
+    header = "".join(f"{label}: {value}\n" for label, value in
+                     (("Title", title), ("Author", author), ("Published", published)) if value)
+    truncated = "\n[content truncated]" if response.truncated else ""
+    return f"{header}URL: {response.url}\n\n{body}{truncated}"
+
+
+def scrape(url: str) -> str:
+    """Fetch ``url`` through the shared HTTP client and return its readable text."""
+    return page_text(get_http_client().get(url, respect_robots=True))
+
+
+class PooledWebScrapingTool(WebScrapingTool):
+    """WebScrapingTool that fetches through the process-wide pooled HTTP client."""
+
+    def _run(self, url: str, **kwargs) -> str:
+        try:
+            text = scrape(url)
+        except (ScrapeError, *FETCH_ERRORS) as e:
+            return f"Error scraping {url}: {e}"
+        index_source(url, text)
+        return text
@@ -0,0 +1,135 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import unicodedata
+from concurrent.futures import Future
+
+from crewai_tools import SerperDevTool
+
+from .http_client import get_http_client
+from .storage import SqliteCache, singleton
+
+SEARCH_CACHE_ENABLED = os.getenv("FACT_CHECKER_SEARCH_CACHE", "1") != "0"
+SEARCH_CACHE_TTL = float(os.getenv("FACT_CHECKER_SEARCH_CACHE_TTL", 24 * 3600))
+SEARCH_CACHE_MAX_MB = float(os.getenv("FACT_CHECKER_SEARCH_CACHE_MB", 64))
+SERPER_BASE_URL = os.getenv("SERPER_BASE_URL", "https://google.serper.dev")
+
+
+def normalize_query(query: str) -> str:
+    """Case, width and whitespace-insensitive form of a search query.
+
+    Word order and quoted phrases are kept since they change what the search
+    engine returns; trailing punctuation is dropped.
+    """
+    query = unicodedata.normalize("NFKC", query or "").casefold()
+    query = re.sub(r"\s+", " ", query).strip()
+    return query.rstrip("?.!,;: ")
+
+
+class Coalescer():
+    """Collapses concurrent calls for the same key into a single execution.
+
+    The first caller for a key runs the function; callers arriving while it is
+    in flight block on the same Future and share its result or exception.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._inflight = {}
+        self.coalesced = 0
+
+    def run(self, key, fn):
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+            else:
+                self.coalesced += 1
+        if not leader:
+            return future.result()
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+
+class SearchCache(SqliteCache):
+    """Raw search API responses cached by normalized query, with request coalescing."""
+
+    def __init__(self, ttl=SEARCH_CACHE_TTL, max_bytes=int(SEARCH_CACHE_MAX_MB * 1024 * 1024), path=None):
+        super().__init__("search", ttl=ttl, max_bytes=max_bytes, path=path)
+        self._coalescer = Coalescer()
+        self.upstream_calls = 0
+
+    def search(self, params: list, fetch) -> dict:
+        """Return cached results for ``params``, calling ``fetch()`` at most once per miss."""
+        key = hashlib.sha256(json.dumps(params).encode("utf-8")).hexdigest()
+        entry = self.get(key)
+        if entry:
+            return json.loads(entry.value)
+
+        def fetch_and_store():
+            self.upstream_calls += 1
+            results = fetch()
+            self.set(key, json.dumps(results), {"query": params[0]})
+            return results
+
+        return self._coalescer.run(key, fetch_and_store)
+
+    def stats(self) -> dict:
+        stats = super().stats()
+        stats["upstream_calls"] = self.upstream_calls
+        stats["coalesced"] = self._coalescer.coalesced
+        return stats
+
+
+@singleton
+def get_search_cache() -> SearchCache:
+    """Return the SearchCache shared by the whole process."""
+    return SearchCache()
+
+
+class PooledSerperDevTool(SerperDevTool):
+    """SerperDevTool that posts to the API through the process-wide pooled HTTP client.
+
+    ``SERPER_BASE_URL`` points the tool at another endpoint, such as a local
+    stub server in tests.
+    """
+
+    base_url: str = SERPER_BASE_URL
+
+    def _make_api_request(self, search_query: str, search_type: str) -> dict:
+        payload = {"q": search_query, "num": self.n_results}
+        for field, value in (("gl", self.country), ("location", self.location), ("hl", self.locale)):
+            if value:
+                payload[field] = value
+        response = get_http_client().post(self._get_search_url(search_type), json=payload,
+                                          headers={"X-API-KEY": os.environ["SERPER_API_KEY"]})
+        if not response.ok:
+            raise RuntimeError(f"Serper API returned HTTP {response.status_code}: {response.text[:500]}")
+        results = response.json()
+        if not results:
+            raise ValueError("Empty response from Serper API")
+        return results
+
+
+class CachedSerperDevTool(PooledSerperDevTool):
+    """PooledSerperDevTool whose API requests go through the shared SearchCache."""
+
+    def _make_api_request(self, search_query: str, search_type: str) -> dict:
+        params = [normalize_query(search_query), search_type, self.n_results,
+                  self.country, self.location, self.locale]
+        return get_search_cache().search(
+            params,
+            lambda: super(CachedSerperDevTool, self)._make_api_request(search_query, search_type),
+        )
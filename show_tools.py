@@ -6,12 +6,15 @@ project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'sr
 sys.path.append(project_root)
 
 # ✅ Now import
-from fact_checker.crew import FactChecker
-
-fc = FactChecker()
+from fact_checker.tool_registry import TOOLS, tool_class
 
+# Tool classes are looked up in the registry rather than read off a built
+# crew, so listing them needs neither the agent configs nor an LLM
 print("🔧 Tools used by the Crew:")
-for tool in fc.tools:
-    name = tool.__class__.__name__
-    desc = getattr(tool, 'description', 'No description')
-    print(f"✅ {name}: {desc}")
+for name in TOOLS:
+    tool = tool_class(name)
+    if tool is None:
+        print(f"❌ {name}: not available")
+        continue
+    desc = tool.model_fields['description'].default or 'No description'
+    print(f"✅ {tool.__name__} ({name}): {desc}")
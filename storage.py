@@ -0,0 +1,195 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from functools import wraps
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+from .metrics import record_cache
+
+CACHE_DIR = Path(os.getenv("FACT_CHECKER_CACHE_DIR", Path.home() / ".cache" / "fact_checker"))
+
+
+def cache_path(name: str) -> Path:
+    """Location of the SQLite file backing the named store."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    return CACHE_DIR / f"{name}.sqlite3"
+
+
+def connect(path) -> sqlite3.Connection:
+    """Open a SQLite connection shared between threads, in WAL mode."""
+    conn = sqlite3.connect(str(path), timeout=30, check_same_thread=False, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+def singleton(build):
+    """Decorator for a process-wide instance built on first call.
+
+    Unlike ``lru_cache`` the build runs under a lock, so concurrent first
+    callers all receive the same instance.
+    """
+    lock = threading.Lock()
+    instance = []
+
+    @wraps(build)
+    def get():
+        if not instance:
+            with lock:
+                if not instance:
+                    instance.append(build())
+        return instance[0]
+
+    return get
+
+
+class Entry(NamedTuple):
+    key: str
+    value: str
+    meta: dict
+    stored_at: float
+    expired: bool
+
+
+class SqliteCache():
+    """Compressed text store on SQLite with a TTL and size-bounded LRU eviction.
+
+    Values are zlib-compressed and the running total of stored bytes is kept
+    by triggers, so several processes can share one file and still agree on
+    when to evict. ``ttl`` and ``max_bytes`` of ``None`` disable expiry and
+    eviction respectively.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS entries (
+            key TEXT PRIMARY KEY,
+            value BLOB NOT NULL,
+            meta TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            stored_at REAL NOT NULL,
+            accessed_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed_at);
+        CREATE TABLE IF NOT EXISTS totals (id INTEGER PRIMARY KEY CHECK (id = 0), bytes INTEGER NOT NULL);
+        INSERT OR IGNORE INTO totals VALUES (0, 0);
+        CREATE TRIGGER IF NOT EXISTS entries_ins AFTER INSERT ON entries BEGIN
+            UPDATE totals SET bytes = bytes + NEW.size;
+        END;
+        CREATE TRIGGER IF NOT EXISTS entries_del AFTER DELETE ON entries BEGIN
+            UPDATE totals SET bytes = bytes - OLD.size;
+        END;
+        CREATE TRIGGER IF NOT EXISTS entries_upd AFTER UPDATE OF size ON entries BEGIN
+            UPDATE totals SET bytes = bytes - OLD.size + NEW.size;
+        END;
+    """
+
+    def __init__(self, name: str, ttl: Optional[float] = None, max_bytes: Optional[int] = None, path=None):
+        self.name = name
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = connect(path or cache_path(name))
+        self._conn.executescript(self._SCHEMA)
+        # Stores written before set() was an upsert can carry sizes of replaced rows
+        self._conn.execute("UPDATE totals SET bytes = (SELECT COALESCE(SUM(size), 0) FROM entries)")
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _expired(self, stored_at, now):
+        return self.ttl is not None and now - stored_at > self.ttl
+
+    def get(self, key: str, allow_expired: bool = False) -> Optional[Entry]:
+        """Look up ``key``; expired entries are only returned with ``allow_expired``."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, meta, stored_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                record_cache(self.name, False)
+                return None
+            expired = self._expired(row[2], now)
+            record_cache(self.name, not expired)
+            if expired:
+                self.misses += 1
+                if not allow_expired:
+                    return None
+            else:
+                self.hits += 1
+            self._conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+        return Entry(key, zlib.decompress(row[0]).decode("utf-8"), json.loads(row[1]), row[2], expired)
+
+    def set(self, key: str, value: str, meta: Optional[dict] = None):
+        """Store ``value`` under ``key`` and evict least recently used entries if over budget."""
+        blob = zlib.compress(value.encode("utf-8"), 6)
+        now = time.time()
+        with self._lock:
+            # An upsert rather than INSERT OR REPLACE: the replace deletes the old row
+            # without firing entries_del, which would leave its size in the total
+            self._conn.execute(
+                "INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT(key) DO UPDATE SET "
+                "value = excluded.value, meta = excluded.meta, size = excluded.size, "
+                "stored_at = excluded.stored_at, accessed_at = excluded.accessed_at",
+                (key, blob, json.dumps(meta or {}), len(blob), now, now),
+            )
+            self._evict()
+
+    def touch(self, key: str, meta: Optional[dict] = None):
+        """Mark ``key`` as freshly stored, e.g. after a successful revalidation."""
+        now = time.time()
+        with self._lock:
+            if meta is None:
+                self._conn.execute(
+                    "UPDATE entries SET stored_at = ?, accessed_at = ? WHERE key = ?", (now, now, key)
+                )
+            else:
+                self._conn.execute(
+                    "UPDATE entries SET stored_at = ?, accessed_at = ?, meta = ? WHERE key = ?",
+                    (now, now, json.dumps(meta), key),
+                )
+
+    def delete(self, key: str):
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def purge_expired(self) -> int:
+        """Drop every expired entry and return how many were removed."""
+        if self.ttl is None:
+            return 0
+        with self._lock:
+            cur = self._conn.execute("DELETE FROM entries WHERE stored_at < ?", (time.time() - self.ttl,))
+            return cur.rowcount
+
+    def _evict(self):
+        if self.max_bytes is None:
+            return
+        while self._total_bytes() > self.max_bytes:
+            cur = self._conn.execute(
+                "DELETE FROM entries WHERE key IN "
+                "(SELECT key FROM entries ORDER BY accessed_at LIMIT 8)"
+            )
+            if not cur.rowcount:
+                break
+            self.evictions += cur.rowcount
+
+    def _total_bytes(self) -> int:
+        return self._conn.execute("SELECT bytes FROM totals").fetchone()[0]
+
+    def stats(self) -> dict:
+        """Counters for this process plus the current size of the store."""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            size = self._total_bytes()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": entries,
+            "bytes": size,
+        }
@@ -0,0 +1,17 @@
+from ..chunking import chunk_stream
+
+
+def _text(chunks):
+    return " ".join(chunk.text for chunk in chunks)
+
+
+def test_segments_are_not_glued_together():
+    text = _text(chunk_stream(["First sentence. Second one. Third one.", "Fourth."]))
+    assert "Third one.Fourth" not in text
+    assert "Fourth." in text
+
+
+def test_word_cut_at_segment_end_stays_separate():
+    text = _text(chunk_stream(["The tower is tall and", "Paris is its city."]))
+    assert "andParis" not in text
+    assert "and" in text and "Paris" in text
@@ -0,0 +1,50 @@
+import pytest
+
+from ..claim_index import ClaimIndex, same_claim
+
+
+@pytest.mark.parametrize("claim, other", [
+    ("The Sun orbits the Earth", "The Earth orbits the Sun"),
+    ("Barack Obama was born in Kenya", "Barack Obama was born in Hawaii"),
+    ("Paris is the capital of Germany", "Paris is the capital of France"),
+    ("The Eiffel Tower is 330 metres tall", "The Eiffel Tower is 300 metres tall"),
+    ("Vaccines cause autism", "Vaccines do not cause autism"),
+    ("The Eiffel Tower stands 330 metres high", "The Eiffel Tower does not stand 330 metres high"),
+    ("The Eiffel Tower stands 330 metres high", "The Eiffel Tower stands 300 metres high"),
+    ("The temperature fell to -40 degrees", "The temperature fell to 40 degrees"),
+])
+def test_different_assertions_are_not_duplicates(claim, other):
+    assert not same_claim(claim, other)
+
+
+@pytest.mark.parametrize("claim, other", [
+    ("The Eiffel Tower is 330 metres tall", "the eiffel tower is 330m tall."),
+    ("Water boils at 100 degrees Celsius", "Water boils at 100 degree Celsius!"),
+    ("Eiffel tower is 330m tall", "The Eiffel Tower stands 330 metres high"),
+])
+def test_rewordings_are_duplicates(claim, other):
+    assert same_claim(claim, other)
+
+
+def test_query_flags_only_duplicates(tmp_path):
+    index = ClaimIndex(tmp_path / "claims.sqlite3")
+    index.add("The Earth orbits the Sun")
+    index.add("The Eiffel Tower is 330 metres tall")
+    assert not any(m.duplicate for m in index.query("The Sun orbits the Earth"))
+    assert [m.duplicate for m in index.query("the eiffel tower is 330m tall")][:1] == [True]
+
+
+def test_paraphrase_is_served_from_the_index(tmp_path):
+    index = ClaimIndex(tmp_path / "claims.sqlite3")
+    index.add("Eiffel tower is 330m tall")
+    matches = index.query("The Eiffel Tower stands 330 metres high")
+    assert [(m.claim, m.duplicate) for m in matches] == [("Eiffel tower is 330m tall", True)]
+
+
+def test_buckets_are_rebuilt_for_a_new_layout(tmp_path):
+    index = ClaimIndex(tmp_path / "claims.sqlite3")
+    index.add("The Eiffel Tower is 330 metres tall")
+    index._conn.execute("DELETE FROM buckets")
+    index._conn.execute("PRAGMA user_version = 0")
+    reopened = ClaimIndex(tmp_path / "claims.sqlite3")
+    assert [m.duplicate for m in reopened.query("the eiffel tower is 330m tall")] == [True]
@@ -0,0 +1,22 @@
+from ..evidence_index import EvidenceIndex
+
+
+def _index(tmp_path):
+    index = EvidenceIndex(tmp_path / "evidence", tmp_path / "evidence.sqlite3")
+    index.add("https://example.org/obama", "Barack Obama was born in Honolulu, Hawaii, in 1961.")
+    index.add("https://example.org/eiffel", "The Eiffel Tower in Paris is 330 metres tall.")
+    index.add("https://example.org/moon", "The Moon orbits the Earth about once every 27 days.")
+    return index
+
+
+def test_unseen_query_terms_lower_coverage(tmp_path):
+    results = _index(tmp_path).search("Barack Obama was born in Kenya")
+    assert results[0].url == "https://example.org/obama"
+    assert results[0].coverage < 0.8
+
+
+def test_excluded_sources_are_not_returned(tmp_path):
+    index = _index(tmp_path)
+    assert index.search("Eiffel Tower height")[0].url == "https://example.org/eiffel"
+    results = index.search("Eiffel Tower height", exclude=["https://example.org/eiffel"])
+    assert all(p.url != "https://example.org/eiffel" for p in results)
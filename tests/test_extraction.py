@@ -0,0 +1,56 @@
+import io
+import time
+
+import pytest
+
+from .. import extraction, ingest
+from ..benchmarks.corpus import make_pdf
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    monkeypatch.setattr(extraction, "EXTRACT_PROCESSES", 2)
+    extraction._reset_pool()
+    yield
+    extraction._reset_pool()
+
+
+def test_stuck_job_times_out(pool):
+    with pytest.raises(extraction.ExtractionTimeout):
+        list(extraction._ordered([(time.sleep, 30)], extraction._Budget(1)))
+
+
+def test_jobs_are_submitted_in_a_bounded_window(pool):
+    submitted = []
+
+    def jobs():
+        for i in range(10):
+            submitted.append(i)
+            yield (abs, -i)
+
+    results = extraction._ordered(jobs(), extraction._Budget(30), window=3)
+    assert next(results) == 0
+    assert len(submitted) == 3
+    assert list(results) == list(range(1, 10))
+
+
+def test_budget_does_not_count_consumer_time(pool):
+    extraction._get_pool().apply(abs, (1,))
+    for _ in extraction._ordered([(abs, -i) for i in range(4)], extraction._Budget(1)):
+        time.sleep(0.4)
+
+
+def test_small_pdf_is_extracted_on_the_pool_under_the_timeout(pool, monkeypatch):
+    budgets = []
+
+    class Budget(extraction._Budget):
+        def __init__(self, timeout):
+            super().__init__(timeout)
+            budgets.append(timeout)
+
+    monkeypatch.setattr(extraction, "_Budget", Budget)
+    data = make_pdf(3)
+    assert len(data) < ingest.PARALLEL_EXTRACT_MIN_BYTES
+    text = "".join(ingest.iter_document(io.BytesIO(data), ".pdf"))
+    assert text == "".join(ingest.iter_pdf_pages(io.BytesIO(data)))
+    assert budgets == [extraction.EXTRACT_TIMEOUT]
@@ -0,0 +1,31 @@
+from ..benchmarks.corpus import make_news_page
+from ..html_text import extract
+
+PARAGRAPH = "The council approved the budget on Tuesday, after a long debate about schools and roads."
+
+
+def _page(body):
+    return f"<html><head><title>Budget vote</title></head><body>{body}</body></html>"
+
+
+def test_webforms_page_keeps_its_body():
+    page = _page(f"<form id='aspnetForm' method='post'><div class='page'><p>{PARAGRAPH}</p><p>{PARAGRAPH} Again.</p>"
+                 "</div><input type='hidden' name='__VIEWSTATE' value='abc'></form>")
+    assert PARAGRAPH in extract(page).text
+
+
+def test_content_marker_wins_over_boilerplate_token():
+    page = _page(f"<div class='post-body share-enabled'><p>{PARAGRAPH}</p><p>{PARAGRAPH} Again.</p></div>")
+    assert PARAGRAPH in extract(page).text
+
+
+def test_pruned_to_nothing_falls_back_to_body_text():
+    page = _page(f"<nav><p>{PARAGRAPH}</p></nav><script>var x = 1;</script>")
+    assert extract(page).text == PARAGRAPH
+
+
+def test_boilerplate_is_still_dropped():
+    for webforms in (False, True):
+        text = extract(make_news_page(12, seed=3, webforms=webforms)).text
+        for boilerplate in ("We use cookies", "Sponsored offer", "Most read", "reader1", "Copyright Stub News"):
+            assert boilerplate not in text
@@ -0,0 +1,24 @@
+import io
+
+from ..ingest import iter_document, iter_text
+
+
+def test_text_is_yielded_in_blocks_without_splitting_words():
+    text = "".join(f"Sentence number {i} is here.\n" for i in range(200))
+    blocks = list(iter_text(io.BytesIO(text.encode("utf-8")), block_chars=100))
+    assert len(blocks) > 1
+    assert "".join(blocks) == text
+    assert all(block.endswith("\n") for block in blocks)
+
+
+def test_long_line_is_cut_at_a_space():
+    text = " ".join(["word"] * 100)
+    blocks = list(iter_text(io.BytesIO(text.encode("utf-8")), block_chars=32))
+    assert "".join(blocks) == text
+    assert all(block.endswith(" ") for block in blocks[:-1])
+
+
+def test_text_encodings_are_detected():
+    text = "Café prices rose 5% in Zürich.\n"
+    for encoding in ("utf-8", "utf-8-sig", "utf-16", "utf-16-le", "latin-1"):
+        assert "".join(iter_document(io.BytesIO(text.encode(encoding)), ".txt")) == text
@@ -0,0 +1,72 @@
+import threading
+import time
+
+import pytest
+
+from .. import factory, jobs, metrics, pipeline
+
+
+@pytest.fixture
+def queue(tmp_path, monkeypatch):
+    queue = jobs.JobQueue(tmp_path / "jobs.sqlite3")
+    monkeypatch.setattr(jobs, "get_job_queue", lambda: queue)
+    monkeypatch.setattr(jobs, "UPLOAD_DIR", tmp_path / "uploads")
+    monkeypatch.setattr(metrics, "METRICS_ENABLED", False)
+    return queue
+
+
+def _orphan(queue, job_id):
+    queue._conn.execute("UPDATE jobs SET status = 'running', worker = NULL WHERE id = ?", (job_id,))
+
+
+def test_unstorable_result_fails_the_job_not_the_worker(queue, monkeypatch):
+    class Factory():
+        def crew(self, name):
+            return None
+
+    async def run_request_async(request, on_event=None):
+        return object()
+
+    def result_payload(result, trace=None):
+        raise TypeError("Object of type object is not JSON serializable")
+
+    monkeypatch.setattr(factory, "get_factory", Factory)
+    monkeypatch.setattr(pipeline, "run_request_async", run_request_async)
+    monkeypatch.setattr(jobs, "result_payload", result_payload)
+    job_ids = [queue.submit({"input_content": f"claim {i}"}) for i in range(2)]
+
+    stop = threading.Event()
+    worker = threading.Thread(target=jobs.work, args=(stop,))
+    worker.start()
+    try:
+        deadline = time.monotonic() + 10
+        while any(queue.get(job_id).pending for job_id in job_ids) and time.monotonic() < deadline:
+            time.sleep(0.05)
+    finally:
+        stop.set()
+        worker.join()
+    assert [(queue.get(job_id).status, queue.get(job_id).error_type) for job_id in job_ids] == [("failed", "TypeError")] * 2
+
+
+def test_job_that_keeps_killing_workers_is_failed(queue):
+    job_id = queue.submit({"input_content": "claim"})
+    for attempt in range(2, jobs.MAX_ATTEMPTS + 1):
+        _orphan(queue, job_id)
+        assert queue.requeue_orphans() == 1
+        assert queue.get(job_id).request["attempts"] == attempt
+    _orphan(queue, job_id)
+    assert queue.requeue_orphans() == 0
+    assert (queue.get(job_id).status, queue.get(job_id).error_type) == ("failed", "WorkerCrash")
+
+
+def test_purge_removes_old_finished_jobs_and_their_events(queue):
+    old, recent, running = (queue.submit({"input_content": str(i)}) for i in range(3))
+    for job_id in (old, recent, running):
+        queue.add_event(job_id, ("stage", "Analysis", ""))
+    queue.finish(old, result={})
+    queue.finish(recent, error=ValueError("x"))
+    queue._conn.execute("UPDATE jobs SET finished_at = ? WHERE id = ?", (time.time() - 3600, old))
+    assert queue.purge(max_age=60) == 1
+    assert queue.get(old) is None and not queue.events(old)
+    assert queue.get(recent).status == "failed" and queue.events(recent)
+    assert queue.get(running).pending and queue.events(running)
@@ -0,0 +1,65 @@
+import pytest
+
+pytest.importorskip("crewai")
+
+from crewai import LLM
+
+from .. import llm_cache
+from ..benchmarks import stubs
+from ..llm_cache import CachedLLM, LLMCache, cached_llm, prompt_key
+
+MESSAGES = [{"role": "system", "content": "You are a fact checker."},
+            {"role": "user", "content": "Is the Eiffel Tower 330 m tall?"}]
+
+
+@pytest.fixture
+def stub(tmp_path, monkeypatch):
+    server = stubs.start()
+    monkeypatch.setenv("NO_PROXY", "127.0.0.1,localhost")
+    cache = LLMCache(path=tmp_path / "llm.sqlite3")
+    monkeypatch.setattr(llm_cache, "get_llm_cache", lambda: cache)
+    yield server
+    server.shutdown()
+
+
+def _llm(server, **kwargs):
+    return LLM(model="openai/gpt-4o-mini", api_key="test",
+               base_url=f"http://127.0.0.1:{server.server_address[1]}/v1", **kwargs)
+
+
+def test_cached_llm_is_built_from_the_resolved_llm(stub):
+    base = _llm(stub, temperature=0.7, max_tokens=256, stop="Observation:")
+    llm = cached_llm(base, deterministic=False)
+
+    assert type(llm) is CachedLLM
+    assert (llm.model, llm.base_url, llm.api_key) == (base.model, base.base_url, base.api_key)
+    assert (llm.temperature, llm.max_tokens, llm.stop) == (0.7, 256, ["Observation:"])
+    assert llm.additional_params == {}
+
+    pinned = cached_llm(base, deterministic=True)
+    assert (pinned.temperature, pinned.seed) == (0, llm_cache.LLM_SEED)
+
+
+def test_cache_hit_skips_the_model(stub):
+    llm = cached_llm(_llm(stub), deterministic=False)
+
+    first = llm.call(MESSAGES)
+    second = cached_llm(_llm(stub), deterministic=False).call(
+        [dict(message, content=f"  {message['content']}\n") for message in MESSAGES])
+
+    assert first and second == first
+    assert stub.calls["llm"] == 1
+    llm.call(MESSAGES + [{"role": "user", "content": "And in feet?"}])
+    assert stub.calls["llm"] == 2
+
+
+def test_deterministic_responses_are_kept_apart(stub):
+    llm = cached_llm(_llm(stub, temperature=0, seed=llm_cache.LLM_SEED), deterministic=False)
+    pinned = cached_llm(_llm(stub), deterministic=True)
+
+    assert prompt_key(llm, MESSAGES, False) != prompt_key(llm, MESSAGES, True)
+    pinned.call(MESSAGES)
+    llm.call(MESSAGES)
+    assert stub.calls["llm"] == 2
+    pinned.call(MESSAGES)
+    assert stub.calls["llm"] == 2
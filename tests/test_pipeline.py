@@ -0,0 +1,10 @@
+from types import SimpleNamespace
+
+from ..pipeline import _claim_verdict
+
+
+def test_unparsable_verdict_with_integer_claim_id_is_unverifiable():
+    verdict = _claim_verdict(SimpleNamespace(pydantic=None, raw="No JSON here"), {"id": 1, "text": "The sky is green"})
+    assert verdict.claim_id == "1"
+    assert verdict.verdict == "UNVERIFIABLE"
+    assert verdict.explanation == "No JSON here"
@@ -0,0 +1,30 @@
+import time
+
+from ..politeness import ROBOTS_ERROR_TTL, ROBOTS_TTL, Robots
+
+AGENT = "Verifact Bot 1.0"
+URL = "https://example.com/news/article"
+
+
+def test_robots_rules_are_applied():
+    robots = Robots.from_response(200, "User-agent: *\nDisallow: /news/\nCrawl-delay: 2\n")
+
+    assert not robots.allows(AGENT, URL)
+    assert robots.allows(AGENT, "https://example.com/about")
+    assert robots.crawl_delay(AGENT) == 2
+
+
+def test_missing_robots_allows_everything():
+    robots = Robots.from_response(404, "")
+
+    assert robots.allows(AGENT, URL)
+    assert robots.expires > time.monotonic() + ROBOTS_TTL - 60
+
+
+def test_server_error_disallows_everything_until_retried():
+    robots = Robots.from_response(503, "User-agent: *\nAllow: /\n")
+
+    assert not robots.allows(AGENT, URL)
+    assert robots.crawl_delay(AGENT) is None
+    assert time.monotonic() < robots.expires <= time.monotonic() + ROBOTS_ERROR_TTL
+    assert not Robots.unreachable().allows(AGENT, URL)
@@ -0,0 +1,38 @@
+import pytest
+
+from ..router import Route, classify, with_scheme
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("www.bbc.com/news/world-123", "https://www.bbc.com/news/world-123"),
+    ("  example.org  ", "https://example.org"),
+    ("//example.org/a", "https://example.org/a"),
+    ("http://example.org/a", "http://example.org/a"),
+])
+def test_with_scheme(url, expected):
+    assert with_scheme(url) == expected
+
+
+def test_schemeless_url_in_url_mode_is_fetched():
+    route = classify({"input_content": "www.bbc.com/news/world-123", "kind": "url"})
+    assert route == Route("url", "https://www.bbc.com/news/world-123")
+
+
+def test_schemeless_youtube_link_in_youtube_mode_is_fetched():
+    route = classify({"input_content": "youtube.com/watch?v=dQw4w9WgXcQ", "kind": "youtube"})
+    assert route == Route("youtube", "https://youtube.com/watch?v=dQw4w9WgXcQ")
+
+
+def test_youtube_link_entered_as_website_goes_to_the_transcript_tool():
+    assert classify({"input_content": "https://youtu.be/dQw4w9WgXcQ", "kind": "url"}).kind == "youtube"
+
+
+def test_claim_mode_is_never_fetched():
+    request = {"input_content": "https://example.org is down", "kind": "claim", "claim": "https://example.org is down"}
+    assert classify(request) == Route("claim", request["claim"], request["claim"])
+
+
+def test_requests_without_kind_fall_back_to_the_url_pattern():
+    assert classify({"input_content": "https://example.org/a"}).kind == "url"
+    assert classify({"input_content": "example.org/a"}).kind == "claim"
+    assert classify({"input_content": "Document: a.pdf", "document_path": "/tmp/a.pdf"}).kind == "document"
@@ -0,0 +1,37 @@
+import pytest
+
+pytest.importorskip("crewai")
+
+from crewai import Agent, Task
+
+from ..scheduler import ConcurrentCrew, task_dependencies
+
+
+def test_copy_is_a_concurrent_crew_with_linked_tasks(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    agent = Agent(role="Analyst", goal="Check claims", backstory="Careful", llm="gpt-4o-mini")
+    first = Task(description="Extract claims", expected_output="Claims", agent=agent)
+    second = Task(description="Verify claims", expected_output="Verdicts", agent=agent, context=[first])
+    crew = ConcurrentCrew(agents=[agent], tasks=[first, second])
+
+    copy = crew.copy()
+
+    assert type(copy) is ConcurrentCrew
+    assert copy.id != crew.id
+    assert copy.agents[0] is not agent
+    assert copy.tasks[0].agent is copy.agents[0]
+    assert copy.tasks[1].context == [copy.tasks[0]]
+
+
+def test_task_with_empty_context_runs_alongside_earlier_tasks(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    researcher = Agent(role="Researcher", goal="Research", backstory="Thorough", llm="gpt-4o-mini")
+    analyzer = Agent(role="Analyzer", goal="Extract claims", backstory="Careful", llm="gpt-4o-mini")
+    research = Task(description="Research the input", expected_output="Notes", agent=researcher)
+    extraction = Task(description="Extract claims", expected_output="Claims", agent=analyzer, context=[])
+    implicit = Task(description="Extract claims", expected_output="Claims", agent=analyzer)
+    crew = ConcurrentCrew(agents=[researcher, analyzer], tasks=[research, extraction])
+
+    assert task_dependencies([research, extraction]) == [set(), set()]
+    assert task_dependencies(crew.copy().tasks) == [set(), set()]
+    assert task_dependencies([research, implicit]) == [set(), {0}]
@@ -0,0 +1,57 @@
+import threading
+
+import pytest
+
+pytest.importorskip("crewai_tools")
+
+from .. import search_cache
+from ..benchmarks import stubs
+from ..search_cache import CachedSerperDevTool, SearchCache
+
+
+@pytest.fixture
+def stub():
+    server = stubs.start(web_latency=0.2)
+    yield server
+    server.shutdown()
+
+
+@pytest.fixture
+def tool(stub, tmp_path, monkeypatch):
+    monkeypatch.setenv("SERPER_API_KEY", "test")
+    monkeypatch.setenv("NO_PROXY", "127.0.0.1,localhost")
+    cache = SearchCache(path=tmp_path / "search.sqlite3")
+    monkeypatch.setattr(search_cache, "get_search_cache", lambda: cache)
+    return CachedSerperDevTool(base_url=f"http://127.0.0.1:{stub.server_address[1]}")
+
+
+def test_concurrent_identical_queries_make_one_upstream_call(stub, tool):
+    barrier = threading.Barrier(8)
+    results = []
+
+    def search(query):
+        barrier.wait()
+        results.append(tool._make_api_request(query, "search"))
+
+    threads = [threading.Thread(target=search, args=(query,))
+               for query in ["Eiffel Tower height", "eiffel  tower HEIGHT?"] * 4]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert stub.calls["search"] == 1
+    assert len(results) == 8 and all(result == results[0] for result in results)
+    stats = search_cache.get_search_cache().stats()
+    assert stats["upstream_calls"] == 1
+    assert stats["coalesced"] == 7
+
+
+def test_cache_hit_skips_the_api(stub, tool):
+    first = tool._make_api_request("Eiffel Tower height", "search")
+    second = tool._make_api_request("Eiffel Tower height.", "search")
+
+    assert second == first
+    assert stub.calls["search"] == 1
+    tool._make_api_request("Eiffel Tower weight", "search")
+    assert stub.calls["search"] == 2
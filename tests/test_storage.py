@@ -0,0 +1,39 @@
+import os
+
+from ..storage import SqliteCache
+
+
+def _store(tmp_path, **kwargs):
+    return SqliteCache("test", path=tmp_path / "test.sqlite3", **kwargs)
+
+
+def _summed(store):
+    return store._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+
+def test_overwrite_keeps_byte_total(tmp_path):
+    store = _store(tmp_path, max_bytes=10_000)
+    for i in range(50):
+        store.set("key", f"value {i}")
+    stats = store.stats()
+    assert stats["entries"] == 1
+    assert stats["bytes"] == _summed(store)
+    assert store.get("key").value == "value 49"
+
+
+def test_eviction_stays_within_budget(tmp_path):
+    store = _store(tmp_path, max_bytes=10_000)
+    for i in range(40):
+        store.set(f"key{i}", os.urandom(1000).hex())
+        store.set(f"key{i}", os.urandom(1000).hex())
+    stats = store.stats()
+    assert stats["bytes"] == _summed(store) <= 10_000
+    assert stats["entries"] > 0
+    assert store.get("key39") is not None
+
+
+def test_open_repairs_drifted_total(tmp_path):
+    store = _store(tmp_path)
+    store.set("key", "value")
+    store._conn.execute("UPDATE totals SET bytes = bytes + 5000")
+    assert _store(tmp_path).stats()["bytes"] == _summed(store)
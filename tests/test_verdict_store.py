@@ -0,0 +1,34 @@
+import pytest
+
+from ..verdict_store import claim_fingerprint, normalize_claim
+from ..verification import merge_claims
+
+
+@pytest.mark.parametrize("claim, other", [
+    ("The record low is -40 degrees", "The record low is 40 degrees"),
+    ("Inflation rose 2% last year", "Inflation rose 2 last year"),
+    ("The value x > 5", "The value x < 5"),
+    ("A pint costs €3.50", "A pint costs 350"),
+    ("Growth was 3.5 percent", "Growth was 35 percent"),
+])
+def test_signs_operators_and_units_change_the_fingerprint(claim, other):
+    assert claim_fingerprint(claim) != claim_fingerprint(other)
+
+
+@pytest.mark.parametrize("claim, other", [
+    ("The record low is −40 degrees", "the record low is -40 degrees."),
+    ("Inflation rose 2 % last year!", "Inflation rose 2% last year"),
+    ("The value x>5", "The value x > 5"),
+    ('"Water" boils, at 100 degrees', "water boils at 100 degrees"),
+])
+def test_formatting_does_not_change_the_fingerprint(claim, other):
+    assert claim_fingerprint(claim) == claim_fingerprint(other)
+
+
+def test_word_punctuation_is_dropped():
+    assert normalize_claim("It's a well-known fact: 1,000 people!") == "it s a well known fact 1,000 people"
+
+
+def test_merge_keeps_claims_that_differ_in_sign():
+    merged = merge_claims([[{"text": "It was -40 degrees"}], [{"text": "It was 40 degrees"}, {"text": "it was −40 degrees."}]])
+    assert [claim["text"] for claim in merged] == ["It was -40 degrees", "It was 40 degrees"]
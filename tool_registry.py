@@ -0,0 +1,51 @@
+from functools import lru_cache
+from importlib import import_module
+
+# Tool name -> (module, class) candidates; the first whose setting allows it
+# is used. Modules are only imported when a crew first asks for the tool, so
+# importing the package does not load crewai_tools or the scraping stack.
+TOOLS = {
+    'youtube': [(".transcript_tool", "CachedYouTubeTranscriptTool", (".transcript_store", "TRANSCRIPT_STORE_ENABLED")),
+                (".tools.youtube_tool", "YouTubeTranscriptTool", None)],
+    'web': [(".web_cache", "CachedWebScrapingTool", (".web_cache", "WEB_CACHE_ENABLED")),
+            (".scraping", "PooledWebScrapingTool", None)],
+    'search': [(".search_cache", "CachedSerperDevTool", (".search_cache", "SEARCH_CACHE_ENABLED")),
+               (".search_cache", "PooledSerperDevTool", None)],
+    'evidence': [(".evidence_tool", "EvidenceSearchTool", (".evidence_index", "EVIDENCE_INDEX_ENABLED"))],
+}
+
+
+def _load(module, name):
+    return getattr(import_module(module, __package__), name)
+
+
+@lru_cache(maxsize=None)
+def tool_class(name):
+    """The class registered as ``name``, or None when it is disabled or its dependencies are missing."""
+    if name not in TOOLS:
+        raise KeyError(f"Unknown tool: {name}")
+    for module, cls, setting in TOOLS[name]:
+        try:
+            if setting is None or _load(*setting):
+                return _load(module, cls)
+        except ImportError as e:
+            print(f"{cls} not available, {name} tool disabled: {e}")
+            return None
+    return None
+
+
+def available(name) -> bool:
+    """Whether the tool registered as ``name`` can be built."""
+    return tool_class(name) is not None
+
+
+@lru_cache(maxsize=None)
+def shared_tool(name):
+    """Return the process-wide instance of a tool, building it on first use."""
+    cls = tool_class(name)
+    if cls is None:
+        raise KeyError(f"Tool not available: {name}")
+    if name == 'evidence':
+        # Searches earlier fetches first and falls through to web search itself
+        return cls(fallback=shared_tool('search') if available('search') else None)
+    return cls()
@@ -0,0 +1,50 @@
+import os
+import re
+import time
+from typing import Optional
+
+from .storage import SqliteCache, singleton
+
+TRANSCRIPT_STORE_ENABLED = os.getenv("FACT_CHECKER_TRANSCRIPT_STORE", "1") != "0"
+TRANSCRIPT_TTL_DAYS = float(os.getenv("FACT_CHECKER_TRANSCRIPT_TTL_DAYS", 30))
+TRANSCRIPT_STORE_MAX_MB = float(os.getenv("FACT_CHECKER_TRANSCRIPT_STORE_MB", 128))
+
+YOUTUBE_ID_PATTERN = re.compile(r'(?:youtube\.com/watch\?v=|youtu\.be/)([^&\n?#]+)')
+
+
+def extract_video_id(url: str) -> Optional[str]:
+    """Return the YouTube video ID in ``url``, or None if it is not a video link."""
+    match = YOUTUBE_ID_PATTERN.search(url or "")
+    return match.group(1) if match else None
+
+
+def _key(video_id, language):
+    return f"{video_id}:{language or 'default'}"
+
+
+class TranscriptStore(SqliteCache):
+    """Compressed on-disk transcripts keyed by video ID and language variant."""
+
+    def __init__(self, ttl=TRANSCRIPT_TTL_DAYS * 86400, max_bytes=int(TRANSCRIPT_STORE_MAX_MB * 1024 * 1024), path=None):
+        super().__init__("transcripts", ttl=ttl, max_bytes=max_bytes, path=path)
+
+    def load(self, video_id: str, language: Optional[str] = None) -> Optional[str]:
+        entry = self.get(_key(video_id, language))
+        return entry.value if entry else None
+
+    def save(self, video_id: str, transcript: str, language: Optional[str] = None):
+        self.set(_key(video_id, language), transcript, {"video_id": video_id, "language": language or "default"})
+
+    def __contains__(self, video_id):
+        cutoff = time.time() - self.ttl if self.ttl is not None else 0
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM entries WHERE key = ? AND stored_at >= ?", (_key(video_id, None), cutoff)
+            ).fetchone()
+        return row is not None
+
+
+@singleton
+def get_transcript_store() -> TranscriptStore:
+    """Return the TranscriptStore shared by the whole process."""
+    return TranscriptStore()
@@ -0,0 +1,20 @@
+from .evidence_index import index_source
+from .tools.youtube_tool import YouTubeTranscriptTool
+from .transcript_store import extract_video_id, get_transcript_store
+
+
+class CachedYouTubeTranscriptTool(YouTubeTranscriptTool):
+    """YouTubeTranscriptTool that skips the fetch for videos already in the store."""
+
+    def _run(self, *args, **kwargs) -> str:
+        url = next((a for a in list(args) + list(kwargs.values()) if isinstance(a, str)), "")
+        video_id = extract_video_id(url) or url.strip()
+        language = kwargs.get("language")
+        store = get_transcript_store()
+        transcript = store.load(video_id, language)
+        if transcript is None:
+            transcript = super()._run(*args, **kwargs)
+            if transcript and not str(transcript).lower().startswith("error"):
+                store.save(video_id, str(transcript), language)
+                index_source(f"https://www.youtube.com/watch?v={video_id}", str(transcript))
+        return transcript
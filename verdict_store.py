@@ -0,0 +1,108 @@
+import hashlib
+import json
+import os
+import re
+import time
+import unicodedata
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+from .storage import SqliteCache, singleton
+
+if TYPE_CHECKING:
+    from .verification import VerificationRun
+
+VERDICT_MAX_AGE_HOURS = float(os.getenv("FACT_CHECKER_VERDICT_MAX_AGE_HOURS", 24))
+VERDICT_STORE_MAX_MB = float(os.getenv("FACT_CHECKER_VERDICT_STORE_MB", 128))
+
+
+_DASHES = str.maketrans(dict.fromkeys("\u2010\u2011\u2012\u2013\u2014\u2212", "-"))
+# Signs and decimal separators are part of the number they touch; other characters
+# that are not letters, digits or spaces are looked at one by one
+_PUNCTUATION = re.compile(r"(?P<numeric>[-+](?=\d)|(?<=\d)[.,](?=\d))|[^\w\s]|_")
+_PERCENT_SIGNS = frozenset("%\u2030\u2031")
+
+
+def _replace_punctuation(match) -> str:
+    ch = match.group()
+    if match.group("numeric"):
+        return ch
+    category = unicodedata.category(ch)
+    if category[0] not in "PS":
+        return ch
+    if category in ("Sm", "Sc") or ch in _PERCENT_SIGNS:
+        return f" {ch} "
+    return " "
+
+
+def normalize_claim(text: str) -> str:
+    """Case, whitespace and punctuation-insensitive form of a claim.
+
+    Punctuation between words is dropped, but signs, decimal separators,
+    percent signs, currency symbols and comparison operators change what a
+    claim says and are kept, so "-40" and "40" or "x > 5" and "x < 5" stay
+    apart.
+    """
+    text = unicodedata.normalize("NFKC", text or "").casefold().translate(_DASHES)
+    return " ".join(_PUNCTUATION.sub(_replace_punctuation, text).split())
+
+
+def claim_fingerprint(text: str) -> str:
+    return hashlib.sha256(normalize_claim(text).encode("utf-8")).hexdigest()
+
+
+@dataclass
+class StoredVerdict:
+    """A previously produced verification run served from the VerdictStore."""
+    claim: str
+    run: "VerificationRun"
+    stored_at: float
+    similarity: float = 1.0
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.stored_at
+
+    @property
+    def verdict(self):
+        return self.run.verdict
+
+    @property
+    def report(self) -> str:
+        return self.run.report
+
+    def __str__(self):
+        return self.report
+
+
+class VerdictStore(SqliteCache):
+    """Structured verification runs of claims keyed by claim fingerprint.
+
+    The store keeps entries until they are evicted for space; freshness is
+    decided per lookup so callers can ask for a stricter ``max_age``. Plain
+    text reports stored by earlier versions count as misses.
+    """
+
+    def __init__(self, max_age=VERDICT_MAX_AGE_HOURS * 3600, max_bytes=int(VERDICT_STORE_MAX_MB * 1024 * 1024), path=None):
+        super().__init__("verdicts", ttl=None, max_bytes=max_bytes, path=path)
+        self.max_age = max_age
+
+    def lookup(self, claim: str, max_age: Optional[float] = None) -> Optional[StoredVerdict]:
+        """Return the stored run for ``claim`` if it is younger than ``max_age`` seconds."""
+        from .verification import VerificationRun
+
+        max_age = self.max_age if max_age is None else max_age
+        entry = self.get(claim_fingerprint(claim))
+        if entry is None or not entry.meta.get("structured") or time.time() - entry.stored_at > max_age:
+            return None
+        return StoredVerdict(claim=entry.meta.get("claim", claim), run=VerificationRun.from_dict(json.loads(entry.value)),
+                             stored_at=entry.stored_at)
+
+    def remember(self, claim: str, run: "VerificationRun"):
+        self.set(claim_fingerprint(claim), json.dumps(run.to_dict()), {"claim": claim, "structured": True})
+
+
+@singleton
+def get_verdict_store() -> VerdictStore:
+    """Return the VerdictStore shared by the whole process."""
+    return VerdictStore()
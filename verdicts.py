@@ -0,0 +1,87 @@
+from collections import Counter
+from typing import List, Literal, NamedTuple, Optional
+
+from pydantic import BaseModel, Field, field_validator
+
+VERDICTS = ("TRUE", "FALSE", "MISLEADING", "UNCERTAIN", "UNVERIFIABLE")
+
+VerdictLabel = Literal["TRUE", "FALSE", "MISLEADING", "UNCERTAIN", "UNVERIFIABLE"]
+
+
+class Evidence(BaseModel):
+    """A source consulted while verifying a claim."""
+    source: str = Field(description="Name of the publisher, organisation or site")
+    url: Optional[str] = Field(default=None, description="Link to the source, if any")
+    stance: Literal["supports", "contradicts", "neutral"] = Field(
+        default="neutral", description="Whether the source supports or contradicts the claim"
+    )
+    summary: str = Field(default="", description="What the source says about the claim, in one or two sentences")
+
+    @field_validator("stance", mode="before")
+    @classmethod
+    def _lower(cls, value):
+        return value.strip().lower() if isinstance(value, str) else value
+
+
+class ClaimVerdict(BaseModel):
+    """Schema-validated verification result for one claim."""
+    claim_id: str = Field(description="ID of the claim being verified")
+    claim: str = Field(description="The claim text")
+    verdict: VerdictLabel = Field(description="One of TRUE, FALSE, MISLEADING, UNCERTAIN or UNVERIFIABLE")
+    confidence: float = Field(ge=0.0, le=1.0, description="Confidence in the verdict between 0 and 1")
+    evidence: List[Evidence] = Field(default_factory=list, description="Sources used for the verdict")
+    explanation: str = Field(default="", description="Short reasoning behind the verdict")
+
+    @field_validator("verdict", mode="before")
+    @classmethod
+    def _upper(cls, value):
+        return value.strip().upper().replace(" ", "_") if isinstance(value, str) else value
+
+    @field_validator("confidence", mode="before")
+    @classmethod
+    def _percent(cls, value):
+        if isinstance(value, (int, float)) and 1 < value <= 100:
+            return value / 100
+        return value
+
+
+class VerificationReport(BaseModel):
+    """Output of the full crew's verification task."""
+    claims: List[ClaimVerdict] = Field(description="A verdict for every extracted claim")
+    summary: str = Field(default="", description="Overall assessment of the content")
+
+
+class OverallVerdict(NamedTuple):
+    verdict: str
+    confidence: float
+    counts: dict
+
+
+def overall_verdict(verdicts) -> Optional[OverallVerdict]:
+    """Aggregate per-claim verdicts in a single pass.
+
+    Content is TRUE or FALSE only when every claim is; otherwise any false or
+    misleading claim makes it MISLEADING. Content with no decisive verdict is
+    UNCERTAIN, or UNVERIFIABLE when nothing could be checked at all, and true
+    claims alongside undecided ones stay UNCERTAIN.
+    """
+    counts = Counter()
+    confidence = 0.0
+    for verdict in verdicts:
+        counts[verdict.verdict] += 1
+        confidence += verdict.confidence
+    total = sum(counts.values())
+    if not total:
+        return None
+
+    if counts["TRUE"] == total:
+        label = "TRUE"
+    elif counts["FALSE"] == total:
+        label = "FALSE"
+    elif counts["FALSE"] or counts["MISLEADING"]:
+        label = "MISLEADING"
+    elif counts["UNVERIFIABLE"] == total:
+        label = "UNVERIFIABLE"
+    else:
+        label = "UNCERTAIN"
+    return OverallVerdict(label, confidence / total, {v: counts[v] for v in VERDICTS if counts[v]})
@@ -0,0 +1,146 @@
+import json
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Callable, Optional
+
+from .verdict_store import claim_fingerprint
+from .verdicts import ClaimVerdict, OverallVerdict, overall_verdict
+
+
+@dataclass
+class ClaimResult:
+    """Outcome of verifying a single extracted claim."""
+    claim: dict
+    verdict: Optional[ClaimVerdict] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class VerificationRun:
+    """Merged outcome of a fanned-out verification stage."""
+    analysis: str
+    results: list = field(default_factory=list)
+
+    @cached_property
+    def verdict(self) -> Optional[OverallVerdict]:
+        """Aggregate verdict over the successfully verified claims."""
+        return overall_verdict(r.verdict for r in self.results if r.verdict is not None)
+
+    @property
+    def report(self) -> str:
+        return merge_report(self.analysis, self.results, self.verdict)
+
+    def to_dict(self) -> dict:
+        return {
+            "analysis": self.analysis,
+            "results": [
+                {"claim": r.claim, "verdict": r.verdict.model_dump() if r.verdict else None, "error": r.error}
+                for r in self.results
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "VerificationRun":
+        return cls(data["analysis"], [
+            ClaimResult(r["claim"], ClaimVerdict.model_validate(r["verdict"]) if r["verdict"] else None, r["error"])
+            for r in data["results"]
+        ])
+
+    def __str__(self):
+        return self.report
+
+
+def parse_claims(text: str) -> list:
+    """Extract the ``claims[]`` list from the content analyzer's output.
+
+    The analyzer is asked for the JSON format documented in the README, but the
+    JSON is often wrapped in prose or a fenced code block, so every ``{`` is tried
+    as the start of a JSON object until one with a ``claims`` list is found.
+    Returns an empty list when no claim list is present.
+    """
+    decoder = json.JSONDecoder()
+    start = text.find("{")
+    while start != -1:
+        try:
+            data, _ = decoder.raw_decode(text, start)
+        except json.JSONDecodeError:
+            data = None
+        if isinstance(data, dict) and isinstance(data.get("claims"), list):
+            claims = []
+            for i, claim in enumerate(data["claims"], 1):
+                if isinstance(claim, str):
+                    claim = {"text": claim}
+                if not isinstance(claim, dict) or not claim.get("text"):
+                    continue
+                claim.setdefault("id", f"claim_{i:03d}")
+                claims.append(claim)
+            return claims
+        start = text.find("{", start + 1)
+    return []
+
+
+def merge_claims(claim_lists) -> list:
+    """Concatenate claim lists, dropping repeated claims and renumbering ids."""
+    merged = []
+    seen = set()
+    for claims in claim_lists:
+        for claim in claims:
+            fingerprint = claim_fingerprint(claim["text"])
+            if fingerprint in seen:
+                continue
+            seen.add(fingerprint)
+            merged.append(dict(claim, id=f"claim_{len(merged) + 1:03d}"))
+    return merged
+
+
+def verify_claims(claims: list, verify: Callable[[dict], ClaimVerdict], max_workers: int = 8) -> list:
+    """Run ``verify`` for every claim on a bounded thread pool.
+
+    Results come back in claim order. A failing claim is recorded on its
+    ClaimResult instead of aborting the other verifications. Each call runs
+    in a copy of the caller's context, so progress listeners carry over.
+    """
+    def run(claim):
+        try:
+            return ClaimResult(claim=claim, verdict=verify(claim))
+        except Exception as e:
+            return ClaimResult(claim=claim, error=str(e))
+
+    if not claims:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(claims)))) as pool:
+        futures = [pool.submit(contextvars.copy_context().run, run, claim) for claim in claims]
+        return [f.result() for f in futures]
+
+
+def verdict_markdown(verdict: ClaimVerdict) -> str:
+    """Markdown for one claim verdict: label, confidence, reasoning and sources."""
+    lines = [f"**Verdict:** {verdict.verdict} (confidence {verdict.confidence:.0%})"]
+    if verdict.explanation:
+        lines += ["", verdict.explanation.strip()]
+    if verdict.evidence:
+        lines += ["", "**Evidence:**"]
+        for item in verdict.evidence:
+            source = f"[{item.source}]({item.url})" if item.url else item.source
+            lines.append(f"- {source} ({item.stance}){': ' + item.summary if item.summary else ''}")
+    return "\n".join(lines)
+
+
+def merge_report(analysis: str, results: list, overall: Optional[OverallVerdict] = None) -> str:
+    """Combine per-claim verdicts into one markdown report."""
+    sections = []
+    if overall is not None:
+        sections += [f"## Overall Verdict: {overall.verdict} (confidence {overall.confidence:.0%})", ""]
+    sections += ["## Claim Verification", ""]
+    for result in results:
+        claim = result.claim
+        sections.append(f"### {claim['id']}: {claim['text']}")
+        if result.error:
+            sections.append(f"Verification failed: {result.error}")
+        else:
+            sections.append(verdict_markdown(result.verdict))
+        sections.append("")
+    sections += ["## Content Analysis", "", analysis.strip()]
+    return "\n".join(sections)
@@ -0,0 +1,100 @@
+import hashlib
+import os
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from .evidence_index import index_source
+from .http_client import FETCH_ERRORS, get_http_client
+from .scraping import PooledWebScrapingTool, ScrapeError, page_text
+from .storage import SqliteCache, singleton
+
+WEB_CACHE_ENABLED = os.getenv("FACT_CHECKER_WEB_CACHE", "1") != "0"
+WEB_CACHE_TTL = float(os.getenv("FACT_CHECKER_WEB_CACHE_TTL", 6 * 3600))
+WEB_CACHE_MAX_MB = float(os.getenv("FACT_CHECKER_WEB_CACHE_MB", 256))
+
+_TRACKING_PARAMS = ("utm_", "fbclid", "gclid", "mc_cid", "mc_eid", "ref_src")
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_url(url: str) -> str:
+    """Canonical form of ``url`` used as the cache identity.
+
+    Lowercases scheme and host, drops default ports, fragments and tracking
+    parameters, and sorts the remaining query string.
+    """
+    parts = urlsplit(url.strip())
+    scheme = (parts.scheme or "http").lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith(_TRACKING_PARAMS)
+    )
+    return urlunsplit((scheme, host, parts.path or "/", urlencode(query), ""))
+
+
+def url_key(url: str) -> str:
+    return hashlib.sha256(normalize_url(url).encode("utf-8")).hexdigest()
+
+
+class WebCache(SqliteCache):
+    """On-disk cache of cleaned page text keyed by normalized URL.
+
+    Fresh entries are served without touching the network. Expired entries
+    that carry an ETag or Last-Modified are revalidated with a conditional
+    GET and kept on a 304; everything else is fetched again. Validators come
+    from the same response as the page, so a miss costs one request.
+    """
+
+    def __init__(self, ttl=WEB_CACHE_TTL, max_bytes=int(WEB_CACHE_MAX_MB * 1024 * 1024), path=None):
+        super().__init__("web", ttl=ttl, max_bytes=max_bytes, path=path)
+        self.revalidations = 0
+
+    def fetch(self, url: str, extract=page_text) -> str:
+        """Return the cleaned text of ``url``, GETting it and calling ``extract(response)`` on a miss."""
+        key = url_key(url)
+        entry = self.get(key, allow_expired=True)
+        if entry and not entry.expired:
+            return entry.value
+        headers = {}
+        if entry:
+            if entry.meta.get("etag"):
+                headers["If-None-Match"] = entry.meta["etag"]
+            if entry.meta.get("last_modified"):
+                headers["If-Modified-Since"] = entry.meta["last_modified"]
+
+        response = get_http_client().get(url, headers=headers, respect_robots=True)
+        if entry and headers and response.status_code == 304:
+            self.touch(key)
+            self.revalidations += 1
+            return entry.value
+        text = extract(response)
+        self.set(key, text, {
+            "url": normalize_url(url),
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        })
+        return text
+
+    def stats(self) -> dict:
+        stats = super().stats()
+        stats["revalidations"] = self.revalidations
+        return stats
+
+
+@singleton
+def get_web_cache() -> WebCache:
+    """Return the WebCache shared by the whole process."""
+    return WebCache()
+
+
+class CachedWebScrapingTool(PooledWebScrapingTool):
+    """Pooled WebScrapingTool that serves repeat URLs from the shared WebCache."""
+
+    def _run(self, url: str, **kwargs) -> str:
+        try:
+            text = get_web_cache().fetch(url)
+        except (ScrapeError, *FETCH_ERRORS) as e:
+            return f"Error scraping {url}: {e}"
+        index_source(normalize_url(url), text)
+        return text